@@ -0,0 +1,100 @@
+"""add normalized engine compatibility architecture/endpoint lookup tables
+
+Revision ID: j5k6l7m8n9o0
+Revises: i4j5k6l7m8n9
+Create Date: 2026-10-17 00:00:00.000000
+
+Compatibility checks used to match a model architecture with
+``lower(jsonb_extract_path_text(architectures, 'architectures')) LIKE '%"arch"%'``
+(and the same over ``supported_endpoints``), which cannot use an index and
+serializes every engine_compatibility row on each call. This migration adds
+``engine_compatibility_architecture`` and ``engine_compatibility_endpoint``
+keyed on the lower-cased value so the lookup is a primary-key scan, and
+backfills them from the existing JSONB columns.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'j5k6l7m8n9o0'
+down_revision: Union[str, None] = 'i4j5k6l7m8n9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'engine_compatibility_architecture',
+        sa.Column('architecture', sa.String(), nullable=False),
+        sa.Column('engine_version_id', postgresql.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['engine_version_id'], ['engine_compatibility.engine_version_id'], ondelete='CASCADE'
+        ),
+        sa.PrimaryKeyConstraint('architecture', 'engine_version_id'),
+    )
+    op.create_index(
+        op.f('ix_engine_compatibility_architecture_engine_version_id'),
+        'engine_compatibility_architecture',
+        ['engine_version_id'],
+        unique=False,
+    )
+
+    op.create_table(
+        'engine_compatibility_endpoint',
+        sa.Column('endpoint', sa.String(), nullable=False),
+        sa.Column('engine_version_id', postgresql.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['engine_version_id'], ['engine_compatibility.engine_version_id'], ondelete='CASCADE'
+        ),
+        sa.PrimaryKeyConstraint('endpoint', 'engine_version_id'),
+    )
+    op.create_index(
+        op.f('ix_engine_compatibility_endpoint_engine_version_id'),
+        'engine_compatibility_endpoint',
+        ['engine_version_id'],
+        unique=False,
+    )
+
+    # Backfill from the JSONB payloads
+    op.execute(
+        """
+        INSERT INTO engine_compatibility_architecture (architecture, engine_version_id)
+        SELECT DISTINCT lower(trim(arch.value)), ec.engine_version_id
+        FROM engine_compatibility ec
+        CROSS JOIN LATERAL jsonb_array_elements_text(
+            CASE WHEN jsonb_typeof(ec.architectures -> 'architectures') = 'array'
+                 THEN ec.architectures -> 'architectures' ELSE '[]'::jsonb END
+        ) AS arch(value)
+        WHERE trim(arch.value) <> ''
+        ON CONFLICT DO NOTHING
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO engine_compatibility_endpoint (endpoint, engine_version_id)
+        SELECT DISTINCT lower(trim(ep.value)), ec.engine_version_id
+        FROM engine_compatibility ec
+        CROSS JOIN LATERAL jsonb_array_elements_text(
+            CASE WHEN jsonb_typeof(ec.supported_endpoints -> 'endpoints') = 'array'
+                 THEN ec.supported_endpoints -> 'endpoints' ELSE '[]'::jsonb END
+        ) AS ep(value)
+        WHERE trim(ep.value) <> ''
+        ON CONFLICT DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f('ix_engine_compatibility_endpoint_engine_version_id'), table_name='engine_compatibility_endpoint'
+    )
+    op.drop_table('engine_compatibility_endpoint')
+    op.drop_index(
+        op.f('ix_engine_compatibility_architecture_engine_version_id'),
+        table_name='engine_compatibility_architecture',
+    )
+    op.drop_table('engine_compatibility_architecture')
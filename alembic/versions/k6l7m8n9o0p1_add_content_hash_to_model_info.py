@@ -0,0 +1,31 @@
+"""add content_hash to model_info
+
+Revision ID: k6l7m8n9o0p1
+Revises: j5k6l7m8n9o0
+Create Date: 2026-10-17 00:00:00.000000
+
+Stores a SHA-256 of the normalized model_info payload, computed when the
+TensorZero catalog is parsed. Catalog syncs compare it with the incoming
+hash and skip rows that did not change, and clients can use it for
+conditional fetches. Existing rows start with a NULL hash and are rewritten
+once by the next sync.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'k6l7m8n9o0p1'
+down_revision: Union[str, None] = 'j5k6l7m8n9o0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('model_info', sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('model_info', 'content_hash')
@@ -0,0 +1,95 @@
+"""add catalog change log fed by row triggers
+
+Revision ID: l7m8n9o0p1q2
+Revises: k6l7m8n9o0p1
+Create Date: 2026-10-17 00:00:00.000000
+
+Runtimes used to re-page the full model, engine and license listings on
+every sync. This migration adds ``catalog_change``, an append-only log of
+row inserts, updates and deletes, and installs ``record_catalog_change``
+as an AFTER ROW trigger on every catalog table so that all write paths
+(CRUD, seeders and set-based bulk statements) are captured in the same
+transaction as the write. Updates that only touch ``modified_at`` are not
+recorded. Each entry carries the transaction ID so readers can order by
+(txid, id) and only consume settled transactions.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'l7m8n9o0p1q2'
+down_revision: Union[str, None] = 'k6l7m8n9o0p1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CATALOG_TABLES = (
+    'model_info',
+    'provider',
+    'license',
+    'engine_version',
+    'engine_compatibility',
+    'engine_parser_rule',
+    'guardrail_probes',
+    'guardrail_rules',
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'catalog_change',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('txid', sa.BigInteger(), nullable=False),
+        sa.Column('entity_type', sa.String(), nullable=False),
+        sa.Column('entity_id', postgresql.UUID(), nullable=False),
+        sa.Column('operation', sa.String(), nullable=False),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('changed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_catalog_change_txid_id', 'catalog_change', ['txid', 'id'], unique=False)
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION record_catalog_change() RETURNS trigger AS $$
+        DECLARE
+            new_row jsonb;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                INSERT INTO catalog_change (txid, entity_type, entity_id, operation, payload)
+                VALUES (txid_current(), TG_TABLE_NAME, OLD.id, 'delete', NULL);
+                RETURN OLD;
+            END IF;
+
+            new_row := to_jsonb(NEW);
+            IF TG_OP = 'UPDATE' AND (to_jsonb(OLD) - 'modified_at') = (new_row - 'modified_at') THEN
+                RETURN NEW;
+            END IF;
+
+            INSERT INTO catalog_change (txid, entity_type, entity_id, operation, payload)
+            VALUES (txid_current(), TG_TABLE_NAME, NEW.id, lower(TG_OP), new_row);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    for table in CATALOG_TABLES:
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_catalog_change
+            AFTER INSERT OR UPDATE OR DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION record_catalog_change();
+            """
+        )
+
+
+def downgrade() -> None:
+    for table in CATALOG_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_catalog_change ON {table};")
+    op.execute("DROP FUNCTION IF EXISTS record_catalog_change();")
+    op.drop_index('ix_catalog_change_txid_id', table_name='catalog_change')
+    op.drop_table('catalog_change')
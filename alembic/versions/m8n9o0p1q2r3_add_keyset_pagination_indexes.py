@@ -0,0 +1,33 @@
+"""add keyset pagination indexes
+
+Revision ID: m8n9o0p1q2r3
+Revises: l7m8n9o0p1q2
+Create Date: 2026-10-17 00:00:00.000000
+
+/model/ and /model/architectures page newest first on (created_at, id) and
+continue from a cursor with a row-value comparison on the same pair. These
+indexes let Postgres answer every page, at any depth, with a backward index
+range scan bounded by the page size.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'm8n9o0p1q2r3'
+down_revision: Union[str, None] = 'l7m8n9o0p1q2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_model_info_created_at_id', 'model_info', ['created_at', 'id'], unique=False)
+    op.create_index(
+        'ix_model_architecture_class_created_at_id', 'model_architecture_class', ['created_at', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_model_architecture_class_created_at_id', table_name='model_architecture_class')
+    op.drop_index('ix_model_info_created_at_id', table_name='model_info')
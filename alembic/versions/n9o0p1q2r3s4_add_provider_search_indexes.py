@@ -0,0 +1,50 @@
+"""add provider trigram search and model_info provider_id indexes
+
+Revision ID: n9o0p1q2r3s4
+Revises: m8n9o0p1q2r3
+Create Date: 2026-10-17 00:00:00.000000
+
+GET /providers/ pages in SQL and computes each provider's model count with a
+correlated COUNT over model_info, which needs an index on
+model_info.provider_id to stay a per-provider index scan. The substring
+search on provider name and provider_type (ILIKE '%term%') is served by
+pg_trgm GIN indexes instead of a sequential scan.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'n9o0p1q2r3s4'
+down_revision: Union[str, None] = 'm8n9o0p1q2r3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index('ix_model_info_provider_id', 'model_info', ['provider_id'], unique=False)
+    op.create_index(
+        'ix_provider_name_trgm',
+        'provider',
+        ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_provider_provider_type_trgm',
+        'provider',
+        ['provider_type'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'provider_type': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    # pg_trgm is left installed, other objects may depend on it
+    op.drop_index('ix_provider_provider_type_trgm', table_name='provider')
+    op.drop_index('ix_provider_name_trgm', table_name='provider')
+    op.drop_index('ix_model_info_provider_id', table_name='model_info')
@@ -0,0 +1,47 @@
+"""add license trigram search indexes
+
+Revision ID: o0p1q2r3s4t5
+Revises: n9o0p1q2r3s4
+Create Date: 2026-10-17 00:00:00.000000
+
+License lookups by key now go through the existing unique constraint on
+license.key (also used as the ON CONFLICT arbiter when creating licenses)
+instead of loading the whole table. The name/key substring search of
+GET /licenses/ moves from Python into an ILIKE filter, served by these
+pg_trgm GIN indexes.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'o0p1q2r3s4t5'
+down_revision: Union[str, None] = 'n9o0p1q2r3s4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_license_key_trgm',
+        'license',
+        ['key'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'key': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_license_name_trgm',
+        'license',
+        ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_license_name_trgm', table_name='license')
+    op.drop_index('ix_license_key_trgm', table_name='license')
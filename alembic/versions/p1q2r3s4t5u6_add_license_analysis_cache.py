@@ -0,0 +1,41 @@
+"""add license_analysis cache table
+
+Revision ID: p1q2r3s4t5u6
+Revises: o0p1q2r3s4t5
+Create Date: 2026-10-17 00:00:00.000000
+
+Persists the parsed LLM answer of every license analysis keyed by the
+SHA-256 of the prompt version, the LLM model and the whitespace-normalized
+license text. /licenses/extract and /licenses/extract-and-create look the
+key up before calling the LLM, so identical licenses (Apache-2.0, MIT,
+Llama, ...) are analysed once across restarts and replicas.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'p1q2r3s4t5u6'
+down_revision: Union[str, None] = 'o0p1q2r3s4t5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'license_analysis',
+        sa.Column('cache_key', sa.String(length=64), nullable=False),
+        sa.Column('prompt_version', sa.String(), nullable=False),
+        sa.Column('llm_model', sa.String(), nullable=False),
+        sa.Column('result', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('last_used_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('cache_key'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('license_analysis')
@@ -0,0 +1,31 @@
+"""add token_version to users
+
+Revision ID: q2r3s4t5u6v7
+Revises: p1q2r3s4t5u6
+Create Date: 2026-10-17 00:00:00.000000
+
+Access and refresh tokens carry the user's token_version in a "ver"
+claim. Changing the password, deactivating the user or changing its
+active/admin flags increments the column, so every token issued before
+is rejected without a per-request user lookup. Existing tokens have no
+claim and are treated as version 0, which matches the server default.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'q2r3s4t5u6v7'
+down_revision: Union[str, None] = 'p1q2r3s4t5u6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'token_version')
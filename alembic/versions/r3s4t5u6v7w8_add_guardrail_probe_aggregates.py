@@ -0,0 +1,137 @@
+"""add precomputed rule aggregates to guardrail_probes
+
+Revision ID: r3s4t5u6v7w8
+Revises: q2r3s4t5u6v7
+Create Date: 2026-10-17 00:00:00.000000
+
+The guard, modality and scanner types, examples and rule count of a probe
+used to be computed from its rules on every read, which loaded the full
+rule list of each probe on a page. They are now stored on
+``guardrail_probes`` and maintained by ``refresh_guardrail_probe_aggregates``,
+which statement-level triggers on ``guardrail_rules`` call with the probes
+touched by each insert, update or delete, so the seeder, CRUD upserts and
+bulk statements all keep them current in the same transaction. Values are
+sorted by code point (``COLLATE "C"``), matching the previous Python
+``sorted()`` output, and probes whose aggregates did not change are not
+rewritten.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'r3s4t5u6v7w8'
+down_revision: Union[str, None] = 'q2r3s4t5u6v7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ARRAY_COLUMNS = ('guard_types', 'modality_types', 'scanner_types', 'examples')
+
+# Transition table referenced by each trigger and the probe ids it passes on
+TRIGGERS = (
+    ('insert', 'INSERT', 'NEW TABLE AS new_rules'),
+    ('update', 'UPDATE', 'OLD TABLE AS old_rules NEW TABLE AS new_rules'),
+    ('delete', 'DELETE', 'OLD TABLE AS old_rules'),
+)
+
+
+def upgrade() -> None:
+    for column in ARRAY_COLUMNS:
+        op.add_column(
+            'guardrail_probes',
+            sa.Column(column, postgresql.ARRAY(sa.String()), server_default='{}', nullable=False),
+        )
+    op.add_column('guardrail_probes', sa.Column('rules_count', sa.Integer(), server_default='0', nullable=False))
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION refresh_guardrail_probe_aggregates(probe_ids uuid[]) RETURNS void AS $$
+            UPDATE guardrail_probes AS p
+            SET guard_types = agg.guard_types,
+                modality_types = agg.modality_types,
+                scanner_types = agg.scanner_types,
+                examples = agg.examples,
+                rules_count = agg.rules_count
+            FROM (
+                SELECT
+                    probe.id,
+                    ARRAY(
+                        SELECT DISTINCT (t COLLATE "C") AS v
+                        FROM guardrail_rules AS r, unnest(r.guard_types) AS t
+                        WHERE r.probe_id = probe.id AND t IS NOT NULL
+                        ORDER BY v
+                    ) AS guard_types,
+                    ARRAY(
+                        SELECT DISTINCT (t COLLATE "C") AS v
+                        FROM guardrail_rules AS r, unnest(r.modality_types) AS t
+                        WHERE r.probe_id = probe.id AND t IS NOT NULL
+                        ORDER BY v
+                    ) AS modality_types,
+                    ARRAY(
+                        SELECT DISTINCT (r.scanner_type::text COLLATE "C") AS v
+                        FROM guardrail_rules AS r
+                        WHERE r.probe_id = probe.id AND r.scanner_type IS NOT NULL
+                        ORDER BY v
+                    ) AS scanner_types,
+                    ARRAY(
+                        SELECT DISTINCT (e COLLATE "C") AS v
+                        FROM guardrail_rules AS r, unnest(r.examples) AS e
+                        WHERE r.probe_id = probe.id AND e IS NOT NULL
+                        ORDER BY v
+                        LIMIT 10
+                    ) AS examples,
+                    (SELECT count(*) FROM guardrail_rules AS r WHERE r.probe_id = probe.id)::integer AS rules_count
+                FROM guardrail_probes AS probe
+                WHERE probe.id = ANY(probe_ids)
+            ) AS agg
+            WHERE p.id = agg.id
+              AND (p.guard_types, p.modality_types, p.scanner_types, p.examples, p.rules_count)
+                  IS DISTINCT FROM (agg.guard_types, agg.modality_types, agg.scanner_types, agg.examples, agg.rules_count);
+        $$ LANGUAGE sql;
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION refresh_guardrail_probe_aggregates_from_rules() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                PERFORM refresh_guardrail_probe_aggregates(ARRAY(SELECT DISTINCT probe_id FROM new_rules));
+            ELSIF TG_OP = 'UPDATE' THEN
+                PERFORM refresh_guardrail_probe_aggregates(
+                    ARRAY(SELECT probe_id FROM new_rules UNION SELECT probe_id FROM old_rules)
+                );
+            ELSE
+                PERFORM refresh_guardrail_probe_aggregates(ARRAY(SELECT DISTINCT probe_id FROM old_rules));
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    for name, event, referencing in TRIGGERS:
+        op.execute(
+            f"""
+            CREATE TRIGGER guardrail_rules_probe_aggregates_{name}
+            AFTER {event} ON guardrail_rules
+            REFERENCING {referencing}
+            FOR EACH STATEMENT EXECUTE FUNCTION refresh_guardrail_probe_aggregates_from_rules();
+            """
+        )
+
+    # Backfill the existing probes
+    op.execute("SELECT refresh_guardrail_probe_aggregates(ARRAY(SELECT id FROM guardrail_probes));")
+
+
+def downgrade() -> None:
+    for name, _, _ in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS guardrail_rules_probe_aggregates_{name} ON guardrail_rules;")
+    op.execute("DROP FUNCTION IF EXISTS refresh_guardrail_probe_aggregates_from_rules();")
+    op.execute("DROP FUNCTION IF EXISTS refresh_guardrail_probe_aggregates(uuid[]);")
+    op.drop_column('guardrail_probes', 'rules_count')
+    for column in reversed(ARRAY_COLUMNS):
+        op.drop_column('guardrail_probes', column)
@@ -0,0 +1,34 @@
+"""add guardrail rule pagination index
+
+Revision ID: s4t5u6v7w8x9
+Revises: r3s4t5u6v7w8
+Create Date: 2026-10-17 00:00:00.000000
+
+/guardrail/probes/{probe_id}/rules returns the rules of a probe ordered by
+(name, id) and continues from a cursor with a row-value comparison on the
+same pair. The matching rules are counted and the page is cut over their
+(id, name) pairs, which the (probe_id, name, id) index holds for the
+probe's entries alone, so only the rules of the page are read from the
+table. The count still visits every entry of the probe on each page, and
+the scanner type and modality filters read the matching rule rows.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 's4t5u6v7w8x9'
+down_revision: Union[str, None] = 'r3s4t5u6v7w8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_guardrail_rules_probe_id_name_id', 'guardrail_rules', ['probe_id', 'name', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_guardrail_rules_probe_id_name_id', table_name='guardrail_rules')
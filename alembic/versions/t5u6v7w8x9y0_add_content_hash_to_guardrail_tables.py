@@ -0,0 +1,33 @@
+"""add content_hash to guardrail_probes and guardrail_rules
+
+Revision ID: t5u6v7w8x9y0
+Revises: s4t5u6v7w8x9
+Create Date: 2026-10-17 00:00:00.000000
+
+Stores a SHA-256 of the normalized probe and rule payloads, computed by the
+guardrails seeder when it parses guardrails.json. The seeder compares it
+with the incoming hash and skips rows that did not change, so restarting
+with an unchanged data file writes no guardrail rows. Existing rows start
+with a NULL hash and are rewritten once by the next seed.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 't5u6v7w8x9y0'
+down_revision: Union[str, None] = 's4t5u6v7w8x9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('guardrail_probes', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.add_column('guardrail_rules', sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('guardrail_rules', 'content_hash')
+    op.drop_column('guardrail_probes', 'content_hash')
@@ -0,0 +1,36 @@
+"""add seeder_run table
+
+Revision ID: u6v7w8x9y0z1
+Revises: t5u6v7w8x9y0
+Create Date: 2026-10-17 00:00:00.000000
+
+Records the last successful run of each startup seeder with a fingerprint
+of the data files it read. On startup a seeder whose fingerprint matches
+the recorded one is skipped, so a pod restart with unchanged seed data does
+not re-process it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'u6v7w8x9y0z1'
+down_revision: Union[str, None] = 't5u6v7w8x9y0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'seeder_run',
+        sa.Column('name', sa.String(length=64), nullable=False),
+        sa.Column('fingerprint', sa.String(length=64), nullable=True),
+        sa.Column('completed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('name'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('seeder_run')
@@ -16,10 +16,14 @@
 
 """CRUD operations for User model."""
 
-from typing import Optional
+from typing import Any, Dict, Optional, Sequence, Tuple
 from uuid import UUID
 
 from budmicroframe.shared.psql_service import CRUDMixin
+from sqlalchemy import case, func, or_, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
 
 from .models import User
 
@@ -73,8 +77,68 @@ class UserCRUD(CRUDMixin[User, None, None]):
         result = self.fetch_one(conditions={"id": str(user_id)})
         return result
 
+    def get_principal(
+        self, user_id: UUID, session: Optional[Session] = None
+    ) -> Optional[Row[Tuple[UUID, str, bool, bool, int]]]:
+        """Get the columns the auth dependencies need for a user.
+
+        Args:
+            user_id: The user ID to search for
+            session: Optional database session
+
+        Returns:
+            Row of (id, username, is_active, is_admin, token_version) if found, None otherwise
+        """
+        _session = session or self.get_session()
+        try:
+            users = User.__table__.c
+            stmt = select(users.id, users.username, users.is_active, users.is_admin, users.token_version).where(
+                users.id == user_id
+            )
+            return _session.execute(stmt).first()
+        finally:
+            self.cleanup_session(_session if session is None else None)
+
+    def _update_values(
+        self,
+        user_id: UUID,
+        values: Dict[str, Any],
+        revoke_tokens: bool,
+        session: Optional[Session] = None,
+        revoke_on_change: Sequence[str] = (),
+    ) -> Optional[UUID]:
+        """Update columns of a user, optionally incrementing its token version in the same statement.
+
+        With ``revoke_on_change`` the token version is only incremented when one of those columns gets a
+        different value; the comparison runs against the row being updated, so it is race free.
+
+        Returns:
+            The ID of the updated user, or None if it does not exist
+        """
+        if revoke_tokens:
+            values = {**values, "token_version": User.token_version + 1}
+        elif revoke_on_change:
+            changed = or_(*(getattr(User, column).is_distinct_from(values[column]) for column in revoke_on_change))
+            values = {**values, "token_version": User.token_version + case((changed, 1), else_=0)}
+        _session = session or self.get_session()
+        try:
+            stmt = (
+                update(User)
+                .where(User.__table__.c.id == user_id)
+                .values(**values, modified_at=func.now())
+                .returning(User.__table__.c.id)
+            )
+            updated_id = _session.execute(stmt).scalar_one_or_none()
+            _session.commit()
+            return updated_id
+        except SQLAlchemyError:
+            _session.rollback()
+            raise
+        finally:
+            self.cleanup_session(_session if session is None else None)
+
     def update_password(self, user_id: UUID, hashed_password: str) -> bool:
-        """Update a user's password.
+        """Update a user's password and revoke the tokens issued before.
 
         Args:
             user_id: The user ID
@@ -83,24 +147,40 @@ class UserCRUD(CRUDMixin[User, None, None]):
         Returns:
             True if update was successful, False otherwise
         """
-        updated = self.update(conditions={"id": str(user_id)}, data={"hashed_password": hashed_password})
-        return updated is not None
+        return self._update_values(user_id, {"hashed_password": hashed_password}, revoke_tokens=True) is not None
+
+    def replace_password_hash(self, user_id: UUID, hashed_password: str) -> bool:
+        """Store a new hash of the unchanged password, e.g. after a work factor change; tokens stay valid.
+
+        Args:
+            user_id: The user ID
+            hashed_password: The new hash of the same password
+
+        Returns:
+            True if update was successful, False otherwise
+        """
+        return self._update_values(user_id, {"hashed_password": hashed_password}, revoke_tokens=False) is not None
 
-    def update_user(self, user_id: UUID, data: dict) -> Optional[User]:
+    def update_user(self, user_id: UUID, data: dict, revoke_on_change: Sequence[str] = ()) -> Optional[User]:
         """Update a user's information.
 
         Args:
             user_id: The user ID
             data: Dictionary of fields to update
+            revoke_on_change: Fields of ``data`` whose change invalidates the tokens issued before the update
 
         Returns:
             Updated User object if successful, None otherwise
         """
-        updated = self.update(conditions={"id": str(user_id)}, data=data)
-        return updated
+        if not data:
+            return self.get_by_id(user_id)
+        revoke_on_change = [field for field in revoke_on_change if field in data]
+        if self._update_values(user_id, data, revoke_tokens=False, revoke_on_change=revoke_on_change) is None:
+            return None
+        return self.get_by_id(user_id)
 
     def deactivate_user(self, user_id: UUID) -> bool:
-        """Deactivate a user account.
+        """Deactivate a user account and revoke its tokens.
 
         Args:
             user_id: The user ID to deactivate
@@ -108,8 +188,7 @@ class UserCRUD(CRUDMixin[User, None, None]):
         Returns:
             True if deactivation was successful, False otherwise
         """
-        updated = self.update(conditions={"id": str(user_id)}, data={"is_active": False})
-        return updated is not None
+        return self._update_values(user_id, {"is_active": False}, revoke_tokens=True) is not None
 
     def list_users(self, offset: int = 0, limit: int = 100, is_active: Optional[bool] = None) -> tuple:
         """List users with optional filtering.
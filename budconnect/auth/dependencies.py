@@ -14,7 +14,12 @@
 #  limitations under the License.
 #  -----------------------------------------------------------------------------
 
-"""FastAPI dependencies for authentication."""
+"""FastAPI dependencies for authentication.
+
+The dependencies resolve a bearer token to a ``UserPrincipal`` (id, username, active and admin flags,
+token version) served from a short-lived cache, so authenticated requests normally need no user query.
+Routes that need the full user row load it explicitly.
+"""
 
 from typing import Optional
 
@@ -23,7 +28,8 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from typing_extensions import Annotated
 
-from .models import User
+from ..commons.executor import run_sync
+from .schemas import UserPrincipal
 from .services import AuthService
 
 
@@ -31,14 +37,14 @@ from .services import AuthService
 security = HTTPBearer()
 
 
-async def get_current_user(credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)]) -> User:
+async def get_current_user(credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)]) -> UserPrincipal:
     """Get the current authenticated user from JWT token.
 
     Args:
         credentials: HTTP Bearer token credentials
 
     Returns:
-        Current authenticated User object
+        Principal of the current authenticated user
 
     Raises:
         HTTPException: If authentication fails
@@ -51,9 +57,7 @@ async def get_current_user(credentials: Annotated[HTTPAuthorizationCredentials,
         )
 
     try:
-        token_data = AuthService.verify_token(credentials.credentials)
-        user = AuthService.get_current_user(token_data.user_id)
-        return user
+        return await run_sync(AuthService.authenticate_token, credentials.credentials)
     except ClientException as e:
         raise HTTPException(
             status_code=e.status_code,
@@ -62,14 +66,16 @@ async def get_current_user(credentials: Annotated[HTTPAuthorizationCredentials,
         ) from e
 
 
-async def get_current_active_user(current_user: Annotated[User, Depends(get_current_user)]) -> User:
+async def get_current_active_user(
+    current_user: Annotated[UserPrincipal, Depends(get_current_user)],
+) -> UserPrincipal:
     """Get the current active user.
 
     Args:
         current_user: Current authenticated user
 
     Returns:
-        Current active User object
+        Principal of the current active user
 
     Raises:
         HTTPException: If user is inactive
@@ -79,14 +85,16 @@ async def get_current_active_user(current_user: Annotated[User, Depends(get_curr
     return current_user
 
 
-async def get_current_admin_user(current_user: Annotated[User, Depends(get_current_active_user)]) -> User:
+async def get_current_admin_user(
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
+) -> UserPrincipal:
     """Get the current admin user.
 
     Args:
         current_user: Current active user
 
     Returns:
-        Current admin User object
+        Principal of the current admin user
 
     Raises:
         HTTPException: If user is not an admin
@@ -98,7 +106,7 @@ async def get_current_admin_user(current_user: Annotated[User, Depends(get_curre
 
 async def get_optional_current_user(
     credentials: Annotated[Optional[HTTPAuthorizationCredentials], Depends(security)],
-) -> Optional[User]:
+) -> Optional[UserPrincipal]:
     """Get the current user if authenticated, None otherwise.
 
     This dependency is useful for endpoints that can work both
@@ -109,14 +117,12 @@ async def get_optional_current_user(
         credentials: Optional HTTP Bearer token credentials
 
     Returns:
-        Current authenticated User object or None
+        Principal of the current authenticated user or None
     """
     if not credentials:
         return None
 
     try:
-        token_data = AuthService.verify_token(credentials.credentials)
-        user = AuthService.get_current_user(token_data.user_id)
-        return user
+        return await run_sync(AuthService.authenticate_token, credentials.credentials)
     except ClientException:
         return None
@@ -17,7 +17,7 @@
 """User model for authentication."""
 
 from budmicroframe.shared.psql_service import PSQLBase, TimestampMixin
-from sqlalchemy import Boolean, Column, String
+from sqlalchemy import Boolean, Column, Integer, String
 from sqlalchemy.dialects.postgresql import UUID
 
 
@@ -31,6 +31,7 @@ class User(PSQLBase, TimestampMixin):
         hashed_password: Bcrypt hashed password
         is_active: Whether the user account is active
         is_admin: Whether the user has admin privileges
+        token_version: Incremented to revoke every token issued before; tokens carry it in the "ver" claim
         created_at: Timestamp when user was created
         modified_at: Timestamp when user was last modified
     """
@@ -43,6 +44,7 @@ class User(PSQLBase, TimestampMixin):
     hashed_password = Column(String(255), nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
     is_admin = Column(Boolean, default=False, nullable=False)
+    token_version = Column(Integer, default=0, server_default="0", nullable=False)
 
     def __repr__(self) -> str:
         """Return string representation of User."""
@@ -24,13 +24,14 @@ from budmicroframe.commons.exceptions import ClientException
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from typing_extensions import Annotated
 
+from ..commons.executor import run_sync
 from .dependencies import get_current_active_user, get_current_admin_user
-from .models import User
 from .schemas import (
     PasswordChange,
     Token,
     UserCreate,
     UserLogin,
+    UserPrincipal,
     UserResponse,
     UserUpdate,
 )
@@ -44,7 +45,7 @@ auth_router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 @auth_router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(
-    user_data: UserCreate, current_admin: Annotated[User, Depends(get_current_admin_user)]
+    user_data: UserCreate, current_admin: Annotated[UserPrincipal, Depends(get_current_admin_user)]
 ) -> UserResponse:
     """Register a new user (admin only).
 
@@ -56,7 +57,7 @@ async def register(
         Created user information
     """
     try:
-        user = AuthService.create_user(user_data)
+        user = await AuthService.create_user(user_data)
         logger.info(f"New user registered: {user.username} by admin: {current_admin.username}")
         return user
     except ClientException as e:
@@ -85,7 +86,7 @@ async def initial_setup(user_data: UserCreate) -> UserResponse:
     user_data.is_admin = True
 
     try:
-        user = AuthService.create_user(user_data)
+        user = await AuthService.create_user(user_data)
         logger.info(f"Initial admin user created: {user.username}")
         return user
     except ClientException as e:
@@ -102,7 +103,12 @@ async def login(user_data: UserLogin) -> Token:
     Returns:
         Access and refresh tokens
     """
-    user = AuthService.authenticate_user(user_data.username, user_data.password)
+    try:
+        user = await AuthService.authenticate_user(user_data.username, user_data.password)
+    except ClientException as e:
+        # Raised with 429 when the password hashing pool is saturated
+        logger.warning(f"Login rejected for {user_data.username}: {e.message}")
+        raise HTTPException(status_code=e.status_code, detail=e.message, headers={"Retry-After": "1"}) from e
 
     if not user:
         logger.warning(f"Failed login attempt for: {user_data.username}")
@@ -113,11 +119,11 @@ async def login(user_data: UserLogin) -> Token:
         )
 
     # Create tokens
-    access_token = AuthService.create_access_token(
-        data={"sub": str(user.id), "username": user.username, "is_admin": user.is_admin}
-    )
+    access_token = AuthService.create_access_token(data=AuthService.token_claims(user))
 
-    refresh_token = AuthService.create_refresh_token(data={"sub": str(user.id), "username": user.username})
+    refresh_token = AuthService.create_refresh_token(
+        data={"sub": str(user.id), "username": user.username, "ver": user.token_version or 0}
+    )
 
     logger.info(f"User logged in: {user.username}")
 
@@ -135,13 +141,10 @@ async def refresh_token(refresh_token: str) -> Token:
         New access token
     """
     try:
-        token_data = AuthService.verify_token(refresh_token, token_type="refresh")
-        user = AuthService.get_current_user(token_data.user_id)
+        principal = await run_sync(AuthService.authenticate_token, refresh_token, token_type="refresh")
 
         # Create new access token
-        access_token = AuthService.create_access_token(
-            data={"sub": str(user.id), "username": user.username, "is_admin": user.is_admin}
-        )
+        access_token = AuthService.create_access_token(data=AuthService.token_claims(principal))
 
         return Token(access_token=access_token, token_type="bearer")
     except ClientException as e:
@@ -153,7 +156,9 @@ async def refresh_token(refresh_token: str) -> Token:
 
 
 @auth_router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: Annotated[User, Depends(get_current_active_user)]) -> UserResponse:
+async def get_current_user_info(
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
+) -> UserResponse:
     """Get current user information.
 
     Args:
@@ -162,20 +167,26 @@ async def get_current_user_info(current_user: Annotated[User, Depends(get_curren
     Returns:
         User information
     """
+    # The dependency only resolves the cached principal; profile fields come from the users table
+    try:
+        user = await run_sync(AuthService.get_current_user, str(current_user.id))
+    except ClientException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message) from e
+
     return UserResponse(
-        id=current_user.id,
-        username=current_user.username,
-        email=current_user.email,
-        is_active=current_user.is_active,
-        is_admin=current_user.is_admin,
-        created_at=current_user.created_at,
-        modified_at=current_user.modified_at,
+        id=user.id,
+        username=user.username,
+        email=user.email,
+        is_active=user.is_active,
+        is_admin=user.is_admin,
+        created_at=user.created_at,
+        modified_at=user.modified_at,
     )
 
 
 @auth_router.post("/change-password", status_code=status.HTTP_204_NO_CONTENT)
 async def change_password(
-    password_data: PasswordChange, current_user: Annotated[User, Depends(get_current_active_user)]
+    password_data: PasswordChange, current_user: Annotated[UserPrincipal, Depends(get_current_active_user)]
 ) -> None:
     """Change current user's password.
 
@@ -187,7 +198,7 @@ async def change_password(
         No content on success
     """
     try:
-        success = AuthService.change_password(
+        success = await AuthService.change_password(
             UUID(str(current_user.id)), password_data.current_password, password_data.new_password
         )
 
@@ -202,7 +213,7 @@ async def change_password(
 
 @auth_router.get("/users", response_model=List[UserResponse])
 async def list_users(
-    current_admin: Annotated[User, Depends(get_current_admin_user)],
+    current_admin: Annotated[UserPrincipal, Depends(get_current_admin_user)],
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(100, ge=1, le=500, description="Number of items per page"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
@@ -241,7 +252,7 @@ async def list_users(
 
 @auth_router.patch("/users/{user_id}", response_model=UserResponse)
 async def update_user(
-    user_id: str, user_update: UserUpdate, current_admin: Annotated[User, Depends(get_current_admin_user)]
+    user_id: str, user_update: UserUpdate, current_admin: Annotated[UserPrincipal, Depends(get_current_admin_user)]
 ) -> UserResponse:
     """Update user information (admin only).
 
@@ -255,38 +266,37 @@ async def update_user(
     """
     from uuid import UUID
 
-    from .crud import UserCRUD
+    # Prepare update data
+    update_data: Dict[str, Any] = {}
+    if user_update.email is not None:
+        update_data["email"] = user_update.email
+    if user_update.is_active is not None:
+        update_data["is_active"] = user_update.is_active
+    if user_update.is_admin is not None:
+        update_data["is_admin"] = user_update.is_admin
 
-    with UserCRUD() as crud:
-        # Prepare update data
-        update_data: Dict[str, Any] = {}
-        if user_update.email is not None:
-            update_data["email"] = user_update.email
-        if user_update.is_active is not None:
-            update_data["is_active"] = user_update.is_active
-        if user_update.is_admin is not None:
-            update_data["is_admin"] = user_update.is_admin
-
-        updated_user = crud.update_user(UUID(user_id), update_data)
-
-        if not updated_user:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-
-        logger.info(f"User {updated_user.username} updated by admin: {current_admin.username}")
-
-        return UserResponse(
-            id=updated_user.id,
-            username=updated_user.username,
-            email=updated_user.email,
-            is_active=updated_user.is_active,
-            is_admin=updated_user.is_admin,
-            created_at=updated_user.created_at,
-            modified_at=updated_user.modified_at,
-        )
+    updated_user = await run_sync(AuthService.update_user, UUID(user_id), update_data)
+
+    if not updated_user:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+
+    logger.info(f"User {updated_user.username} updated by admin: {current_admin.username}")
+
+    return UserResponse(
+        id=updated_user.id,
+        username=updated_user.username,
+        email=updated_user.email,
+        is_active=updated_user.is_active,
+        is_admin=updated_user.is_admin,
+        created_at=updated_user.created_at,
+        modified_at=updated_user.modified_at,
+    )
 
 
 @auth_router.delete("/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def deactivate_user(user_id: str, current_admin: Annotated[User, Depends(get_current_admin_user)]) -> None:
+async def deactivate_user(
+    user_id: str, current_admin: Annotated[UserPrincipal, Depends(get_current_admin_user)]
+) -> None:
     """Deactivate a user (admin only).
 
     Args:
@@ -298,12 +308,9 @@ async def deactivate_user(user_id: str, current_admin: Annotated[User, Depends(g
     """
     from uuid import UUID
 
-    from .crud import UserCRUD
+    success = await run_sync(AuthService.deactivate_user, UUID(user_id))
 
-    with UserCRUD() as crud:
-        success = crud.deactivate_user(UUID(user_id))
-
-        if not success:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    if not success:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
-        logger.info(f"User {user_id} deactivated by admin: {current_admin.username}")
+    logger.info(f"User {user_id} deactivated by admin: {current_admin.username}")
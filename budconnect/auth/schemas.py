@@ -84,9 +84,22 @@ class TokenData(BaseModel):
     user_id: str
     username: str
     is_admin: bool = False
+    token_version: int = 0
     exp: Optional[datetime] = None
 
 
+class UserPrincipal(BaseModel):
+    """Identity and permissions of an authenticated user, cached between requests."""
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    id: UUID
+    username: str
+    is_active: bool
+    is_admin: bool
+    token_version: int = 0
+
+
 class PasswordChange(BaseModel):
     """Schema for changing password."""
 
@@ -17,7 +17,7 @@
 """Authentication services for user management and token handling."""
 
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 from uuid import UUID
 
 from budmicroframe.commons import logging
@@ -27,16 +27,36 @@ from jose import jwt
 from jose.exceptions import JWTError
 from passlib.context import CryptContext
 
+from ..commons.cache import CatalogGeneration, GenerationalTTLCache
 from ..commons.config import app_settings
+from ..commons.executor import run_password_hash
 from .crud import UserCRUD
 from .models import User
-from .schemas import TokenData, UserCreate, UserResponse
+from .schemas import TokenData, UserCreate, UserPrincipal, UserResponse
 
 
 logger = logging.get_logger(__name__)
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context; pinning min/max rounds to the configured cost makes any other cost "needs update",
+# so hashes are migrated on the next successful login when PASSWORD_HASH_ROUNDS changes in either direction
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=app_settings.password_hash_rounds,
+    bcrypt__min_rounds=app_settings.password_hash_rounds,
+    bcrypt__max_rounds=app_settings.password_hash_rounds,
+)
+
+# Bumped by every user write; flushes the principal cache without tying it to the catalog generation
+principal_generation = CatalogGeneration()
+
+# Principals of recently authenticated users, so the auth dependencies skip the users table
+principal_cache: GenerationalTTLCache[UserPrincipal] = GenerationalTTLCache(
+    "auth_principals",
+    maxsize=app_settings.auth_principal_cache_max_size,
+    ttl=app_settings.auth_principal_cache_ttl_seconds,
+    generation=principal_generation,
+)
 
 
 class AuthService:
@@ -67,6 +87,37 @@ class AuthService:
         """
         return pwd_context.verify(plain_password, hashed_password)
 
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        """Hash a password on the password hashing pool.
+
+        Args:
+            password: Plain text password
+
+        Returns:
+            Hashed password
+
+        Raises:
+            ClientException: With status 429 if too many hash operations are pending
+        """
+        return await run_password_hash(pwd_context.hash, password)
+
+    @staticmethod
+    async def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Verify a password on the password hashing pool and rehash it if its cost is outdated.
+
+        Args:
+            plain_password: Plain text password
+            hashed_password: Hashed password to verify against
+
+        Returns:
+            Tuple of (whether the password matches, replacement hash or None if the hash is current)
+
+        Raises:
+            ClientException: With status 429 if too many hash operations are pending
+        """
+        return await run_password_hash(pwd_context.verify_and_update, plain_password, hashed_password)
+
     @staticmethod
     def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
         """Create a JWT access token.
@@ -129,11 +180,13 @@ class AuthService:
             user_id: str = payload.get("sub")
             username: str = payload.get("username")
             is_admin: bool = payload.get("is_admin", False)
+            # Tokens issued before token versions existed carry no claim and count as version 0
+            token_version: int = payload.get("ver", 0)
 
             if user_id is None or username is None:
                 raise ClientException(message="Invalid token payload", status_code=status.HTTP_401_UNAUTHORIZED)
 
-            return TokenData(user_id=user_id, username=username, is_admin=is_admin)
+            return TokenData(user_id=user_id, username=username, is_admin=is_admin, token_version=token_version)
         except JWTError as e:
             logger.error(f"JWT verification failed: {e}")
             raise ClientException(
@@ -141,15 +194,21 @@ class AuthService:
             ) from e
 
     @staticmethod
-    def authenticate_user(username: str, password: str) -> Optional[User]:
+    async def authenticate_user(username: str, password: str) -> Optional[User]:
         """Authenticate a user by username and password.
 
+        The bcrypt verification runs on the password hashing pool. A hash created with a different cost than
+        ``PASSWORD_HASH_ROUNDS`` is replaced by a fresh one without revoking the user's tokens.
+
         Args:
             username: Username or email
             password: Plain text password
 
         Returns:
             User object if authentication successful, None otherwise
+
+        Raises:
+            ClientException: With status 429 if too many hash operations are pending
         """
         with UserCRUD() as crud:
             # Try to find user by username
@@ -159,20 +218,26 @@ class AuthService:
             if not user:
                 user = crud.get_by_email(username)
 
-            if not user:
-                return None
+        if not user:
+            return None
 
-            if not AuthService.verify_password(password, user.hashed_password):
-                return None
+        valid, new_hash = await AuthService.verify_and_update_password(password, user.hashed_password)
+        if not valid:
+            return None
 
-            if not user.is_active:
-                logger.warning(f"Inactive user attempted login: {username}")
-                return None
+        if not user.is_active:
+            logger.warning(f"Inactive user attempted login: {username}")
+            return None
 
-            return user
+        if new_hash is not None:
+            logger.info(f"Rehashing password of user {username} with the configured cost")
+            with UserCRUD() as crud:
+                crud.replace_password_hash(user.id, new_hash)
+
+        return user
 
     @staticmethod
-    def create_user(user_data: UserCreate) -> UserResponse:
+    async def create_user(user_data: UserCreate) -> UserResponse:
         """Create a new user.
 
         Args:
@@ -194,7 +259,7 @@ class AuthService:
                 raise ClientException(message="Email already registered", status_code=status.HTTP_400_BAD_REQUEST)
 
             # Hash the password
-            hashed_password = AuthService.hash_password(user_data.password)
+            hashed_password = await AuthService.hash_password_async(user_data.password)
 
             # Create the user
             user_dict = {
@@ -247,7 +312,134 @@ class AuthService:
             return user
 
     @staticmethod
-    def change_password(user_id: UUID, current_password: str, new_password: str) -> bool:
+    def token_claims(user: Any) -> Dict[str, Any]:
+        """Build the access token claims of a user or principal.
+
+        Args:
+            user: User or UserPrincipal to issue the token for
+
+        Returns:
+            Claims to pass to ``create_access_token``
+        """
+        return {
+            "sub": str(user.id),
+            "username": user.username,
+            "is_admin": user.is_admin,
+            "ver": user.token_version or 0,
+        }
+
+    @staticmethod
+    def get_principal(user_id: str, refresh: bool = False) -> UserPrincipal:
+        """Get the identity and permissions of a user, from the principal cache when possible.
+
+        Args:
+            user_id: User ID from JWT token
+            refresh: Whether to skip the cache and reload the principal from the database
+
+        Returns:
+            The user's principal
+
+        Raises:
+            ClientException: If the user ID is malformed or the user does not exist
+        """
+        try:
+            key = UUID(user_id)
+        except ValueError as e:
+            raise ClientException(message="Invalid token payload", status_code=status.HTTP_401_UNAUTHORIZED) from e
+
+        principal = None if refresh else principal_cache.get(key)
+        if principal is not None:
+            return principal
+
+        generation = principal_generation.value
+        with UserCRUD() as crud:
+            row = crud.get_principal(key)
+        if row is None:
+            raise ClientException(message="User not found", status_code=status.HTTP_404_NOT_FOUND)
+
+        principal = UserPrincipal.model_validate(row)
+        principal_cache.set(key, principal, generation)
+        return principal
+
+    @staticmethod
+    def authenticate_token(token: str, token_type: str = "access") -> UserPrincipal:
+        """Verify a token and return the principal of its active user.
+
+        The user lookup is served by the principal cache, so a valid token usually costs no query. A token
+        whose "ver" claim is older than the user's token version has been revoked. A newer claim means the
+        cached principal is stale, e.g. the user was updated through another replica, so it is reloaded
+        before deciding.
+
+        Args:
+            token: JWT token to verify
+            token_type: Type of token ("access" or "refresh")
+
+        Returns:
+            The authenticated user's principal
+
+        Raises:
+            ClientException: If the token is invalid or revoked, or the user is missing or inactive
+        """
+        token_data = AuthService.verify_token(token, token_type=token_type)
+        principal = AuthService.get_principal(token_data.user_id)
+        if token_data.token_version > principal.token_version:
+            principal = AuthService.get_principal(token_data.user_id, refresh=True)
+
+        if token_data.token_version < principal.token_version:
+            raise ClientException(message="Token has been revoked", status_code=status.HTTP_401_UNAUTHORIZED)
+
+        if not principal.is_active:
+            raise ClientException(message="Inactive user", status_code=status.HTTP_403_FORBIDDEN)
+
+        return principal
+
+    @staticmethod
+    def invalidate_principals(reason: str) -> None:
+        """Drop cached principals after a user write.
+
+        Args:
+            reason: Description of the write, used for debug logging
+        """
+        principal_generation.bump(reason)
+
+    @staticmethod
+    def update_user(user_id: UUID, data: Dict[str, Any]) -> Optional[User]:
+        """Update a user's information.
+
+        Changing the active or admin flag revokes the user's tokens, since they embed the old permissions.
+        Writing the value the user already has leaves them valid.
+
+        Args:
+            user_id: User ID
+            data: Fields to update
+
+        Returns:
+            Updated User object, or None if the user does not exist
+        """
+        with UserCRUD() as crud:
+            try:
+                return crud.update_user(user_id, data, revoke_on_change=("is_active", "is_admin"))
+            finally:
+                AuthService.invalidate_principals(f"user {user_id} updated")
+
+    @staticmethod
+    def deactivate_user(user_id: UUID) -> bool:
+        """Deactivate a user and revoke its tokens.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            True if the user was deactivated, False if it does not exist
+        """
+        with UserCRUD() as crud:
+            try:
+                return crud.deactivate_user(user_id)
+            finally:
+                AuthService.invalidate_principals(f"user {user_id} deactivated")
+
+    @staticmethod
+    async def change_password(user_id: UUID, current_password: str, new_password: str) -> bool:
         """Change a user's password.
 
         Args:
@@ -259,16 +451,23 @@ class AuthService:
             True if password changed successfully
 
         Raises:
-            ClientException: If current password is incorrect
+            ClientException: If current password is incorrect, or with status 429 if too many hash operations
+                are pending
         """
         with UserCRUD() as crud:
             user = crud.get_by_id(user_id)
 
-            if not user:
-                raise ClientException(message="User not found", status_code=status.HTTP_404_NOT_FOUND)
+        if not user:
+            raise ClientException(message="User not found", status_code=status.HTTP_404_NOT_FOUND)
 
-            if not AuthService.verify_password(current_password, user.hashed_password):
-                raise ClientException(message="Incorrect password", status_code=status.HTTP_400_BAD_REQUEST)
+        valid, _ = await AuthService.verify_and_update_password(current_password, user.hashed_password)
+        if not valid:
+            raise ClientException(message="Incorrect password", status_code=status.HTTP_400_BAD_REQUEST)
 
-            hashed_password = AuthService.hash_password(new_password)
-            return crud.update_password(user_id, hashed_password)
+        hashed_password = await AuthService.hash_password_async(new_password)
+        with UserCRUD() as crud:
+            try:
+                # Also revokes the tokens issued with the old password
+                return crud.update_password(user_id, hashed_password)
+            finally:
+                AuthService.invalidate_principals(f"password of user {user_id} changed")
@@ -30,9 +30,11 @@ from ..engine.models import (
 )
 from ..guardrails.models import GuardrailProbe as GuardrailProbe
 from ..guardrails.models import GuardrailRule as GuardrailRule
+from ..license.models import LicenseAnalysis as LicenseAnalysis
 from ..model.models import (
     ModelInfo as ModelInfo,
 )
 from ..model.models import (
     Provider as Provider,
 )
+from ..sync.models import CatalogChange as CatalogChange
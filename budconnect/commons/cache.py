@@ -0,0 +1,170 @@
+#  -----------------------------------------------------------------------------
+#  Copyright (c) 2024 Bud Ecosystem Inc.
+#  #
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  #
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  #
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  -----------------------------------------------------------------------------
+
+"""In-process caching primitives shared by the catalog services.
+
+``catalog_generation`` is a process-wide counter that every catalog write path bumps. Caches built on
+``GenerationalTTLCache`` remember the generation they were filled at and drop their contents as soon as
+the counter moves, so a write never has to know which caches hold derived data.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+from budmicroframe.commons import logging
+from cachetools import TTLCache
+
+
+logger = logging.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class CatalogGeneration:
+    """Monotonically increasing counter identifying the current state of the catalog."""
+
+    def __init__(self) -> None:
+        """Initialize the counter at generation zero."""
+        self._value = 0
+        self._lock = threading.Lock()
+
+    @property
+    def value(self) -> int:
+        """Return the current generation."""
+        return self._value
+
+    def bump(self, reason: Optional[str] = None) -> int:
+        """Advance the generation, invalidating every cache derived from the catalog.
+
+        Args:
+            reason: Optional description of the write, used for debug logging.
+
+        Returns:
+            The new generation.
+        """
+        with self._lock:
+            self._value += 1
+            value = self._value
+        logger.debug("Catalog generation bumped to %d (%s)", value, reason or "unspecified")
+        return value
+
+
+catalog_generation = CatalogGeneration()
+
+
+class _EvictionCountingTTLCache(TTLCache[Hashable, Any]):
+    """TTLCache that reports LRU evictions through a callback."""
+
+    def __init__(self, maxsize: int, ttl: float, on_evict: Callable[[], None]) -> None:
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._on_evict = on_evict
+
+    def popitem(self) -> Any:
+        """Evict the least recently used item and record the eviction."""
+        item = super().popitem()
+        self._on_evict()
+        return item
+
+
+class GenerationalTTLCache(Generic[T]):
+    """Thread-safe TTL + LRU cache that is flushed whenever the catalog generation changes.
+
+    Args:
+        name: Name used in logs and stats.
+        maxsize: Maximum number of entries kept before the least recently used one is evicted.
+        ttl: Time to live of an entry in seconds. A value of zero or less disables the cache.
+        generation: The generation counter to follow. Defaults to ``catalog_generation``.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float, generation: Optional[CatalogGeneration] = None) -> None:
+        """Initialize the cache and its counters."""
+        self.name = name
+        self.enabled = ttl > 0 and maxsize > 0
+        self._generation = generation or catalog_generation
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._cache: TTLCache[Hashable, Any] = _EvictionCountingTTLCache(
+            maxsize=max(1, maxsize), ttl=max(ttl, 1), on_evict=self._record_eviction
+        )
+        self._filled_at = self._generation.value
+
+    def _record_eviction(self) -> None:
+        self._evictions += 1
+
+    def _sync_generation(self) -> None:
+        """Drop all entries if the catalog changed since the cache was filled. Caller holds the lock."""
+        current = self._generation.value
+        if current != self._filled_at:
+            if len(self._cache):
+                self._invalidations += 1
+            self._cache.clear()
+            self._filled_at = current
+
+    def get(self, key: Hashable) -> Optional[T]:
+        """Return the cached value for ``key`` or None, updating the hit/miss counters."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            self._sync_generation()
+            value = self._cache.get(key)
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return value
+
+    def set(self, key: Hashable, value: T, generation: int) -> None:
+        """Store ``value`` if the catalog has not changed since ``generation`` was read.
+
+        Args:
+            key: The cache key.
+            value: The value to cache.
+            generation: The catalog generation observed before the value was computed. Values computed
+                against an older generation are discarded so a concurrent write is never masked.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._sync_generation()
+            if generation != self._filled_at:
+                return
+            self._cache[key] = value
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the cache counters."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "name": self.name,
+                "enabled": self.enabled,
+                "size": len(self._cache),
+                "maxsize": self._cache.maxsize,
+                "ttl": self._cache.ttl,
+                "generation": self._generation.value,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
@@ -0,0 +1,217 @@
+#  -----------------------------------------------------------------------------
+#  Copyright (c) 2024 Bud Ecosystem Inc.
+#  #
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  #
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  #
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  -----------------------------------------------------------------------------
+
+"""ETag / If-None-Match and Last-Modified / If-Modified-Since support for read endpoints.
+
+Two cooperating pieces:
+
+- ``not_modified_response`` is called by a route with a cheap validator (a row timestamp, a content hash
+  or the catalog version) *before* running its expensive query. It records the validator on the request
+  and returns a bodiless 304 response when the client's copy is current.
+- ``ConditionalGetMiddleware`` is registered once in ``main.py``. It attaches the recorded validator to
+  successful GET responses, and for GET routes without a validator it derives a strong ETag from the
+  JSON body so clients can still skip downloading unchanged payloads.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import Request, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .hashing import compute_content_hash
+
+
+_VALIDATOR_STATE_KEY = "conditional_validator"
+_SAFE_METHODS = ("GET", "HEAD")
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a strong, quoted ETag from the values that determine a response."""
+    return f'"{compute_content_hash(list(parts))}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Apply the weak comparison that RFC 9110 mandates for If-None-Match."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def _is_not_modified(headers: Any, etag: Optional[str], last_modified: Optional[datetime]) -> bool:
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-Modified-Since is ignored whenever If-None-Match is present
+        return etag is not None and _etag_matches(if_none_match, etag)
+
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return _to_utc(last_modified).replace(microsecond=0) <= since
+    return False
+
+
+def _to_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def _validator_headers(etag: Optional[str], last_modified: Optional[datetime]) -> Dict[str, str]:
+    headers = {"Cache-Control": "no-cache"}
+    if etag:
+        headers["ETag"] = etag
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_to_utc(last_modified), usegmt=True)
+    return headers
+
+
+def not_modified_response(
+    request: Request, etag: Optional[str], last_modified: Optional[datetime] = None
+) -> Optional[Response]:
+    """Record the validator of the current request and answer 304 if the client's copy is current.
+
+    Args:
+        request: The incoming request.
+        etag: Strong ETag of the representation, typically built with ``make_etag``.
+        last_modified: Time the representation last changed, if known.
+
+    Returns:
+        A 304 response to return immediately, or None if the full response must be produced.
+    """
+    setattr(request.state, _VALIDATOR_STATE_KEY, (etag, last_modified))
+    if request.method in _SAFE_METHODS and _is_not_modified(request.headers, etag, last_modified):
+        return Response(status_code=304, headers=_validator_headers(etag, last_modified))
+    return None
+
+
+class ConditionalGetMiddleware:
+    """Attach validators to GET responses and turn unchanged JSON bodies into 304 responses.
+
+    Args:
+        app: The wrapped ASGI application.
+        max_body_size: Largest JSON body that is buffered to derive an ETag when the route did not provide
+            a validator. Larger and streaming responses pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int = 8 * 1024 * 1024) -> None:
+        """Initialize the middleware."""
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI request."""
+        if scope["type"] != "http" or scope["method"] not in _SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = {key.decode("latin-1").lower(): value.decode("latin-1") for key, value in scope["headers"]}
+        start_message: Optional[Message] = None
+        body_parts: List[bytes] = []
+        buffering = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, buffering
+
+            if message["type"] == "http.response.start":
+                headers = _HeaderList(message.get("headers", []))
+                validator: Optional[Tuple[Optional[str], Optional[datetime]]] = scope.get("state", {}).get(
+                    _VALIDATOR_STATE_KEY
+                )
+                if message["status"] != 200 or headers.get("etag"):
+                    await send(message)
+                elif validator is not None:
+                    headers.set_missing(_validator_headers(*validator))
+                    message["headers"] = headers.raw
+                    await send(message)
+                elif scope["method"] == "GET" and self._can_buffer(headers):
+                    start_message = message
+                    buffering = True
+                else:
+                    await send(message)
+                return
+
+            if not buffering:
+                await send(message)
+                return
+
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            assert start_message is not None
+            body = b"".join(body_parts)
+            etag = f'"{hashlib.sha256(body).hexdigest()}"'
+            headers = _HeaderList(start_message.get("headers", []))
+            if _is_not_modified(request_headers, etag, None):
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": 304,
+                        "headers": _HeaderList([]).set_missing(_validator_headers(etag, None)).raw,
+                    }
+                )
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            headers.set_missing(_validator_headers(etag, None))
+            start_message["headers"] = headers.raw
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _can_buffer(self, headers: "_HeaderList") -> bool:
+        content_type = headers.get("content-type") or ""
+        content_length = headers.get("content-length")
+        return (
+            content_type.startswith("application/json")
+            and content_length is not None
+            and content_length.isdigit()
+            and int(content_length) <= self.max_body_size
+        )
+
+
+class _HeaderList:
+    """Minimal mutable view over raw ASGI headers."""
+
+    def __init__(self, raw: Any) -> None:
+        self.raw: List[Tuple[bytes, bytes]] = list(raw)
+
+    def get(self, name: str) -> Optional[str]:
+        encoded = name.lower().encode("latin-1")
+        for key, value in self.raw:
+            if key.lower() == encoded:
+                return value.decode("latin-1")
+        return None
+
+    def set_missing(self, values: Dict[str, str]) -> "_HeaderList":
+        for name, value in values.items():
+            if self.get(name) is None:
+                self.raw.append((name.lower().encode("latin-1"), value.encode("latin-1")))
+        return self
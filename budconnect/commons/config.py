@@ -46,6 +46,55 @@ class AppConfig(BaseAppConfig):
     )
     llm_timeout: int = Field(default=120, alias="BUD_LLM_TIMEOUT", description="Timeout in seconds for LLM API calls")
 
+    # License Source Fetching
+    license_fetch_timeout_seconds: float = Field(
+        default=30.0,
+        alias="LICENSE_FETCH_TIMEOUT_SECONDS",
+        description="Total timeout in seconds for downloading a license URL",
+    )
+    license_source_max_bytes: int = Field(
+        default=5 * 1024 * 1024,
+        alias="LICENSE_SOURCE_MAX_BYTES",
+        description="Largest license page or PDF accepted for extraction, in bytes",
+    )
+    license_source_cache_ttl_seconds: int = Field(
+        default=3600,
+        alias="LICENSE_SOURCE_CACHE_TTL_SECONDS",
+        description="TTL in seconds of cached license source text (0 disables the cache)",
+    )
+    license_source_cache_max_size: int = Field(
+        default=256,
+        alias="LICENSE_SOURCE_CACHE_MAX_SIZE",
+        description="Maximum number of cached license source texts",
+    )
+    license_analysis_cache_max_size: int = Field(
+        default=512,
+        alias="LICENSE_ANALYSIS_CACHE_MAX_SIZE",
+        description="Number of LLM license analyses kept in memory in front of the license_analysis table",
+    )
+
+    # Batch License Extraction
+    license_batch_concurrency: int = Field(
+        default=8,
+        alias="LICENSE_BATCH_CONCURRENCY",
+        description="Number of batch extraction items fetched, parsed and analysed at the same time",
+    )
+    license_batch_per_host_concurrency: int = Field(
+        default=2,
+        alias="LICENSE_BATCH_PER_HOST_CONCURRENCY",
+        description="Maximum concurrent downloads from one host during a batch extraction",
+    )
+    license_batch_per_host_interval_seconds: float = Field(
+        default=0.5,
+        alias="LICENSE_BATCH_PER_HOST_INTERVAL_SECONDS",
+        description="Minimum delay in seconds between two downloads from the same host during a batch extraction",
+    )
+    license_batch_max_items: int = Field(
+        default=100,
+        alias="LICENSE_BATCH_MAX_ITEMS",
+        description="Largest number of sources accepted by one batch extraction request",
+    )
+
     # LLM Configuration for Eval Dataset Analysis
     eval_llm_endpoint: str = Field(
         default="http://20.66.97.208/v1/chat/completions",
@@ -62,6 +111,26 @@ class AppConfig(BaseAppConfig):
         alias="EVAL_LLM_TIMEOUT",
         description="Timeout in seconds for eval LLM API calls",
     )
+    eval_llm_concurrency: int = Field(
+        default=8,
+        alias="EVAL_LLM_CONCURRENCY",
+        description="Maximum concurrent question analyses per dataset; lowered automatically on 429/5xx",
+    )
+    eval_llm_max_retries: int = Field(
+        default=4,
+        alias="EVAL_LLM_MAX_RETRIES",
+        description="Retries of a question analysis after a throttled, failed or unparsable LLM response",
+    )
+    eval_llm_backoff_base_seconds: float = Field(
+        default=1.0,
+        alias="EVAL_LLM_BACKOFF_BASE_SECONDS",
+        description="Initial retry delay in seconds for eval LLM calls, doubled on every retry",
+    )
+    eval_llm_backoff_max_seconds: float = Field(
+        default=60.0,
+        alias="EVAL_LLM_BACKOFF_MAX_SECONDS",
+        description="Longest retry delay in seconds for eval LLM calls",
+    )
 
     # Eval Module Output Configuration
     eval_output_dir: str = Field(
@@ -74,6 +143,16 @@ class AppConfig(BaseAppConfig):
         alias="EVAL_SAMPLE_SIZE",
         description="Number of sample questions to extract from each dataset for analysis",
     )
+    eval_max_parallel_datasets: int = Field(
+        default=4,
+        alias="EVAL_MAX_PARALLEL_DATASETS",
+        description="Number of new or updated datasets sampled and analyzed concurrently during a manifest build",
+    )
+    eval_sample_timeout_seconds: float = Field(
+        default=1800.0,
+        alias="EVAL_SAMPLE_TIMEOUT_SECONDS",
+        description="Time allowed for downloading and sampling one dataset in the process pool",
+    )
 
     # Seeder Configuration
     run_seeders_on_startup: bool = Field(
@@ -81,6 +160,82 @@ class AppConfig(BaseAppConfig):
         alias="RUN_SEEDERS_ON_STARTUP",
         description="Whether to run database seeders on application startup",
     )
+    seeders_max_parallel: int = Field(
+        default=4,
+        alias="SEEDERS_MAX_PARALLEL",
+        description="Maximum number of independent seeders run concurrently on startup",
+    )
+    seeders_skip_unchanged: bool = Field(
+        default=True,
+        alias="SEEDERS_SKIP_UNCHANGED",
+        description="Skip seeders whose input fingerprint matches their last successful run",
+    )
+    seeders_force: str = Field(
+        default="",
+        alias="SEEDERS_FORCE",
+        description="Comma-separated names of seeders that run even if their fingerprint is unchanged",
+    )
+    defer_network_seeders: bool = Field(
+        default=True,
+        alias="DEFER_NETWORK_SEEDERS",
+        description="Run network-backed seeders and their dependents in the background once the app is ready",
+    )
+
+    # Request Handling Configuration
+    offload_sync_services: bool = Field(
+        default=True,
+        alias="OFFLOAD_SYNC_SERVICES",
+        description="Whether async route handlers run blocking service calls on a bounded thread pool",
+    )
+    service_executor_max_workers: int = Field(
+        default=32,
+        alias="SERVICE_EXECUTOR_MAX_WORKERS",
+        description="Maximum number of worker threads used for blocking service calls",
+    )
+    process_executor_max_workers: int = Field(
+        default=2,
+        alias="PROCESS_EXECUTOR_MAX_WORKERS",
+        description="Maximum number of worker processes for CPU-bound work (license parsing, dataset sampling)",
+    )
+    process_executor_timeout_seconds: float = Field(
+        default=60.0,
+        alias="PROCESS_EXECUTOR_TIMEOUT_SECONDS",
+        description="Time allowed for one CPU-bound parse in the process pool before it is abandoned",
+    )
+    password_hash_max_workers: int = Field(
+        default=4,
+        alias="PASSWORD_HASH_MAX_WORKERS",
+        description="Maximum number of threads hashing and verifying passwords (bcrypt releases the GIL)",
+    )
+    password_hash_max_pending: int = Field(
+        default=32,
+        alias="PASSWORD_HASH_MAX_PENDING",
+        description="Password hash operations running or queued before new logins are rejected with 429",
+    )
+    password_hash_rounds: int = Field(
+        default=12,
+        alias="PASSWORD_HASH_ROUNDS",
+        description="bcrypt work factor (log2 rounds); hashes with a different cost are rehashed on login",
+    )
+
+    # Compatibility Cache Configuration
+    compatibility_cache_ttl_seconds: int = Field(
+        default=300,
+        alias="COMPATIBILITY_CACHE_TTL_SECONDS",
+        description="TTL in seconds of cached engine compatibility results and parser rule matchers (0 disables)",
+    )
+    compatibility_cache_max_size: int = Field(
+        default=4096,
+        alias="COMPATIBILITY_CACHE_MAX_SIZE",
+        description="Maximum number of cached engine compatibility results",
+    )
+
+    # Pagination Configuration
+    pagination_count_cache_ttl_seconds: int = Field(
+        default=60,
+        alias="PAGINATION_COUNT_CACHE_TTL_SECONDS",
+        description="TTL in seconds of cached list totals served in estimated total mode (0 disables the cache)",
+    )
 
     # JWT Configuration
     jwt_secret_key: str = Field(
@@ -103,6 +258,19 @@ class AppConfig(BaseAppConfig):
         alias="JWT_REFRESH_TOKEN_EXPIRE_DAYS",
         description="Refresh token expiration time in days",
     )
+    auth_principal_cache_ttl_seconds: int = Field(
+        default=30,
+        alias="AUTH_PRINCIPAL_CACHE_TTL_SECONDS",
+        description=(
+            "TTL in seconds of cached user principals used by the auth dependencies (0 disables the cache). "
+            "Bounds how long another replica may accept a revoked token"
+        ),
+    )
+    auth_principal_cache_max_size: int = Field(
+        default=1024,
+        alias="AUTH_PRINCIPAL_CACHE_MAX_SIZE",
+        description="Maximum number of cached user principals",
+    )
 
     # Initial Admin User Configuration
     initial_admin_username: str = Field(
@@ -142,3 +142,62 @@ class ScannerTypeEnum(str, Enum):
     PATTERN = "pattern"
     BUD_RAA_CLASSIFIER = "bud_raa_classifier"
     AGENTMESH_POLICY = "agentmesh_policy"
+
+
+class CatalogEntityTypeEnum(str, Enum):
+    """Catalog entities tracked in the catalog change log.
+
+    Each value is the name of the table whose row changes are recorded.
+    """
+
+    MODEL_INFO = "model_info"
+    PROVIDER = "provider"
+    LICENSE = "license"
+    ENGINE_VERSION = "engine_version"
+    ENGINE_COMPATIBILITY = "engine_compatibility"
+    ENGINE_PARSER_RULE = "engine_parser_rule"
+    GUARDRAIL_PROBE = "guardrail_probes"
+    GUARDRAIL_RULE = "guardrail_rules"
+
+
+class CatalogChangeOperationEnum(str, Enum):
+    """Kind of change recorded in the catalog change log.
+
+    Attributes:
+        INSERT: The row was created; the change carries the new row.
+        UPDATE: The row was modified; the change carries the new row.
+        DELETE: The row was removed; the change is a tombstone without data.
+    """
+
+    INSERT = "insert"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+class TotalCountModeEnum(str, Enum):
+    """How list endpoints compute the ``total`` of a paginated result.
+
+    Attributes:
+        EXACT: Run a ``COUNT(*)`` over the filtered query on every request.
+        ESTIMATED: Use the planner statistics (``pg_class.reltuples``) for unfiltered listings and a
+            short-lived cached exact count for filtered ones.
+    """
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+
+
+class SeederRunStatusEnum(str, Enum):
+    """Outcome of a seeder in a startup seeding run.
+
+    Attributes:
+        COMPLETED: The seeder ran and finished without raising.
+        SKIPPED: The fingerprint of the seeder's inputs matched its last successful run.
+        FAILED: The seeder raised.
+        BLOCKED: The seeder did not run because one of its dependencies failed or was blocked.
+    """
+
+    COMPLETED = "completed"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+    BLOCKED = "blocked"
@@ -0,0 +1,228 @@
+#  -----------------------------------------------------------------------------
+#  Copyright (c) 2024 Bud Ecosystem Inc.
+#  #
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  #
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  #
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  -----------------------------------------------------------------------------
+
+"""Bounded executors used to run blocking work from async route handlers.
+
+The services and CRUD classes are synchronous (``CRUDMixin`` sessions), so calling them directly from an
+``async def`` handler blocks the event loop for the duration of every query. ``run_sync`` moves such calls onto
+a dedicated, size-limited executor so a slow query only occupies one worker thread.
+
+CPU-bound work (HTML and PDF text extraction, eval dataset sampling) would still hold the GIL on a thread, so
+``run_in_process`` sends it to a small process pool instead. Its callables and arguments must be picklable. A
+pool whose worker died is replaced on the next call instead of failing every later call.
+
+Password hashing gets its own small pool through ``run_password_hash``: bcrypt releases the GIL, but each
+call costs tens to hundreds of milliseconds of CPU, so the pool is sized separately and admission is capped
+so a login burst is answered with 429 instead of queueing without bound.
+"""
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, TypeVar
+
+from budmicroframe.commons.exceptions import ClientException
+
+from .config import app_settings
+
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_process_executor: Optional[ProcessPoolExecutor] = None
+_password_executor: Optional[ThreadPoolExecutor] = None
+_password_slots = threading.BoundedSemaphore(max(1, app_settings.password_hash_max_pending))
+
+
+def get_service_executor() -> ThreadPoolExecutor:
+    """Return the shared service executor, creating it on first use.
+
+    Returns:
+        The process-wide thread pool sized by ``SERVICE_EXECUTOR_MAX_WORKERS``.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=max(1, app_settings.service_executor_max_workers),
+                    thread_name_prefix="budconnect-service",
+                )
+    return _executor
+
+
+def shutdown_service_executor(wait: bool = True) -> None:
+    """Shut down the shared service executor if it was started.
+
+    Args:
+        wait: Whether to block until in-flight calls have finished.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait)
+            _executor = None
+
+
+async def run_sync(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking callable without stalling the event loop.
+
+    When ``OFFLOAD_SYNC_SERVICES`` is disabled the callable is invoked inline, which matches the
+    previous behaviour of the route handlers.
+
+    Args:
+        func: The synchronous callable to execute.
+        *args: Positional arguments forwarded to ``func``.
+        **kwargs: Keyword arguments forwarded to ``func``.
+
+    Returns:
+        The value returned by ``func``.
+    """
+    if not app_settings.offload_sync_services:
+        return func(*args, **kwargs)
+
+    loop = asyncio.get_running_loop()
+    # Propagate context variables (request-scoped logging context, etc.) into the worker thread
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_service_executor(), call)
+
+
+def get_process_executor() -> ProcessPoolExecutor:
+    """Return the shared process pool, creating it on first use.
+
+    Returns:
+        The process-wide pool sized by ``PROCESS_EXECUTOR_MAX_WORKERS``.
+    """
+    global _process_executor
+    if _process_executor is None:
+        with _executor_lock:
+            if _process_executor is None:
+                _process_executor = ProcessPoolExecutor(max_workers=max(1, app_settings.process_executor_max_workers))
+    return _process_executor
+
+
+def shutdown_process_executor(wait: bool = True) -> None:
+    """Shut down the shared process pool if it was started.
+
+    Args:
+        wait: Whether to block until in-flight calls have finished.
+    """
+    global _process_executor
+    with _executor_lock:
+        if _process_executor is not None:
+            _process_executor.shutdown(wait=wait)
+            _process_executor = None
+
+
+def _discard_process_executor(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken process pool so the next ``get_process_executor`` call starts a new one."""
+    global _process_executor
+    with _executor_lock:
+        if _process_executor is pool:
+            _process_executor = None
+    pool.shutdown(wait=False)
+
+
+async def run_in_process(func: Callable[..., T], *args: Any, timeout: Optional[float] = None) -> T:
+    """Run a CPU-bound, picklable callable in the shared process pool.
+
+    A call that exceeds its timeout is abandoned; its worker stays busy until the callable returns, but the
+    caller is released.
+
+    Args:
+        func: A module-level function.
+        *args: Picklable positional arguments forwarded to ``func``.
+        timeout: Seconds allowed for the call, defaults to ``PROCESS_EXECUTOR_TIMEOUT_SECONDS``.
+
+    Returns:
+        The value returned by ``func``.
+
+    Raises:
+        asyncio.TimeoutError: If the call did not finish in time.
+        BrokenProcessPool: If a worker process died; the pool is replaced before the error is raised.
+    """
+    pool = get_process_executor()
+    loop = asyncio.get_running_loop()
+    try:
+        return await asyncio.wait_for(
+            loop.run_in_executor(pool, func, *args),
+            timeout=app_settings.process_executor_timeout_seconds if timeout is None else timeout,
+        )
+    except BrokenProcessPool:
+        _discard_process_executor(pool)
+        raise
+
+
+def get_password_executor() -> ThreadPoolExecutor:
+    """Return the password hashing pool, creating it on first use.
+
+    Returns:
+        The process-wide thread pool sized by ``PASSWORD_HASH_MAX_WORKERS``.
+    """
+    global _password_executor
+    if _password_executor is None:
+        with _executor_lock:
+            if _password_executor is None:
+                _password_executor = ThreadPoolExecutor(
+                    max_workers=max(1, app_settings.password_hash_max_workers),
+                    thread_name_prefix="budconnect-password",
+                )
+    return _password_executor
+
+
+def shutdown_password_executor(wait: bool = True) -> None:
+    """Shut down the password hashing pool if it was started.
+
+    Args:
+        wait: Whether to block until in-flight calls have finished.
+    """
+    global _password_executor
+    with _executor_lock:
+        if _password_executor is not None:
+            _password_executor.shutdown(wait=wait)
+            _password_executor = None
+
+
+async def run_password_hash(func: Callable[..., T], *args: Any) -> T:
+    """Run a password hash or verify call on the password hashing pool.
+
+    Args:
+        func: The hashing callable, e.g. ``CryptContext.verify_and_update``.
+        *args: Positional arguments forwarded to ``func``.
+
+    Returns:
+        The value returned by ``func``.
+
+    Raises:
+        ClientException: With status 429 if ``PASSWORD_HASH_MAX_PENDING`` operations are already running or
+            queued.
+    """
+    if not _password_slots.acquire(blocking=False):
+        raise ClientException(message="Too many concurrent authentication requests, retry later", status_code=429)
+    try:
+        future = get_password_executor().submit(func, *args)
+    except BaseException:
+        _password_slots.release()
+        raise
+    # The slot is held until the hash finishes, not until the caller stops waiting: a cancelled request
+    # leaves its bcrypt call running on the pool
+    future.add_done_callback(lambda _: _password_slots.release())
+    return await asyncio.wrap_future(future)
@@ -0,0 +1,74 @@
+#  -----------------------------------------------------------------------------
+#  Copyright (c) 2024 Bud Ecosystem Inc.
+#  #
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  #
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  #
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  -----------------------------------------------------------------------------
+
+"""Stable content hashing of catalog payloads used for change detection."""
+
+import hashlib
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+def normalize_payload(value: Any) -> Any:
+    """Convert a payload into plain JSON types with a canonical representation.
+
+    Enums become their value, UUIDs and decimals become strings, datetimes are converted to UTC
+    (naive values are taken as UTC) and sets are sorted, so equal payloads read from different
+    sources (parsed catalog data, ORM rows) normalize to the same structure.
+
+    Args:
+        value: The value to normalize.
+
+    Returns:
+        The normalized value.
+    """
+    if isinstance(value, BaseModel):
+        return normalize_payload(value.model_dump())
+    if isinstance(value, Enum):
+        return normalize_payload(value.value)
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc).isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {str(key): normalize_payload(item) for key, item in value.items()}
+    if isinstance(value, (set, frozenset)):
+        return sorted((normalize_payload(item) for item in value), key=lambda item: json.dumps(item, sort_keys=True))
+    if isinstance(value, (list, tuple)):
+        return [normalize_payload(item) for item in value]
+    return value
+
+
+def compute_content_hash(payload: Any) -> str:
+    """Return the SHA-256 hex digest of the canonical JSON form of a payload.
+
+    Args:
+        payload: The payload to hash. Dict key order does not affect the result.
+
+    Returns:
+        A 64 character hex digest.
+    """
+    canonical = json.dumps(normalize_payload(payload), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -0,0 +1,156 @@
+#  -----------------------------------------------------------------------------
+#  Copyright (c) 2024 Bud Ecosystem Inc.
+#  #
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  #
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  #
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  -----------------------------------------------------------------------------
+
+"""Keyset (cursor) pagination and cheap list totals.
+
+List endpoints ordered by ``(created_at DESC, id DESC)`` (or ``(name ASC, id ASC)``) continue from an
+opaque cursor holding the sort key of the last row returned, so every page is a bounded index range scan
+instead of an ``OFFSET`` that reads and discards all preceding rows. Totals can be computed exactly or estimated from
+the planner statistics / a short-lived cached count, see ``TotalCountModeEnum``.
+"""
+
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, Callable, Hashable, Optional, Tuple
+from uuid import UUID
+
+from budmicroframe.commons.exceptions import ClientException
+from sqlalchemy import text, tuple_
+from sqlalchemy.orm import Query, Session
+
+from .cache import GenerationalTTLCache, catalog_generation
+from .config import app_settings
+from .constants import TotalCountModeEnum
+
+
+# Exact totals of filtered listings, reused by estimated total mode until the catalog changes
+count_cache: GenerationalTTLCache[int] = GenerationalTTLCache(
+    "pagination_counts",
+    maxsize=1024,
+    ttl=app_settings.pagination_count_cache_ttl_seconds,
+)
+
+
+def encode_keyset_cursor(created_at: datetime, row_id: Any) -> str:
+    """Encode the sort key of the last row of a page as an opaque cursor."""
+    raw = f"{created_at.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_keyset_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a cursor produced by ``encode_keyset_cursor``.
+
+    Raises:
+        ClientException: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        created_at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ClientException(message=f"Invalid pagination cursor '{cursor}'", status_code=400) from e
+
+
+def apply_keyset(query: Query[Any], created_at_column: Any, id_column: Any, cursor: Optional[str]) -> Query[Any]:
+    """Order a query newest first and, given a cursor, restrict it to the rows after that cursor.
+
+    The row-value comparison ``(created_at, id) < (:created_at, :id)`` matches the sort order exactly, so
+    Postgres can serve it from a ``(created_at, id)`` index scanned backwards.
+
+    Args:
+        query: The filtered query.
+        created_at_column: The ``created_at`` column of the paginated entity.
+        id_column: The primary key column of the paginated entity, used as tie breaker.
+        cursor: Cursor returned with the previous page, or None for the first page.
+
+    Returns:
+        The ordered (and, with a cursor, restricted) query.
+    """
+    if cursor:
+        created_at, row_id = decode_keyset_cursor(cursor)
+        query = query.filter(tuple_(created_at_column, id_column) < tuple_(created_at, row_id))
+    return query.order_by(created_at_column.desc(), id_column.desc())
+
+
+def encode_name_keyset_cursor(name: str, row_id: Any) -> str:
+    """Encode the ``(name, id)`` sort key of the last row of a page as an opaque cursor."""
+    raw = f"{row_id}|{name}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_name_keyset_cursor(cursor: str) -> Tuple[str, UUID]:
+    """Decode a cursor produced by ``encode_name_keyset_cursor``.
+
+    Raises:
+        ClientException: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        row_id, name = raw.split("|", 1)
+        return name, UUID(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ClientException(message=f"Invalid pagination cursor '{cursor}'", status_code=400) from e
+
+
+def estimate_table_rows(session: Session, table_name: str) -> Optional[int]:
+    """Return the planner's row estimate of a table, or None if the table was never analyzed."""
+    estimate = session.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"),
+        {"table_name": table_name},
+    ).scalar()
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
+
+
+def resolve_total(
+    session: Session,
+    count: Callable[[], int],
+    total_mode: TotalCountModeEnum,
+    table_name: str,
+    cache_key: Hashable,
+    filtered: bool,
+) -> int:
+    """Compute the total of a listing according to the requested total mode.
+
+    Args:
+        session: Session used for the statistics lookup.
+        count: Callable running the exact count of the filtered query.
+        total_mode: Whether the total must be exact or may be estimated.
+        table_name: Table whose statistics estimate an unfiltered listing.
+        cache_key: Key identifying the listing and its filters in ``count_cache``.
+        filtered: Whether any filter narrows the listing. Statistics only describe whole tables, so
+            filtered listings fall back to a cached exact count.
+
+    Returns:
+        The total number of rows.
+    """
+    if total_mode == TotalCountModeEnum.EXACT:
+        return count()
+
+    if not filtered:
+        estimate = estimate_table_rows(session, table_name)
+        if estimate is not None:
+            return estimate
+
+    cached = count_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    generation = catalog_generation.value
+    total = count()
+    count_cache.set(cache_key, total, generation)
+    return total
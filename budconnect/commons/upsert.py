@@ -0,0 +1,91 @@
+#  -----------------------------------------------------------------------------
+#  Copyright (c) 2024 Bud Ecosystem Inc.
+#  #
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  #
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  #
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  -----------------------------------------------------------------------------
+
+"""Set-based upserts of catalog rows keyed by URI with content hash change detection."""
+
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from budmicroframe.commons import logging
+from sqlalchemy import Table, func, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+
+logger = logging.get_logger(__name__)
+
+
+def bulk_upsert_by_uri(
+    session: Session, table: Table, rows: List[Dict[str, Any]], batch_size: int = 500
+) -> Tuple[Dict[str, UUID], Dict[str, int]]:
+    """Upsert rows keyed by ``uri`` with multi-row statements, skipping rows whose content hash is unchanged.
+
+    Each batch first reads the stored ``id`` and ``content_hash`` of its URIs and drops the rows whose hash
+    did not change, so an unchanged catalog writes nothing. The remaining rows are written with one
+    ``INSERT ... ON CONFLICT (uri) DO UPDATE`` per batch that only touches rows with a differing column;
+    rows without a ``content_hash`` rely on that column-by-column comparison alone.
+
+    The statements run inside the caller's transaction; committing or rolling back is left to the caller.
+
+    Args:
+        session: The session owning the transaction.
+        table: The table to upsert into, with unique ``uri`` and ``content_hash`` columns.
+        rows: Rows keyed by column name, all with the same keys. Rows sharing a URI are collapsed, last one wins.
+        batch_size: Number of rows per multi-row statement.
+
+    Returns:
+        Mapping of URI to row ID for every row, and counts of inserted, updated and unchanged rows.
+    """
+    unique_rows = list({row["uri"]: row for row in rows}.values())
+    row_ids: Dict[str, UUID] = {}
+    counts = {"inserted": 0, "updated": 0, "unchanged": 0}
+
+    for start in range(0, len(unique_rows), batch_size):
+        batch = unique_rows[start : start + batch_size]
+
+        stored_hashes: Dict[str, Optional[str]] = {}
+        for uri, row_id, content_hash in session.execute(
+            select(table.c.uri, table.c.id, table.c.content_hash).where(table.c.uri.in_([row["uri"] for row in batch]))
+        ).tuples():
+            row_ids[uri] = row_id
+            stored_hashes[uri] = content_hash
+        changed_rows = [
+            row
+            for row in batch
+            if row.get("content_hash") is None or stored_hashes.get(row["uri"]) != row["content_hash"]
+        ]
+        counts["unchanged"] += len(batch) - len(changed_rows)
+        if not changed_rows:
+            continue
+
+        stmt = insert(table).values(changed_rows)
+        update_columns = [key for key in changed_rows[0] if key not in ("id", "uri")]
+        set_: Dict[str, Any] = {key: stmt.excluded[key] for key in update_columns}
+        if "modified_at" in table.c and "modified_at" not in set_:
+            set_["modified_at"] = func.now()
+        changed = or_(*(table.c[key].is_distinct_from(stmt.excluded[key]) for key in update_columns))
+        upsert_stmt = stmt.on_conflict_do_update(index_elements=["uri"], set_=set_, where=changed).returning(
+            table.c.uri, table.c.id, literal_column("(xmax = 0)").label("inserted")
+        )
+        written = session.execute(upsert_stmt).all()
+        row_ids.update({row.uri: row.id for row in written})
+        inserted = sum(1 for row in written if row.inserted)
+        counts["inserted"] += inserted
+        counts["updated"] += len(written) - inserted
+        counts["unchanged"] += len(changed_rows) - len(written)
+
+    logger.debug("Bulk upserted %s: %s", table.name, counts)
+    return row_ids, counts
@@ -1,14 +1,21 @@
 import logging
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 from uuid import UUID
 
 from budmicroframe.shared.psql_service import CRUDMixin
-from sqlalchemy import func, or_, select
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import delete, exists, func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from .models import Engine, EngineCompatibility, EngineParserRule, EngineVersion
+from .models import (
+    Engine,
+    EngineCompatibility,
+    EngineParserRule,
+    EngineVersion,
+    engine_compatibility_architecture,
+    engine_compatibility_endpoint,
+)
 from .schemas import CompatibleEngine, DeviceArchitecture, ParserRuleType
 
 
@@ -80,6 +87,9 @@ class EngineCRUD(CRUDMixin[Engine, None, None]):
         - If an engine has a non-empty architectures list, match by architecture
         - If an engine has an empty architectures list, match by model endpoints (supported_endpoints)
 
+        Matching is served from the normalized ``engine_compatibility_architecture`` and
+        ``engine_compatibility_endpoint`` tables (see ``EngineCompatibilityCRUD.sync_match_index``).
+
         If engine, engine_version, or device_architecture are not provided, the method will find the latest
         compatible version for each engine and device architecture combination.
 
@@ -110,51 +120,27 @@ class EngineCRUD(CRUDMixin[Engine, None, None]):
         # Query 1: Architecture-based matching (engines with non-empty architectures list)
         arch_query = (
             session.query(*base_columns)
-            .select_from(EngineCompatibility)
-            .join(EngineVersion, EngineCompatibility.engine_version_id == EngineVersion.id)
+            .select_from(engine_compatibility_architecture)
+            .join(EngineVersion, engine_compatibility_architecture.c.engine_version_id == EngineVersion.id)
             .join(Engine, EngineVersion.engine_id == Engine.id)
-            .filter(
-                func.jsonb_array_length(
-                    func.cast(EngineCompatibility.architectures["architectures"], JSONB)
-                ) > 0
-            )
-            .filter(
-                func.lower(
-                    func.jsonb_extract_path_text(EngineCompatibility.architectures, "architectures")
-                ).like(
-                    f'%"{model_architecture_lower}"%'
-                )
-            )
+            .filter(engine_compatibility_architecture.c.architecture == model_architecture_lower)
         )
 
         # Query 2: Endpoint-based matching (engines with empty architectures list)
         endpoint_query = None
         if model_endpoints:
-            model_endpoints_lower = [ep.lower() for ep in model_endpoints]
-            endpoint_conditions = [
-                func.lower(
-                    func.jsonb_extract_path_text(EngineCompatibility.supported_endpoints, "endpoints")
-                ).like(
-                    f'%"{ep}"%'
-                )
-                for ep in model_endpoints_lower
-            ]
+            model_endpoints_lower = list({ep.lower() for ep in model_endpoints})
+            has_architectures = exists().where(
+                engine_compatibility_architecture.c.engine_version_id == EngineVersion.id
+            )
 
             endpoint_query = (
                 session.query(*base_columns)
-                .select_from(EngineCompatibility)
-                .join(EngineVersion, EngineCompatibility.engine_version_id == EngineVersion.id)
+                .select_from(engine_compatibility_endpoint)
+                .join(EngineVersion, engine_compatibility_endpoint.c.engine_version_id == EngineVersion.id)
                 .join(Engine, EngineVersion.engine_id == Engine.id)
-                .filter(
-                    or_(
-                        func.jsonb_array_length(
-                            func.cast(EngineCompatibility.architectures["architectures"], JSONB)
-                        ) == 0,
-                        EngineCompatibility.architectures["architectures"].is_(None),
-                    )
-                )
-                .filter(EngineCompatibility.supported_endpoints.isnot(None))
-                .filter(or_(*endpoint_conditions))
+                .filter(engine_compatibility_endpoint.c.endpoint.in_(model_endpoints_lower))
+                .filter(~has_architectures)
             )
 
         # Apply optional filters to both queries
@@ -195,7 +181,8 @@ class EngineCRUD(CRUDMixin[Engine, None, None]):
                     latest_versions, (EngineVersion.id == latest_versions.c.id) & (latest_versions.c.rn == 1)
                 )
 
-        # Combine queries with UNION if endpoint query exists
+        # Combine queries with UNION if endpoint query exists (UNION also collapses versions that
+        # match several of the requested endpoints into a single row)
         query = arch_query.union(endpoint_query) if endpoint_query is not None else arch_query
 
         # Execute query and convert results to dictionaries
@@ -335,3 +322,66 @@ class EngineCompatibilityCRUD(CRUDMixin[EngineCompatibility, None, None]):
         CRUDMixin constructor with the EngineCompatibility model.
         """
         super().__init__(self.__model__)
+
+    @staticmethod
+    def _extract_match_values(data: Optional[Dict[str, Any]], key: str) -> Set[str]:
+        """Return the lower-cased, de-duplicated string values stored under ``key`` of a JSONB column."""
+        if not isinstance(data, dict):
+            return set()
+        values = data.get(key) or []
+        if not isinstance(values, list):
+            return set()
+        return {value.strip().lower() for value in values if isinstance(value, str) and value.strip()}
+
+    def sync_match_index(
+        self,
+        engine_version_id: UUID,
+        architectures: Optional[Dict[str, Any]],
+        supported_endpoints: Optional[Dict[str, Any]],
+        session: Optional[Session] = None,
+    ) -> None:
+        """Rebuild the normalized architecture and endpoint lookup rows for an engine version.
+
+        Must be called whenever ``architectures`` or ``supported_endpoints`` of an engine compatibility
+        is written, so that ``EngineCRUD.get_compatible_engines`` can answer with index lookups.
+
+        Args:
+            engine_version_id (UUID): The engine version the compatibility belongs to.
+            architectures (Optional[Dict[str, Any]]): The ``{"architectures": [...]}`` payload.
+            supported_endpoints (Optional[Dict[str, Any]]): The ``{"endpoints": [...]}`` payload.
+            session (Optional[Session], optional): SQLAlchemy session to use. If None, a new session will be created.
+        """
+        _session = session or self.get_session()
+        try:
+            architecture_rows = [
+                {"architecture": architecture, "engine_version_id": engine_version_id}
+                for architecture in sorted(self._extract_match_values(architectures, "architectures"))
+            ]
+            endpoint_rows = [
+                {"endpoint": endpoint, "engine_version_id": engine_version_id}
+                for endpoint in sorted(self._extract_match_values(supported_endpoints, "endpoints"))
+            ]
+
+            _session.execute(
+                delete(engine_compatibility_architecture).where(
+                    engine_compatibility_architecture.c.engine_version_id == engine_version_id
+                )
+            )
+            _session.execute(
+                delete(engine_compatibility_endpoint).where(
+                    engine_compatibility_endpoint.c.engine_version_id == engine_version_id
+                )
+            )
+            if architecture_rows:
+                _session.execute(
+                    insert(engine_compatibility_architecture).values(architecture_rows).on_conflict_do_nothing()
+                )
+            if endpoint_rows:
+                _session.execute(insert(engine_compatibility_endpoint).values(endpoint_rows).on_conflict_do_nothing())
+            _session.commit()
+        except SQLAlchemyError as e:
+            _session.rollback()
+            logger.exception(f"Failed to sync compatibility match index for engine version {engine_version_id}: {e}")
+            raise ValueError("Failed to sync engine compatibility match index") from e
+        finally:
+            self.cleanup_session(_session if session is None else None)
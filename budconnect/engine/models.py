@@ -3,9 +3,10 @@ from uuid import uuid4
 
 from budmicroframe.commons import logging
 from budmicroframe.shared.psql_service import PSQLBase, TimestampMixin
-from sqlalchemy import Boolean, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Column, Enum, ForeignKey, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.schema import Table
 
 from budconnect.engine.schemas import DeviceArchitecture, ParserMatchType, ParserRuleType
 from budconnect.model.models import engine_version_provider
@@ -119,6 +120,36 @@ class EngineCompatibility(PSQLBase, TimestampMixin):
         return f"<EngineCompatibility(id={self.id}, engine_version_id={self.engine_version_id})>"
 
 
+# Normalized lookup tables derived from EngineCompatibility.architectures / supported_endpoints.
+# Values are stored lower-cased so compatibility checks are plain index lookups instead of
+# LIKE scans over the serialized JSONB. Rows are rebuilt by EngineCompatibilityCRUD.sync_match_index.
+engine_compatibility_architecture = Table(
+    "engine_compatibility_architecture",
+    PSQLBase.metadata,
+    Column("architecture", String, primary_key=True),
+    Column(
+        "engine_version_id",
+        UUID,
+        ForeignKey("engine_compatibility.engine_version_id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    ),
+)
+
+engine_compatibility_endpoint = Table(
+    "engine_compatibility_endpoint",
+    PSQLBase.metadata,
+    Column("endpoint", String, primary_key=True),
+    Column(
+        "engine_version_id",
+        UUID,
+        ForeignKey("engine_compatibility.engine_version_id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    ),
+)
+
+
 class EngineParserRule(PSQLBase, TimestampMixin):
     """Rule for selecting a parser based on model metadata for a specific engine.
 
@@ -0,0 +1,280 @@
+"""Precompiled matching of model identifiers against engine parser rules.
+
+A ``ParserRuleMatcher`` is built once per engine from its enabled parser rules and answers both the
+TOOL and REASONING lookup for a model URI in one call:
+
+- EXACT rules live in a dict keyed by pattern.
+- PREFIX rules live in a character trie; walking the URI once visits every matching prefix.
+- REGEX rules are combined into one alternation per rule type, ordered by (priority, id) so the
+  first alternative that matches is the highest priority rule. Patterns with backreferences are
+  evaluated one by one instead, since wrapping them in the alternation renumbers their groups.
+
+For every rule type the winner is the candidate with the lowest (priority, id) across the three
+structures, which is the same rule the former linear scan over the sorted rule list returned.
+"""
+
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Tuple
+from uuid import UUID
+
+from budconnect.commons.cache import catalog_generation
+from budconnect.commons.config import app_settings
+
+from .schemas import ParserMatchType, ParserRuleType
+
+
+logger = logging.getLogger(__name__)
+
+_RULE_TYPES = (ParserRuleType.TOOL, ParserRuleType.REASONING)
+
+# Numbered (\1) or named ((?P=name)) backreference that is not itself escaped
+_BACKREFERENCE = re.compile(r"(?<!\\)(?:\\\\)*\\[1-9]|\(\?P=")
+
+
+def validate_rule_pattern(match_type: Any, pattern: Optional[str]) -> None:
+    """Validate that a REGEX parser rule pattern compiles.
+
+    Args:
+        match_type: The rule match type (enum or its string value).
+        pattern: The rule pattern.
+
+    Raises:
+        ValueError: If the rule is a REGEX rule and the pattern is not a valid regular expression.
+    """
+    match_value = match_type.value if isinstance(match_type, ParserMatchType) else match_type
+    if match_value != ParserMatchType.REGEX.value or pattern is None:
+        return
+    try:
+        re.compile(pattern)
+    except re.error as exc:
+        raise ValueError(f"Invalid regex pattern '{pattern}': {exc}") from exc
+
+
+@dataclass(frozen=True)
+class CompiledParserRule:
+    """Immutable snapshot of the parser rule fields needed when applying a match."""
+
+    id: UUID
+    engine_id: UUID
+    rule_type: ParserRuleType
+    match_type: ParserMatchType
+    pattern: str
+    priority: int
+    parser_type: Optional[str]
+    chat_template: Optional[str]
+    notes: Optional[str]
+
+    @property
+    def sort_key(self) -> Tuple[int, str]:
+        """Ordering used to break ties between matching rules."""
+        return (self.priority, str(self.id))
+
+    @classmethod
+    def from_rule(cls, rule: Any) -> "CompiledParserRule":
+        """Build a snapshot from an ``EngineParserRule`` row."""
+        return cls(
+            id=rule.id,
+            engine_id=rule.engine_id,
+            rule_type=ParserRuleType(getattr(rule.rule_type, "value", rule.rule_type)),
+            match_type=ParserMatchType(getattr(rule.match_type, "value", rule.match_type)),
+            pattern=rule.pattern,
+            priority=rule.priority or 0,
+            parser_type=rule.parser_type,
+            chat_template=rule.chat_template,
+            notes=rule.notes,
+        )
+
+
+def _better(current: Optional[CompiledParserRule], candidate: CompiledParserRule) -> CompiledParserRule:
+    return candidate if current is None or candidate.sort_key < current.sort_key else current
+
+
+@dataclass
+class _TrieNode:
+    children: Dict[str, "_TrieNode"] = field(default_factory=dict)
+    best: Dict[ParserRuleType, CompiledParserRule] = field(default_factory=dict)
+
+
+class _RegexGroup:
+    """REGEX rules of one rule type compiled into a single alternation."""
+
+    def __init__(self, rules: List[CompiledParserRule]) -> None:
+        self.rules = sorted(rules, key=lambda r: r.sort_key)
+        self.combined: Optional[Pattern[str]] = None
+        self.group_rules: Dict[int, CompiledParserRule] = {}
+        self.fallback: List[Tuple[Pattern[str], CompiledParserRule]] = []
+
+        compilable = []
+        for rule in self.rules:
+            try:
+                compiled = re.compile(rule.pattern)
+            except re.error as exc:
+                logger.warning("Skipping parser rule %s with invalid regex pattern: %s", rule.id, exc)
+                continue
+            if _BACKREFERENCE.search(rule.pattern):
+                self.fallback.append((compiled, rule))
+            else:
+                compilable.append((compiled, rule))
+        if not compilable:
+            return
+
+        alternation = "|".join(f"(?P<_r{index}>{rule.pattern})" for index, (_, rule) in enumerate(compilable))
+        try:
+            combined = re.compile(alternation)
+        except re.error:
+            # Patterns with inline global flags or clashing group names cannot be combined; evaluate
+            # them one by one in priority order instead.
+            self.fallback = sorted(self.fallback + compilable, key=lambda item: item[1].sort_key)
+            return
+
+        self.combined = combined
+        self.group_rules = {combined.groupindex[f"_r{index}"]: rule for index, (_, rule) in enumerate(compilable)}
+
+    def match(self, model_identifier: str) -> Optional[CompiledParserRule]:
+        best: Optional[CompiledParserRule] = None
+        if self.combined is not None:
+            matched = self.combined.match(model_identifier)
+            # The wrapping group closes after any group nested in the user pattern, so lastindex
+            # always points at the alternative that matched.
+            if matched and matched.lastindex:
+                best = self.group_rules.get(matched.lastindex)
+
+        for compiled, rule in self.fallback:
+            if best is not None and rule.sort_key >= best.sort_key:
+                break
+            if compiled.match(model_identifier):
+                return rule
+        return best
+
+
+class ParserRuleMatcher:
+    """Compiled parser rule set of a single engine."""
+
+    def __init__(self, rules: Iterable[Any]) -> None:
+        """Compile the enabled rules.
+
+        Args:
+            rules: ``EngineParserRule`` rows (or ``CompiledParserRule`` snapshots) of one engine.
+        """
+        self._exact: Dict[str, Dict[ParserRuleType, CompiledParserRule]] = {}
+        self._prefix_root = _TrieNode()
+        regex_rules: Dict[ParserRuleType, List[CompiledParserRule]] = {rule_type: [] for rule_type in _RULE_TYPES}
+
+        for rule in rules:
+            if not getattr(rule, "enabled", True) or rule.pattern is None:
+                continue
+            compiled = rule if isinstance(rule, CompiledParserRule) else CompiledParserRule.from_rule(rule)
+
+            if compiled.match_type == ParserMatchType.EXACT:
+                by_type = self._exact.setdefault(compiled.pattern, {})
+                by_type[compiled.rule_type] = _better(by_type.get(compiled.rule_type), compiled)
+            elif compiled.match_type == ParserMatchType.PREFIX:
+                node = self._prefix_root
+                for char in compiled.pattern:
+                    node = node.children.setdefault(char, _TrieNode())
+                node.best[compiled.rule_type] = _better(node.best.get(compiled.rule_type), compiled)
+            elif compiled.match_type == ParserMatchType.REGEX:
+                regex_rules[compiled.rule_type].append(compiled)
+
+        self._regex = {rule_type: _RegexGroup(rules) for rule_type, rules in regex_rules.items() if rules}
+
+    def match(self, model_identifier: str) -> Dict[ParserRuleType, Optional[CompiledParserRule]]:
+        """Return the winning TOOL and REASONING rule for a model identifier.
+
+        Args:
+            model_identifier: The model URI to match.
+
+        Returns:
+            A mapping of rule type to the matching rule, or None when no rule of that type matches.
+        """
+        best: Dict[ParserRuleType, Optional[CompiledParserRule]] = dict.fromkeys(_RULE_TYPES)
+
+        def consider(candidates: Dict[ParserRuleType, CompiledParserRule]) -> None:
+            for rule_type, candidate in candidates.items():
+                best[rule_type] = _better(best[rule_type], candidate)
+
+        consider(self._exact.get(model_identifier, {}))
+
+        node = self._prefix_root
+        consider(node.best)
+        for char in model_identifier:
+            child = node.children.get(char)
+            if child is None:
+                break
+            node = child
+            consider(node.best)
+
+        for rule_type, group in self._regex.items():
+            candidate = group.match(model_identifier)
+            if candidate is not None:
+                best[rule_type] = _better(best[rule_type], candidate)
+
+        return best
+
+
+class ParserRuleMatcherRegistry:
+    """Per-engine cache of compiled matchers, rebuilt after any catalog write and once their TTL expired.
+
+    The catalog generation only moves on writes made by this process, so the TTL bounds how long a
+    replica keeps serving parser rules changed through another one.
+    """
+
+    def __init__(self, ttl: Optional[float] = None) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            ttl: Time to live of a compiled matcher in seconds. Defaults to
+                ``COMPATIBILITY_CACHE_TTL_SECONDS``; zero or less disables caching.
+        """
+        self.ttl = app_settings.compatibility_cache_ttl_seconds if ttl is None else ttl
+        self._lock = threading.Lock()
+        self._matchers: Dict[UUID, Tuple[float, ParserRuleMatcher]] = {}
+        self._generation = catalog_generation.value
+
+    def _sync_generation(self) -> None:
+        current = catalog_generation.value
+        if current != self._generation:
+            self._matchers.clear()
+            self._generation = current
+
+    def get_many(self, engine_ids: Iterable[UUID]) -> Tuple[Dict[UUID, ParserRuleMatcher], int]:
+        """Return the cached matchers for the given engines and the generation they belong to."""
+        with self._lock:
+            self._sync_generation()
+            expired_before = time.monotonic() - self.ttl
+            matchers = {}
+            for engine_id in engine_ids:
+                entry = self._matchers.get(engine_id)
+                if entry is None:
+                    continue
+                if entry[0] <= expired_before:
+                    del self._matchers[engine_id]
+                    continue
+                matchers[engine_id] = entry[1]
+            return matchers, self._generation
+
+    def build(self, engine_id: UUID, rules: Iterable[Any], generation: int) -> ParserRuleMatcher:
+        """Compile and store the matcher for an engine.
+
+        The matcher is only cached if no catalog write happened since ``generation`` was read.
+        """
+        matcher = ParserRuleMatcher(rules)
+        if self.ttl <= 0:
+            return matcher
+        with self._lock:
+            self._sync_generation()
+            if generation == self._generation:
+                self._matchers[engine_id] = (time.monotonic(), matcher)
+        return matcher
+
+    def clear(self) -> None:
+        """Drop every compiled matcher."""
+        with self._lock:
+            self._matchers.clear()
+
+
+parser_rule_matchers = ParserRuleMatcherRegistry()
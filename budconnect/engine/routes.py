@@ -20,10 +20,14 @@ from uuid import UUID
 from budmicroframe.commons import logging
 from budmicroframe.commons.exceptions import ClientException
 from budmicroframe.commons.schemas import ErrorResponse
-from fastapi import APIRouter, Query, status
+from fastapi import APIRouter, Query, Request, Response, status
 
+from ..commons.conditional import not_modified_response
+from ..commons.executor import run_sync
+from ..sync.services import SyncService
 from . import models, schemas
 from .schemas import (
+    CompatibilityCacheStatsResponse,
     CompatibleEnginesResponse,
     DeviceArchitecture,
     EngineCompatibilityCreate,
@@ -74,7 +78,7 @@ def _build_parser_rule_schema(rule: models.EngineParserRule) -> schemas.EnginePa
 async def create_engine(engine_data: EngineCreate) -> Union[EngineResponse, ErrorResponse]:
     """Create a new engine."""
     try:
-        engine = EngineService.create_engine(engine_data)
+        engine = await run_sync(EngineService.create_engine, engine_data)
         engine_schema = schemas.Engine(
             id=engine.id,
             name=engine.name,
@@ -104,7 +108,7 @@ async def get_engines(
 ) -> Union[EngineListResponse, ErrorResponse]:
     """Get all engines with pagination."""
     try:
-        result = EngineService.get_engines(page=page, page_size=page_size, search=search)
+        result = await run_sync(EngineService.get_engines, page=page, page_size=page_size, search=search)
         response = EngineListResponse(
             message="Engines retrieved successfully",
             code=status.HTTP_200_OK,
@@ -147,11 +151,12 @@ async def get_compatible_engines(
             endpoints_list = [ep.strip() for ep in model_endpoints.split(",")]
 
         # Cast Optional types to their required types as expected by the service
-        compatible_engines = EngineService.get_compatible_engines(
+        compatible_engines = await run_sync(
+            EngineService.get_compatible_engines,
             model_architecture=model_architecture,
-            device_architecture=device_architecture,  # type: ignore
-            engine_version=engine_version,  # type: ignore
-            engine=engine,  # type: ignore
+            device_architecture=device_architecture,
+            engine_version=engine_version,
+            engine=engine,
             model_uri=model_uri,
             model_endpoints=endpoints_list,
         )
@@ -171,13 +176,23 @@ async def get_compatible_engines(
     return response.to_http_response()
 
 
-@engine_router.get("/get-latest-engine-version")
+@engine_router.get("/get-latest-engine-version", response_model=Union[LatestEngineVersionResponse, ErrorResponse])
 async def get_latest_engine_version(
-    device_architecture: DeviceArchitecture, engine: str
-) -> Union[LatestEngineVersionResponse, ErrorResponse]:
-    """Get the latest engine version for a device architecture."""
+    device_architecture: DeviceArchitecture, engine: str, request: Request
+) -> Union[LatestEngineVersionResponse, ErrorResponse, Response]:
+    """Get the latest engine version for a device architecture.
+
+    Supports If-None-Match / If-Modified-Since against the catalog version.
+    """
     try:
-        latest_engine = EngineService.get_latest_engine_version(device_architecture, engine)
+        validator = await run_sync(
+            SyncService.get_catalog_validator, "latest-engine-version", device_architecture.value, engine
+        )
+        not_modified = not_modified_response(request, *validator)
+        if not_modified is not None:
+            return not_modified
+
+        latest_engine = await run_sync(EngineService.get_latest_engine_version, device_architecture, engine)
 
         response = LatestEngineVersionResponse(
             version=latest_engine.version,
@@ -194,12 +209,24 @@ async def get_latest_engine_version(
     return response.to_http_response()
 
 
+@engine_router.get("/compatibility-cache/stats")
+async def get_compatibility_cache_stats() -> Union[CompatibilityCacheStatsResponse, ErrorResponse]:
+    """Get hit/miss/eviction counters of the engine compatibility cache."""
+    response = CompatibilityCacheStatsResponse(
+        stats=EngineService.get_compatibility_cache_stats(),
+        message="Compatibility cache stats fetched successfully",
+        code=status.HTTP_200_OK,
+        object="engine.compatibility_cache",
+    )
+    return response.to_http_response()
+
+
 # Parameterized routes come AFTER specific routes
 @engine_router.get("/{engine_id}")
 async def get_engine(engine_id: UUID) -> Union[EngineResponse, ErrorResponse]:
     """Get an engine by ID."""
     try:
-        engine = EngineService.get_engine(engine_id)
+        engine = await run_sync(EngineService.get_engine, engine_id)
         engine_schema = schemas.Engine(
             id=engine.id,
             name=engine.name,
@@ -225,7 +252,7 @@ async def get_engine(engine_id: UUID) -> Union[EngineResponse, ErrorResponse]:
 async def update_engine(engine_id: UUID, engine_data: EngineUpdate) -> Union[EngineResponse, ErrorResponse]:
     """Update an engine."""
     try:
-        engine = EngineService.update_engine(engine_id, engine_data)
+        engine = await run_sync(EngineService.update_engine, engine_id, engine_data)
         engine_schema = schemas.Engine(
             id=engine.id,
             name=engine.name,
@@ -251,7 +278,7 @@ async def update_engine(engine_id: UUID, engine_data: EngineUpdate) -> Union[Eng
 async def delete_engine(engine_id: UUID) -> Union[EngineResponse, ErrorResponse]:
     """Delete an engine."""
     try:
-        EngineService.delete_engine(engine_id)
+        await run_sync(EngineService.delete_engine, engine_id)
         response = EngineResponse(
             message="Engine deleted successfully",
             code=status.HTTP_200_OK,
@@ -272,7 +299,7 @@ async def delete_engine(engine_id: UUID) -> Union[EngineResponse, ErrorResponse]
 async def create_engine_version(version_data: EngineVersionCreate) -> Union[EngineVersionResponse, ErrorResponse]:
     """Create a new engine version."""
     try:
-        version = EngineService.create_engine_version(version_data)
+        version = await run_sync(EngineService.create_engine_version, version_data)
         version_schema = schemas.EngineVersion(
             id=version.id,
             version=version.version,
@@ -305,7 +332,7 @@ async def get_engine_versions(
 ) -> Union[EngineVersionListResponse, ErrorResponse]:
     """Get engine versions with pagination."""
     try:
-        result = EngineService.get_engine_versions(engine_id=engine_id, page=page, page_size=page_size)
+        result = await run_sync(EngineService.get_engine_versions, engine_id=engine_id, page=page, page_size=page_size)
         response = EngineVersionListResponse(
             message="Engine versions retrieved successfully",
             code=status.HTTP_200_OK,
@@ -322,7 +349,7 @@ async def get_engine_versions(
 async def get_engine_version(version_id: UUID) -> Union[EngineVersionResponse, ErrorResponse]:
     """Get an engine version by ID."""
     try:
-        version = EngineService.get_engine_version(version_id)
+        version = await run_sync(EngineService.get_engine_version, version_id)
         version_schema = schemas.EngineVersion(
             id=version.id,
             version=version.version,
@@ -353,7 +380,7 @@ async def update_engine_version(
 ) -> Union[EngineVersionResponse, ErrorResponse]:
     """Update an engine version."""
     try:
-        version = EngineService.update_engine_version(version_id, version_data)
+        version = await run_sync(EngineService.update_engine_version, version_id, version_data)
         version_schema = schemas.EngineVersion(
             id=version.id,
             version=version.version,
@@ -382,7 +409,7 @@ async def update_engine_version(
 async def delete_engine_version(version_id: UUID) -> Union[EngineVersionResponse, ErrorResponse]:
     """Delete an engine version."""
     try:
-        EngineService.delete_engine_version(version_id)
+        await run_sync(EngineService.delete_engine_version, version_id)
         response = EngineVersionResponse(
             message="Engine version deleted successfully",
             code=status.HTTP_200_OK,
@@ -405,7 +432,7 @@ async def create_engine_compatibility(
 ) -> Union[EngineCompatibilityResponse, ErrorResponse]:
     """Create a new engine compatibility."""
     try:
-        compatibility = EngineService.create_engine_compatibility(compatibility_data)
+        compatibility = await run_sync(EngineService.create_engine_compatibility, compatibility_data)
         compatibility_schema = schemas.EngineCompatibility(
             id=compatibility.id,
             engine_version_id=compatibility.engine_version_id,
@@ -439,7 +466,7 @@ async def update_engine_compatibility(
 ) -> Union[EngineCompatibilityResponse, ErrorResponse]:
     """Update an engine compatibility."""
     try:
-        compatibility = EngineService.update_engine_compatibility(compatibility_id, compatibility_data)
+        compatibility = await run_sync(EngineService.update_engine_compatibility, compatibility_id, compatibility_data)
         compatibility_schema = schemas.EngineCompatibility(
             id=compatibility.id,
             engine_version_id=compatibility.engine_version_id,
@@ -471,7 +498,7 @@ async def update_engine_compatibility(
 async def delete_engine_compatibility(compatibility_id: UUID) -> Union[EngineCompatibilityResponse, ErrorResponse]:
     """Delete an engine compatibility."""
     try:
-        EngineService.delete_engine_compatibility(compatibility_id)
+        await run_sync(EngineService.delete_engine_compatibility, compatibility_id)
         response = EngineCompatibilityResponse(
             message="Engine compatibility deleted successfully",
             code=status.HTTP_200_OK,
@@ -499,7 +526,7 @@ async def list_parser_rules(
         rule_type: Optional filter for rule type (tool or reasoning).
     """
     try:
-        rules = EngineService.list_parser_rules(engine_id, rule_type=rule_type)
+        rules = await run_sync(EngineService.list_parser_rules, engine_id, rule_type=rule_type)
         rule_schemas = [_build_parser_rule_schema(rule) for rule in rules]
 
         response = EngineParserRuleListResponse(
@@ -529,7 +556,7 @@ async def create_parser_rule(
     - reasoning: Requires parser_type, chat_template NOT allowed
     """
     try:
-        rule = EngineService.create_parser_rule(rule_data)
+        rule = await run_sync(EngineService.create_parser_rule, rule_data)
         response = EngineParserRuleResponse(
             message="Parser rule created successfully",
             code=status.HTTP_201_CREATED,
@@ -552,7 +579,7 @@ async def update_parser_rule(
 ) -> Union[EngineParserRuleResponse, ErrorResponse]:
     """Update an existing parser rule."""
     try:
-        rule = EngineService.update_parser_rule(rule_id, rule_data)
+        rule = await run_sync(EngineService.update_parser_rule, rule_id, rule_data)
         response = EngineParserRuleResponse(
             message="Parser rule updated successfully",
             code=status.HTTP_200_OK,
@@ -573,7 +600,7 @@ async def update_parser_rule(
 async def delete_parser_rule(rule_id: UUID) -> Union[EngineParserRuleResponse, ErrorResponse]:
     """Delete a parser rule."""
     try:
-        EngineService.delete_parser_rule(rule_id)
+        await run_sync(EngineService.delete_parser_rule, rule_id)
         response = EngineParserRuleResponse(
             message="Parser rule deleted successfully",
             code=status.HTTP_200_OK,
@@ -239,3 +239,7 @@ class EngineVersionResponse(SuccessResponse):
 
 class EngineCompatibilityResponse(SuccessResponse):
     compatibility: Optional[EngineCompatibility] = None
+
+
+class CompatibilityCacheStatsResponse(SuccessResponse):
+    stats: Dict[str, Any]
@@ -1,11 +1,12 @@
 import logging
-import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, cast
 from uuid import UUID
 
 from budmicroframe.commons.exceptions import ClientException
 from sqlalchemy.orm import Session
 
+from budconnect.commons.cache import GenerationalTTLCache, catalog_generation
+from budconnect.commons.config import app_settings
 from budconnect.engine.crud import (
     EngineCompatibilityCRUD,
     EngineCRUD,
@@ -16,7 +17,9 @@ from budconnect.engine.models import Engine, EngineCompatibility, EngineParserRu
 from budconnect.model.crud import ModelArchitectureClassCRUD, ModelInfoCRUD
 from budconnect.model.models import engine_version_model_info, engine_version_provider
 
+from .parser_matcher import ParserRuleMatcher, parser_rule_matchers, validate_rule_pattern
 from .schemas import (
+    CompatibleEngine,
     DeviceArchitecture,
     EngineCompatibilityCreate,
     EngineCompatibilityUpdate,
@@ -40,6 +43,13 @@ from .schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Results of get_compatible_engines, flushed whenever the catalog generation is bumped
+compatibility_cache: GenerationalTTLCache[List[CompatibleEngine]] = GenerationalTTLCache(
+    "engine_compatibility",
+    maxsize=app_settings.compatibility_cache_max_size,
+    ttl=app_settings.compatibility_cache_ttl_seconds,
+)
+
 
 class EngineService:
     engine_crud = EngineCRUD()
@@ -51,7 +61,9 @@ class EngineService:
         """Create a new engine."""
         try:
             engine = Engine(name=engine_data.name)
-            return EngineService.engine_crud.insert(engine, session=session)
+            created = EngineService.engine_crud.insert(engine, session=session)
+            catalog_generation.bump("engine created")
+            return created
         except Exception as e:
             raise ClientException(f"Failed to create engine: {str(e)}") from e
 
@@ -101,6 +113,7 @@ class EngineService:
 
         if update_data:
             EngineService.engine_crud.update(data=update_data, conditions={"id": engine_id}, session=session)
+            catalog_generation.bump("engine updated")
 
         return EngineService.get_engine(engine_id, session=session)
 
@@ -143,6 +156,7 @@ class EngineService:
             if session is None:
                 _session.commit()
 
+            catalog_generation.bump("engine deleted")
             return True
         except Exception as e:
             if session is None:
@@ -165,7 +179,9 @@ class EngineService:
                 device_architecture=version_data.device_architecture,
                 container_image=version_data.container_image,
             )
-            return EngineService.engine_version_crud.insert(version, session=session)
+            created = EngineService.engine_version_crud.insert(version, session=session)
+            catalog_generation.bump("engine version created")
+            return created
         except Exception as e:
             raise ClientException(f"Failed to create engine version: {str(e)}") from e
 
@@ -224,6 +240,7 @@ class EngineService:
 
         if update_data:
             EngineService.engine_version_crud.update(data=update_data, conditions={"id": version_id}, session=session)
+            catalog_generation.bump("engine version updated")
 
         return EngineService.get_engine_version(version_id, session=session)
 
@@ -254,6 +271,7 @@ class EngineService:
             if session is None:
                 _session.commit()
 
+            catalog_generation.bump("engine version deleted")
             return True
         except Exception as e:
             if session is None:
@@ -276,8 +294,19 @@ class EngineService:
                 engine_version_id=compatibility_data.engine_version_id,
                 architectures=compatibility_data.architectures,
                 features=compatibility_data.features,
+                supported_tool_calling_parser_types=compatibility_data.supported_tool_calling_parser_types,
+                supported_reasoning_parsers=compatibility_data.supported_reasoning_parsers,
+                supported_endpoints=compatibility_data.supported_endpoints,
             )
-            return EngineService.engine_compatibility_crud.insert(compatibility, session=session)
+            created = EngineService.engine_compatibility_crud.insert(compatibility, session=session)
+            EngineService.engine_compatibility_crud.sync_match_index(
+                compatibility_data.engine_version_id,
+                compatibility_data.architectures,
+                compatibility_data.supported_endpoints,
+                session=session,
+            )
+            catalog_generation.bump("engine compatibility created")
+            return created
         except Exception as e:
             raise ClientException(f"Failed to create engine compatibility: {str(e)}") from e
 
@@ -297,11 +326,27 @@ class EngineService:
             update_data["architectures"] = compatibility_data.architectures
         if compatibility_data.features is not None:
             update_data["features"] = compatibility_data.features
+        if compatibility_data.supported_tool_calling_parser_types is not None:
+            update_data["supported_tool_calling_parser_types"] = compatibility_data.supported_tool_calling_parser_types
+        if compatibility_data.supported_reasoning_parsers is not None:
+            update_data["supported_reasoning_parsers"] = compatibility_data.supported_reasoning_parsers
+        if compatibility_data.supported_endpoints is not None:
+            update_data["supported_endpoints"] = compatibility_data.supported_endpoints
 
         if update_data:
             EngineService.engine_compatibility_crud.update(
                 data=update_data, conditions={"id": compatibility_id}, session=session
             )
+            if "architectures" in update_data or "supported_endpoints" in update_data:
+                EngineService.engine_compatibility_crud.sync_match_index(
+                    cast(UUID, compatibility.engine_version_id),
+                    update_data.get("architectures", cast(Optional[Dict[str, Any]], compatibility.architectures)),
+                    update_data.get(
+                        "supported_endpoints", cast(Optional[Dict[str, Any]], compatibility.supported_endpoints)
+                    ),
+                    session=session,
+                )
+            catalog_generation.bump("engine compatibility updated")
 
         return session.query(EngineCompatibility).filter(EngineCompatibility.id == compatibility_id).first()
 
@@ -315,6 +360,7 @@ class EngineService:
             raise ClientException(f"Engine compatibility with ID {compatibility_id} not found")
 
         EngineService.engine_compatibility_crud.delete(conditions={"id": compatibility.id}, session=session)
+        catalog_generation.bump("engine compatibility deleted")
         return True
 
     @staticmethod
@@ -402,8 +448,15 @@ class EngineService:
                 if payload.get("chat_template"):
                     raise ClientException("chat_template is not allowed for reasoning rules")
 
+            try:
+                validate_rule_pattern(payload.get("match_type"), payload.get("pattern"))
+            except ValueError as e:
+                raise ClientException(str(e)) from e
+
             logger.info(f"Final Rule payload {payload}")
-            return EngineParserRuleCRUD().insert(payload, session=session)
+            created = EngineParserRuleCRUD().insert(payload, session=session)
+            catalog_generation.bump("parser rule created")
+            return created
         except ClientException:
             raise
         except Exception as e:
@@ -481,10 +534,25 @@ class EngineService:
                 if final_chat_template:
                     raise ClientException("chat_template is not allowed for reasoning rules")
 
+            # Reject invalid regular expressions up front instead of failing on every match
+            final_match_type = (
+                update_payload.get("match_type") if "match_type" in update_payload else existing_rule.match_type
+            )
+            final_pattern = (
+                update_payload.get("pattern")
+                if "pattern" in update_payload
+                else cast(Optional[str], existing_rule.pattern)
+            )
+            try:
+                validate_rule_pattern(final_match_type, final_pattern)
+            except ValueError as e:
+                raise ClientException(str(e)) from e
+
             try:
                 EngineParserRuleCRUD().update(update_payload, {"id": rule_id}, session=session)
             except Exception as e:
                 raise ClientException(f"Failed to update parser rule: {str(e)}") from e
+            catalog_generation.bump("parser rule updated")
 
         return EngineService.get_parser_rule(rule_id, session=session)
 
@@ -492,6 +560,7 @@ class EngineService:
     def delete_parser_rule(rule_id: UUID, session: Optional[Session] = None) -> bool:
         """Delete a parser rule."""
         EngineParserRuleCRUD().delete({"id": rule_id}, session=session)
+        catalog_generation.bump("parser rule deleted")
         return True
 
     @staticmethod
@@ -502,9 +571,62 @@ class EngineService:
         engine: str,
         model_uri: Optional[str] = None,
         model_endpoints: Optional[List[str]] = None,
-    ) -> EngineCompatibility:
+    ) -> List[CompatibleEngine]:
         """Check if a model architecture is compatible with a specific engine version and device architecture.
 
+        Results are served from ``compatibility_cache`` when possible. The cache is keyed on the request
+        arguments and flushed whenever the catalog generation changes (engine, version, compatibility or
+        parser rule writes, and seeder runs).
+
+        Args:
+            model_architecture (str): The architecture of the model to check.
+            device_architecture (DeviceArchitecture): The architecture of the device.
+            engine_version (str): The version of the engine.
+            engine (str): The name of the engine.
+            model_uri (Optional[str]): The model URI for precise capability lookup.
+            model_endpoints (Optional[List[str]]): List of model endpoint types (e.g., ["EMBEDDING", "CHAT"]).
+
+        Returns:
+            List[CompatibleEngine]: The compatible engines with tool calling and reasoning capabilities.
+
+        Raises:
+            ClientException: If the model architecture is not compatible.
+        """
+        cache_key = (
+            model_uri,
+            model_architecture,
+            device_architecture,
+            engine,
+            engine_version,
+            tuple(sorted(model_endpoints)) if model_endpoints else None,
+        )
+        cached = compatibility_cache.get(cache_key)
+        if cached is not None:
+            return [item.model_copy(deep=True) for item in cached]
+
+        generation = catalog_generation.value
+        compatible_engines = EngineService._resolve_compatible_engines(
+            model_architecture, device_architecture, engine_version, engine, model_uri, model_endpoints
+        )
+        compatibility_cache.set(cache_key, [item.model_copy(deep=True) for item in compatible_engines], generation)
+        return compatible_engines
+
+    @staticmethod
+    def get_compatibility_cache_stats() -> Dict[str, Any]:
+        """Return hit/miss/eviction counters of the compatibility cache."""
+        return compatibility_cache.stats()
+
+    @staticmethod
+    def _resolve_compatible_engines(
+        model_architecture: str,
+        device_architecture: DeviceArchitecture,
+        engine_version: str,
+        engine: str,
+        model_uri: Optional[str] = None,
+        model_endpoints: Optional[List[str]] = None,
+    ) -> List[CompatibleEngine]:
+        """Resolve compatible engines from the database, bypassing the cache.
+
         This method returns a list of compatible engines for a given model architecture, device architecture, and engine version.
 
         Args:
@@ -573,7 +695,7 @@ class EngineService:
                 message="Model architecture is not compatible with the given device architecture and engine version"
             )
 
-        parser_rules_by_engine: Dict[UUID, List[EngineParserRule]] = {}
+        matchers: Dict[UUID, ParserRuleMatcher] = {}
         if model_uri:
             engine_ids = {
                 engine_item.engine_id
@@ -581,21 +703,17 @@ class EngineService:
                 if engine_item.engine_id is not None
             }
             if engine_ids:
-                with EngineParserRuleCRUD() as parser_rule_crud:
-                    parser_rules_by_engine = parser_rule_crud.get_rules_for_engines(
-                        list(engine_ids), session=parser_rule_crud.session
-                    )
+                matchers = EngineService._get_parser_rule_matchers(engine_ids)
 
         # Enhance response with architecture capabilities and chat template
         for engine_item in compatible_engines:
             tool_rule = None
             reasoning_rule = None
-            if model_uri and engine_item.engine_id:
-                rules = parser_rules_by_engine.get(engine_item.engine_id, [])
-                # Match tool parser rule
-                tool_rule = EngineService._match_parser_rule(model_uri, rules, ParserRuleType.TOOL)
-                # Match reasoning parser rule
-                reasoning_rule = EngineService._match_parser_rule(model_uri, rules, ParserRuleType.REASONING)
+            if model_uri and engine_item.engine_id and engine_item.engine_id in matchers:
+                # Resolve tool and reasoning parser rules in one pass
+                matched_rules = matchers[engine_item.engine_id].match(model_uri)
+                tool_rule = matched_rules[ParserRuleType.TOOL]
+                reasoning_rule = matched_rules[ParserRuleType.REASONING]
 
             if model_info and model_info.tool_calling_parser_type:
                 engine_item.tool_calling_parser_type = model_info.tool_calling_parser_type
@@ -632,56 +750,28 @@ class EngineService:
         return compatible_engines
 
     @staticmethod
-    def _match_parser_rule(
-        model_identifier: str,
-        rules: List[EngineParserRule],
-        rule_type: Optional[ParserRuleType] = None,
-    ) -> Optional[EngineParserRule]:
-        """Select the first enabled parser rule that matches the provided model identifier.
+    def _get_parser_rule_matchers(engine_ids: Set[UUID]) -> Dict[UUID, ParserRuleMatcher]:
+        """Get compiled parser rule matchers for the given engines.
+
+        Matchers are compiled once per engine and reused until the next catalog write; only engines
+        without a cached matcher hit the database.
 
         Args:
-            model_identifier: The model URI to match against patterns.
-            rules: List of parser rules to evaluate.
-            rule_type: Optional filter for rule type (TOOL or REASONING).
+            engine_ids: IDs of the engines to get matchers for.
 
         Returns:
-            The first matching enabled rule, or None if no match.
+            Mapping of engine ID to its compiled matcher.
         """
-        if not rules:
-            return None
-
-        # Filter by rule_type if specified
-        if rule_type is not None:
-            rules = [r for r in rules if r.rule_type == rule_type]
-
-        if not rules:
-            return None
-
-        # Ensure deterministic ordering if the caller did not pre-sort
-        ordered_rules = sorted(
-            rules,
-            key=lambda r: (r.priority or 0, str(r.id)),
-        )
-
-        for rule in ordered_rules:
-            if not rule.enabled:
-                continue
-
-            if rule.match_type == ParserMatchType.EXACT and model_identifier == rule.pattern:
-                return rule
-
-            if rule.match_type == ParserMatchType.PREFIX and model_identifier.startswith(rule.pattern):
-                return rule
-
-            if rule.match_type == ParserMatchType.REGEX:
-                try:
-                    if re.match(rule.pattern, model_identifier):
-                        return rule
-                except re.error as exc:
-                    logger.warning("Invalid regex pattern for parser rule %s: %s", rule.id, exc)
-                    continue
-
-        return None
+        matchers, generation = parser_rule_matchers.get_many(engine_ids)
+        missing = [engine_id for engine_id in engine_ids if engine_id not in matchers]
+        if missing:
+            with EngineParserRuleCRUD() as parser_rule_crud:
+                rules_by_engine = parser_rule_crud.get_rules_for_engines(missing, session=parser_rule_crud.session)
+                for engine_id in missing:
+                    matchers[engine_id] = parser_rule_matchers.build(
+                        engine_id, rules_by_engine.get(engine_id, []), generation
+                    )
+        return matchers
 
     @staticmethod
     def get_latest_engine_version(
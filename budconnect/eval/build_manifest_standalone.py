@@ -49,7 +49,8 @@ logger = logging.getLogger(__name__)
 async def build_manifest(
     output_filename: str = "eval_manifest.json",
     enable_analysis: bool = False,
-    sample_size: Optional[int] = None
+    sample_size: Optional[int] = None,
+    max_parallel_datasets: Optional[int] = None
 ):
     """Build the eval manifest file.
 
@@ -57,6 +58,7 @@ async def build_manifest(
         output_filename: Name of the output file
         enable_analysis: Whether to enable LLM-based question analysis
         sample_size: Number of samples per dataset (overrides EVAL_SAMPLE_SIZE if provided)
+        max_parallel_datasets: Datasets processed concurrently (overrides EVAL_MAX_PARALLEL_DATASETS if provided)
     """
     # Get output directory from config
     data_dir = app_settings.base_dir / app_settings.eval_output_dir
@@ -69,6 +71,7 @@ async def build_manifest(
     logger.info(f"Output file: {output_path}")
     logger.info(f"Analysis enabled: {enable_analysis}")
     logger.info(f"Sample size: {sample_size or app_settings.eval_sample_size}")
+    logger.info(f"Parallel datasets: {max_parallel_datasets or app_settings.eval_max_parallel_datasets}")
     logger.info("=" * 80)
 
     try:
@@ -76,7 +79,8 @@ async def build_manifest(
         builder = EvalManifestBuilder(
             output_path=str(output_path),
             enable_analysis=enable_analysis,
-            sample_size=sample_size
+            sample_size=sample_size,
+            max_parallel_datasets=max_parallel_datasets
         )
 
         # Build the manifest
@@ -157,6 +161,9 @@ Examples:
   # Custom sample size (overrides EVAL_SAMPLE_SIZE env var)
   %(prog)s --sample-size 100
 
+  # Process up to 8 datasets at a time (overrides EVAL_MAX_PARALLEL_DATASETS env var)
+  %(prog)s --max-parallel-datasets 8
+
   # Enable debug logging
   %(prog)s --debug
         """
@@ -181,6 +188,13 @@ Examples:
         help='Number of samples to extract per dataset (overrides EVAL_SAMPLE_SIZE env var)'
     )
 
+    parser.add_argument(
+        '--max-parallel-datasets', '-p',
+        type=int,
+        default=None,
+        help='Number of datasets sampled and analyzed concurrently (overrides EVAL_MAX_PARALLEL_DATASETS env var)'
+    )
+
     parser.add_argument(
         '--debug', '-d',
         action='store_true',
@@ -198,7 +212,8 @@ Examples:
     exit_code = asyncio.run(build_manifest(
         output_filename=args.output,
         enable_analysis=args.enable_analysis,
-        sample_size=args.sample_size
+        sample_size=args.sample_size,
+        max_parallel_datasets=args.max_parallel_datasets
     ))
 
     sys.exit(exit_code)
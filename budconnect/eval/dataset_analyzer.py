@@ -14,12 +14,24 @@
 #  limitations under the License.
 #  -----------------------------------------------------------------------------
 
-"""Dataset analyzer module - analyzes dataset questions using LLM."""
+"""Dataset analyzer module - analyzes dataset questions using LLM.
 
+Questions of a dataset are analysed concurrently. ``AdaptiveConcurrency`` caps the in-flight LLM calls and
+halves the cap whenever the endpoint answers 429 or 5xx, growing it back one step at a time as calls succeed.
+Every successful answer is appended to a checkpoint file next to the final analysis, so a run that is
+interrupted resumes without asking the LLM again for the questions it already answered.
+"""
+
+import asyncio
+import hashlib
 import json
 import logging
+import os
+import random
+import time
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
@@ -29,6 +41,84 @@ from budconnect.commons.config import app_settings
 logger = logging.getLogger(__name__)
 
 
+# Status codes after which a request is retried and the concurrency cap is lowered
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class AdaptiveConcurrency:
+    """Additive-increase / multiplicative-decrease cap on in-flight LLM requests.
+
+    A throttled or failed response (429/5xx) halves the cap and, with a ``Retry-After`` hint, pauses every
+    new request until the hint expires. After as many consecutive successes as the current cap, the cap grows
+    by one until it is back at ``max_concurrency``. Create one per event loop.
+
+    Args:
+        max_concurrency: Upper bound of concurrent requests.
+    """
+
+    def __init__(self, max_concurrency: int) -> None:
+        """Initialize the limiter at its maximum concurrency."""
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = self.max_concurrency
+        self._in_flight = 0
+        self._successes = 0
+        self._resume_at = 0.0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """Wait for a free slot under the current cap and for any shared pause to end."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        delay = self._resume_at - asyncio.get_running_loop().time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def release(self, throttled: bool = False, retry_after: Optional[float] = None) -> None:
+        """Free a slot and adapt the cap to the outcome of the request.
+
+        Args:
+            throttled: Whether the endpoint answered 429/5xx or timed out.
+            retry_after: Seconds the endpoint asked clients to wait, if any.
+        """
+        async with self._condition:
+            self._in_flight -= 1
+            if throttled:
+                self.limit = max(1, self.limit // 2)
+                self._successes = 0
+                if retry_after:
+                    resume_at = asyncio.get_running_loop().time() + retry_after
+                    self._resume_at = max(self._resume_at, resume_at)
+                logger.info(f"LLM endpoint throttled, lowering analysis concurrency to {self.limit}")
+            else:
+                self._successes += 1
+                if self.limit < self.max_concurrency and self._successes >= self.limit:
+                    self.limit += 1
+                    self._successes = 0
+            self._condition.notify_all()
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _question_hash(question_text: str) -> str:
+    """Fingerprint a question so a checkpointed answer is only reused for the same text."""
+    return hashlib.sha256(question_text.encode("utf-8")).hexdigest()
+
+
 class DatasetAnalyzer:
     """Analyzes dataset questions using LLM to extract metadata about difficulty, skills, etc."""
 
@@ -38,6 +128,8 @@ class DatasetAnalyzer:
         model: Optional[str] = None,
         timeout: Optional[int] = None,
         output_dir: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
     ) -> None:
         """Initialize the dataset analyzer.
 
@@ -46,9 +138,15 @@ class DatasetAnalyzer:
             model: Model name to use (defaults to EVAL_LLM_MODEL from config)
             timeout: Timeout in seconds for API calls (defaults to EVAL_LLM_TIMEOUT from config)
             output_dir: Directory to save analysis results (defaults to budconnect/eval/data/analysis/)
+            concurrency: Maximum concurrent question analyses (defaults to EVAL_LLM_CONCURRENCY from config)
+            max_retries: Retries per question (defaults to EVAL_LLM_MAX_RETRIES from config)
         """
         self.llm_endpoint = llm_endpoint or app_settings.eval_llm_endpoint
         self.model = model or app_settings.eval_llm_model
+        self.concurrency = max(1, concurrency or app_settings.eval_llm_concurrency)
+        self.max_retries = max(0, max_retries if max_retries is not None else app_settings.eval_llm_max_retries)
+        self.backoff_base = app_settings.eval_llm_backoff_base_seconds
+        self.backoff_max = app_settings.eval_llm_backoff_max_seconds
         timeout_seconds = timeout or app_settings.eval_llm_timeout
         self.client = httpx.AsyncClient(timeout=float(timeout_seconds), follow_redirects=True)
 
@@ -105,14 +203,44 @@ class DatasetAnalyzer:
         # Fallback: convert entire sample to string
         return json.dumps(sample, ensure_ascii=False)
 
-    async def analyze_question(self, question: str) -> Dict[str, Any]:
-        """Analyze a single question using the LLM.
+    async def analyze_question(self, question: str, limiter: Optional[AdaptiveConcurrency] = None) -> Dict[str, Any]:
+        """Analyze a single question using the LLM, retrying throttled, failed and unparsable responses.
 
         Args:
             question: Question text to analyze
+            limiter: Optional concurrency cap shared by the questions of a dataset
 
         Returns:
-            Analysis results as dictionary
+            Analysis results as dictionary; contains ``error`` if every attempt failed
+        """
+        analysis: Dict[str, Any] = {}
+        for attempt in range(self.max_retries + 1):
+            if limiter is not None:
+                await limiter.acquire()
+            retryable, throttled, retry_after = False, False, None
+            try:
+                analysis, retryable, throttled, retry_after = await self._request_analysis(question)
+            finally:
+                if limiter is not None:
+                    await limiter.release(throttled=throttled, retry_after=retry_after)
+
+            if not retryable or attempt == self.max_retries:
+                break
+
+            delay = retry_after
+            if delay is None:
+                # Exponential backoff with full jitter so retries of many questions do not align
+                delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+            logger.info(f"Retrying question analysis in {delay:.1f}s (attempt {attempt + 2}): {analysis['error']}")
+            await asyncio.sleep(delay)
+        return analysis
+
+    async def _request_analysis(self, question: str) -> Tuple[Dict[str, Any], bool, bool, Optional[float]]:
+        """Send one analysis request.
+
+        Returns:
+            Tuple of (analysis or error dictionary, whether another attempt may succeed, whether the endpoint
+            was throttled or failing, the ``Retry-After`` hint in seconds)
         """
         # Format the prompt with the question
         full_prompt = self.analytics_prompt.replace("{$Question}", question)
@@ -136,6 +264,9 @@ class DatasetAnalyzer:
         try:
             logger.debug(f"Analyzing question (length: {len(question)})")
             response = await self.client.post(self.llm_endpoint, json=payload)
+            if response.status_code in RETRYABLE_STATUS_CODES:
+                logger.warning(f"LLM endpoint answered {response.status_code} during analysis")
+                return {"error": f"HTTP error: {response.status_code}"}, True, True, _retry_after_seconds(response)
             response.raise_for_status()
 
             result = response.json()
@@ -153,33 +284,47 @@ class DatasetAnalyzer:
                         content = content.split("```")[1].split("```")[0]
 
                     analysis = json.loads(content.strip())
-                    return analysis
+                    return analysis, False, False, None
                 except json.JSONDecodeError as e:
                     logger.warning(f"Failed to parse JSON response: {e}")
-                    return {
-                        "error": "Failed to parse response",
-                        "raw_content": content,
-                    }
+                    return {"error": "Failed to parse response", "raw_content": content}, True, False, None
             else:
                 logger.warning("Unexpected API response format")
-                return {"error": "Unexpected response format", "raw_response": result}
+                return {"error": "Unexpected response format", "raw_response": result}, True, False, None
 
+        except httpx.TimeoutException as e:
+            logger.error(f"Timeout during analysis: {e}")
+            return {"error": f"HTTP error: {str(e) or 'timeout'}"}, True, True, None
+        except httpx.HTTPStatusError as e:
+            # Other 4xx responses will not change on retry
+            logger.error(f"HTTP error during analysis: {e}")
+            return {"error": f"HTTP error: {str(e)}"}, False, False, None
         except httpx.HTTPError as e:
             logger.error(f"HTTP error during analysis: {e}")
-            return {"error": f"HTTP error: {str(e)}"}
+            return {"error": f"HTTP error: {str(e)}"}, True, False, None
         except Exception as e:
             logger.error(f"Error analyzing question: {e}")
-            return {"error": str(e)}
+            return {"error": str(e)}, False, False, None
 
     async def analyze_dataset(
-        self, dataset_id: str, samples: List[Dict[str, Any]], max_questions: int = 100
+        self,
+        dataset_id: str,
+        samples: List[Dict[str, Any]],
+        max_questions: int = 100,
+        limiter: Optional[AdaptiveConcurrency] = None,
     ) -> Dict[str, Any]:
-        """Analyze a dataset by processing multiple questions.
+        """Analyze a dataset by processing multiple questions concurrently.
+
+        Up to ``concurrency`` questions are analysed at once (less while the endpoint is throttling). Results
+        keep the ``question_index`` order of the samples. Answers found in the dataset's checkpoint for the
+        same question text are reused; the checkpoint is removed by ``save_analysis``.
 
         Args:
             dataset_id: Dataset identifier
             samples: List of dataset samples
             max_questions: Maximum number of questions to analyze
+            limiter: Limiter shared by the datasets analysed at the same time, so their requests together
+                stay under one cap. Defaults to a limiter of ``concurrency`` for this dataset alone.
 
         Returns:
             Analysis summary with all results
@@ -188,38 +333,65 @@ class DatasetAnalyzer:
 
         # Limit to max_questions
         samples_to_analyze = samples[:max_questions]
+        total = len(samples_to_analyze)
 
-        analyzed_questions = []
-        successful = 0
-        failed = 0
+        checkpoint_file = self._checkpoint_path(dataset_id)
+        checkpoint = self._load_checkpoint(checkpoint_file)
+        results: List[Optional[Dict[str, Any]]] = [None] * total
+        pending = []
 
         for idx, sample in enumerate(samples_to_analyze, 1):
-            logger.info(f"Analyzing question {idx}/{len(samples_to_analyze)} for {dataset_id}")
-
             # Format the question
             question_text = self.format_question(sample)
+            previous = checkpoint.get(idx)
+            if previous is not None and previous.get("question_hash") == _question_hash(question_text):
+                results[idx - 1] = {
+                    "question_index": idx,
+                    "original_sample": sample,
+                    "question_text": question_text,
+                    "analysis": previous["analysis"],
+                }
+            else:
+                pending.append((idx, sample, question_text))
 
-            # Analyze
-            analysis = await self.analyze_question(question_text)
+        if total - len(pending):
+            logger.info(f"Resuming {dataset_id}: {total - len(pending)}/{total} questions restored from checkpoint")
 
-            # Store result
-            result = {
-                "question_index": idx,
-                "original_sample": sample,
-                "question_text": question_text,
-                "analysis": analysis,
-            }
+        limiter = limiter or AdaptiveConcurrency(self.concurrency)
+        completed = total - len(pending)
 
-            analyzed_questions.append(result)
+        with open(checkpoint_file, "a", encoding="utf-8") as checkpoint_out:
 
-            if "error" not in analysis:
-                successful += 1
-            else:
-                failed += 1
+            async def analyze(idx: int, sample: Dict[str, Any], question_text: str) -> None:
+                nonlocal completed
+                analysis = await self.analyze_question(question_text, limiter)
+
+                # Store result
+                results[idx - 1] = {
+                    "question_index": idx,
+                    "original_sample": sample,
+                    "question_text": question_text,
+                    "analysis": analysis,
+                }
+                if "error" not in analysis:
+                    record = {
+                        "question_index": idx,
+                        "question_hash": _question_hash(question_text),
+                        "analysis": analysis,
+                    }
+                    checkpoint_out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    checkpoint_out.flush()
 
-            # Log progress every 10 questions
-            if idx % 10 == 0:
-                logger.info(f"Progress: {idx}/{len(samples_to_analyze)} questions analyzed")
+                completed += 1
+                # Log progress every 10 questions
+                if completed % 10 == 0:
+                    logger.info(f"Progress: {completed}/{total} questions analyzed for {dataset_id}")
+
+            await asyncio.gather(*(analyze(idx, sample, question_text) for idx, sample, question_text in pending))
+
+        analyzed_questions = [result for result in results if result is not None]
+        successful = sum(1 for result in analyzed_questions if "error" not in result["analysis"])
+        failed = len(analyzed_questions) - successful
 
         # Create summary
         summary = {
@@ -237,6 +409,31 @@ class DatasetAnalyzer:
 
         return summary
 
+    def _safe_id(self, dataset_id: str) -> str:
+        """Clean a dataset_id for use in file names."""
+        return dataset_id.replace("/", "_").replace(" ", "_")
+
+    def _checkpoint_path(self, dataset_id: str) -> Path:
+        """Return the checkpoint file of a dataset's in-progress analysis."""
+        return self.output_dir / f"{self._safe_id(dataset_id)}_analysis.checkpoint.jsonl"
+
+    def _load_checkpoint(self, checkpoint_file: Path) -> Dict[int, Dict[str, Any]]:
+        """Load the answered questions of an interrupted run, keyed by question_index.
+
+        A truncated last line (the run died while writing it) is ignored.
+        """
+        answered: Dict[int, Dict[str, Any]] = {}
+        if not checkpoint_file.exists():
+            return answered
+        with open(checkpoint_file, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                answered[record["question_index"]] = record
+        return answered
+
     async def save_analysis(self, dataset_id: str, analysis_data: Dict[str, Any]) -> Path:
         """Save analysis results to a JSON file.
 
@@ -247,13 +444,16 @@ class DatasetAnalyzer:
         Returns:
             Path to saved file
         """
-        # Clean dataset_id for filename
-        safe_id = dataset_id.replace("/", "_").replace(" ", "_")
-        output_file = self.output_dir / f"{safe_id}_analysis.json"
+        output_file = self.output_dir / f"{self._safe_id(dataset_id)}_analysis.json"
+        temp_file = output_file.with_suffix(".json.tmp")
 
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
+            with open(temp_file, "w", encoding="utf-8") as f:
                 json.dump(analysis_data, f, indent=2, ensure_ascii=False)
+            os.replace(temp_file, output_file)
+
+            # The final file now holds every answer, so the next run starts from scratch
+            self._checkpoint_path(dataset_id).unlink(missing_ok=True)
 
             logger.info(f"Analysis saved to: {output_file}")
             return output_file
@@ -5,8 +5,12 @@ This module provides functionality to download datasets (if needed) and retrieve
 samples from them for evaluation purposes.
 """
 
+import csv
+import glob
+import json
+import os
 import random
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from datasets import Dataset, DatasetDict
 
@@ -15,6 +19,12 @@ from opencompass.utils.datasets_info import DATASETS_MAPPING
 
 logger = get_logger()
 
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 
 def get_dataset_sample(
     dataset_name: str,
@@ -29,8 +39,11 @@ def get_dataset_sample(
 
     This function integrates with OpenCompass's dataset infrastructure to:
     1. Download the dataset if not already cached
-    2. Load the dataset from raw files (CSV, JSON, JSONL)
-    3. Return a sample of questions
+    2. Stream the records from the raw files (CSV, JSON, JSONL)
+    3. Keep a seeded reservoir of sample_size records while counting the total
+
+    Only the reservoir is held in memory, so the cost of sampling does not grow with the
+    size of the dataset beyond reading it once.
 
     Args:
         dataset_name (str): Name of the dataset to load. This should match a key
@@ -38,8 +51,8 @@ def get_dataset_sample(
         sample_size (int): Number of questions to sample. Defaults to 100.
         split (str): Which split to sample from ('train', 'test', 'dev', etc.).
             Defaults to 'test'.
-        seed (int, optional): Random seed for reproducibility. Defaults to 42.
-            Set to None for no seeding.
+        seed (int, optional): Random seed for reproducibility. The same seed and files
+            always yield the same samples. Defaults to 42. Set to None for no seeding.
         shuffle (bool): Whether to shuffle before sampling. If False, takes the
             first sample_size items. Defaults to True.
         return_total_count (bool): If True, returns a tuple of (samples, total_count).
@@ -75,11 +88,6 @@ def get_dataset_sample(
         ...     split='dev'
         ... )
     """
-    import csv
-    import json
-    import os
-    import glob
-
     logger.info(f"Loading dataset: {dataset_name}")
 
     # Check if dataset exists in mapping
@@ -95,108 +103,23 @@ def get_dataset_sample(
         )
         dataset_path = dataset_name
 
-    # Load dataset from raw files
-    dataset_items = []
+    # Stream the records through a reservoir so only sample_size items are held in memory
+    rng = random.Random(seed)
+    samples: List[Dict[Any, Any]] = []
+    total_samples = 0
 
     try:
-        # Check if it's a directory with splits
-        if os.path.isdir(dataset_path):
-            split_dir = os.path.join(dataset_path, split)
-
-            # Try to find CSV files (like MMLU)
-            csv_files = glob.glob(os.path.join(split_dir, "*.csv"))
-            if csv_files:
-                logger.info(f"Found {len(csv_files)} CSV files in {split_dir}")
-                for csv_file in csv_files:
-                    with open(csv_file, 'r', encoding='utf-8') as f:
-                        reader = csv.reader(f)
-                        for row in reader:
-                            if len(row) == 6:  # MMLU format
-                                dataset_items.append({
-                                    'input': row[0],
-                                    'A': row[1],
-                                    'B': row[2],
-                                    'C': row[3],
-                                    'D': row[4],
-                                    'target': row[5],
-                                    'source_file': os.path.basename(csv_file)
-                                })
-                            else:
-                                # Generic CSV format
-                                dataset_items.append(dict(enumerate(row)))
-
-            # Try to find JSONL files (like ARC)
-            jsonl_files = glob.glob(os.path.join(split_dir, "*.jsonl"))
-            if jsonl_files:
-                logger.info(f"Found {len(jsonl_files)} JSONL files in {split_dir}")
-                for jsonl_file in jsonl_files:
-                    with open(jsonl_file, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            if line.strip():
-                                dataset_items.append(json.loads(line))
-
-            # Try to find JSON files
-            json_files = glob.glob(os.path.join(split_dir, "*.json"))
-            if json_files:
-                logger.info(f"Found {len(json_files)} JSON files in {split_dir}")
-                for json_file in json_files:
-                    # Skip contamination annotation files
-                    if 'contamination' in json_file.lower():
-                        continue
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        if isinstance(data, list):
-                            dataset_items.extend(data)
-                        elif isinstance(data, dict):
-                            dataset_items.append(data)
-
-            # If split_dir doesn't exist, try the main directory
-            if not dataset_items:
-                logger.info(f"Split directory {split_dir} not found or empty, trying main directory")
-
-                # Try JSONL in main directory
-                jsonl_file = os.path.join(dataset_path, f"{split}.jsonl")
-                if os.path.exists(jsonl_file):
-                    logger.info(f"Loading from {jsonl_file}")
-                    with open(jsonl_file, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            if line.strip():
-                                dataset_items.append(json.loads(line))
-
-                # Try JSON in main directory
-                json_file = os.path.join(dataset_path, f"{split}.json")
-                if os.path.exists(json_file):
-                    logger.info(f"Loading from {json_file}")
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        if isinstance(data, list):
-                            dataset_items.extend(data)
-                        elif isinstance(data, dict):
-                            dataset_items.append(data)
-
-        # If it's a single file
-        elif os.path.isfile(dataset_path):
-            logger.info(f"Loading from file: {dataset_path}")
-            if dataset_path.endswith('.jsonl'):
-                with open(dataset_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        if line.strip():
-                            dataset_items.append(json.loads(line))
-            elif dataset_path.endswith('.json'):
-                with open(dataset_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        dataset_items.extend(data)
-                    elif isinstance(data, dict):
-                        dataset_items.append(data)
-            elif dataset_path.endswith('.csv'):
-                with open(dataset_path, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    dataset_items.extend(list(reader))
-        else:
-            raise ValueError(f"Path {dataset_path} is neither a directory nor a file")
-
-        if not dataset_items:
+        for item in _iter_dataset_records(dataset_path, split):
+            total_samples += 1
+            if len(samples) < sample_size:
+                samples.append(item)
+            elif shuffle:
+                # Algorithm R: the n-th record replaces a random reservoir slot with probability sample_size / n
+                slot = rng.randrange(total_samples)
+                if slot < sample_size:
+                    samples[slot] = item
+
+        if not total_samples:
             raise ValueError(
                 f"No data found in {dataset_path} for split '{split}'. "
                 f"Please check if the split exists and contains data files."
@@ -210,31 +133,17 @@ def get_dataset_sample(
             "Please ensure the dataset name is correct and the dataset exists."
         )
 
-    # Now we have dataset_items as a list
-    total_samples = len(dataset_items)
     logger.info(f"Total samples loaded: {total_samples}")
 
-    # Adjust sample size if dataset is smaller
-    actual_sample_size = min(sample_size, total_samples)
-    if actual_sample_size < sample_size:
+    if len(samples) < sample_size:
         logger.warning(
             f"Requested {sample_size} samples, but dataset only has "
-            f"{total_samples}. Returning all {actual_sample_size} samples."
+            f"{total_samples}. Returning all {len(samples)} samples."
         )
 
-    # Set random seed for reproducibility
-    if seed is not None:
-        random.seed(seed)
-
-    # Sample the dataset
+    # The reservoir keeps early records in file order, so shuffle it to return them in random order
     if shuffle:
-        # Shuffle and take first N
-        sampled_items = dataset_items.copy()
-        random.shuffle(sampled_items)
-        samples = sampled_items[:actual_sample_size]
-    else:
-        # Take first N samples without shuffling
-        samples = dataset_items[:actual_sample_size]
+        rng.shuffle(samples)
 
     logger.info(f"Successfully sampled {len(samples)} items from dataset")
 
@@ -243,6 +152,138 @@ def get_dataset_sample(
     return samples
 
 
+def _iter_dataset_records(dataset_path: str, split: str) -> Iterator[Dict[Any, Any]]:
+    """Yield the records of a dataset split one at a time.
+
+    Directories are searched for ``<split>/*.csv``, ``<split>/*.jsonl`` and ``<split>/*.json`` first and fall
+    back to ``<split>.jsonl`` / ``<split>.json`` in the dataset directory if the split directory yields nothing.
+
+    Args:
+        dataset_path (str): Dataset directory or single CSV/JSONL/JSON file.
+        split (str): Split to read when dataset_path is a directory.
+
+    Yields:
+        Dict: One record of the split.
+
+    Raises:
+        ValueError: If dataset_path is neither a directory nor a file.
+    """
+    if os.path.isdir(dataset_path):
+        split_dir = os.path.join(dataset_path, split)
+        found = False
+
+        # Try to find CSV files (like MMLU)
+        csv_files = sorted(glob.glob(os.path.join(split_dir, "*.csv")))
+        if csv_files:
+            logger.info(f"Found {len(csv_files)} CSV files in {split_dir}")
+            for csv_file in csv_files:
+                for item in _iter_split_csv(csv_file):
+                    found = True
+                    yield item
+
+        # Try to find JSONL files (like ARC)
+        jsonl_files = sorted(glob.glob(os.path.join(split_dir, "*.jsonl")))
+        if jsonl_files:
+            logger.info(f"Found {len(jsonl_files)} JSONL files in {split_dir}")
+            for jsonl_file in jsonl_files:
+                for item in _iter_jsonl(jsonl_file):
+                    found = True
+                    yield item
+
+        # Try to find JSON files
+        json_files = sorted(glob.glob(os.path.join(split_dir, "*.json")))
+        if json_files:
+            logger.info(f"Found {len(json_files)} JSON files in {split_dir}")
+            for json_file in json_files:
+                # Skip contamination annotation files
+                if 'contamination' in json_file.lower():
+                    continue
+                for item in _iter_json(json_file):
+                    found = True
+                    yield item
+
+        # If split_dir doesn't exist, try the main directory
+        if not found:
+            logger.info(f"Split directory {split_dir} not found or empty, trying main directory")
+
+            # Try JSONL in main directory
+            jsonl_file = os.path.join(dataset_path, f"{split}.jsonl")
+            if os.path.exists(jsonl_file):
+                logger.info(f"Loading from {jsonl_file}")
+                yield from _iter_jsonl(jsonl_file)
+
+            # Try JSON in main directory
+            json_file = os.path.join(dataset_path, f"{split}.json")
+            if os.path.exists(json_file):
+                logger.info(f"Loading from {json_file}")
+                yield from _iter_json(json_file)
+
+    # If it's a single file
+    elif os.path.isfile(dataset_path):
+        logger.info(f"Loading from file: {dataset_path}")
+        if dataset_path.endswith('.jsonl'):
+            yield from _iter_jsonl(dataset_path)
+        elif dataset_path.endswith('.json'):
+            yield from _iter_json(dataset_path)
+        elif dataset_path.endswith('.csv'):
+            with open(dataset_path, 'r', encoding='utf-8') as f:
+                yield from csv.DictReader(f)
+    else:
+        raise ValueError(f"Path {dataset_path} is neither a directory nor a file")
+
+
+def _iter_split_csv(csv_file: str) -> Iterator[Dict[Any, Any]]:
+    """Yield the rows of a header-less split CSV file, mapping six-column rows to the MMLU fields."""
+    with open(csv_file, 'r', encoding='utf-8') as f:
+        for row in csv.reader(f):
+            if len(row) == 6:  # MMLU format
+                yield {
+                    'input': row[0],
+                    'A': row[1],
+                    'B': row[2],
+                    'C': row[3],
+                    'D': row[4],
+                    'target': row[5],
+                    'source_file': os.path.basename(csv_file)
+                }
+            else:
+                # Generic CSV format
+                yield dict(enumerate(row))
+
+
+def _iter_jsonl(jsonl_file: str) -> Iterator[Dict[Any, Any]]:
+    """Yield the records of a JSONL file line by line."""
+    with open(jsonl_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _iter_json(json_file: str) -> Iterator[Dict[Any, Any]]:
+    """Yield the records of a JSON file holding a list of records or a single record.
+
+    Top-level arrays are parsed incrementally when ijson is installed; otherwise the file is loaded with
+    ``json.load``.
+    """
+    if IJSON_AVAILABLE:
+        with open(json_file, 'rb') as f:
+            first = f.read(1)
+            while first.isspace():
+                first = f.read(1)
+            f.seek(0)
+            if first == b'[':
+                # use_float keeps numbers as float instead of Decimal, matching json.load
+                yield from ijson.items(f, 'item', use_float=True)
+                return
+
+    with open(json_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        yield from data
+    elif isinstance(data, dict):
+        yield data
+
+
 def print_sample_summary(samples: List[Dict], max_display: int = 5):
     """
     Print a summary of the sampled data.
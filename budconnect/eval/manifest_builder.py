@@ -16,28 +16,141 @@
 
 """Manifest builder for eval_manifest.json - fetches data from OpenCompass APIs."""
 
+import asyncio
+import functools
 import hashlib
 import json
 import logging
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 import httpx
 
 from budconnect.commons.config import app_settings
-from budconnect.eval.dataset_analyzer import DatasetAnalyzer
-from budconnect.eval.dataset_sampler import get_dataset_sample
+from budconnect.commons.executor import run_in_process
+from budconnect.eval.dataset_analyzer import AdaptiveConcurrency, DatasetAnalyzer
 
 
 logger = logging.getLogger(__name__)
-try:
-    import tiktoken
-    TIKTOKEN_AVAILABLE = True
-except ImportError:
-    TIKTOKEN_AVAILABLE = False
-    logger.warning("tiktoken not available - token estimation will use default values")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoding() -> Optional[Any]:
+    """Load the tiktoken encoding on first use, or return None if tiktoken is not installed.
+
+    tiktoken (and the dataset sampler with its ``datasets``/``opencompass`` imports) are only loaded in the
+    processes that actually sample datasets, so importing this module stays cheap for the API.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        logger.warning("tiktoken not available - token estimation will use default values")
+        return None
+    # Use cl100k_base encoding (GPT-4, GPT-3.5-turbo)
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def estimate_tokens(samples: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Estimate input and output tokens from dataset samples.
+
+    Args:
+        samples: List of dataset samples
+
+    Returns:
+        Dictionary with estimated_input_tokens and estimated_output_tokens
+    """
+    try:
+        encoding = _get_encoding()
+
+        # If tiktoken is not available, return defaults
+        if encoding is None:
+            return {
+                "estimated_input_tokens": 100,
+                "estimated_output_tokens": 50
+            }
+
+        input_tokens = []
+        output_tokens = []
+
+        # Common field names for inputs and outputs
+        input_fields = ['input', 'question', 'prompt', 'text', 'query', 'context']
+        output_fields = ['output', 'answer', 'target', 'label', 'completion']
+
+        for sample in samples:
+            # Extract input text
+            input_text = ""
+            for field in input_fields:
+                if field in sample and sample[field]:
+                    input_text += str(sample[field]) + " "
+
+            # For multiple choice, include options in input
+            if 'A' in sample and 'B' in sample:
+                for opt in ['A', 'B', 'C', 'D', 'E']:
+                    if opt in sample and sample[opt]:
+                        input_text += str(sample[opt]) + " "
+
+            # Extract output text
+            output_text = ""
+            for field in output_fields:
+                if field in sample and sample[field]:
+                    output_text += str(sample[field]) + " "
+
+            # Count tokens
+            if input_text.strip():
+                input_tokens.append(len(encoding.encode(input_text.strip())))
+            if output_text.strip():
+                output_tokens.append(len(encoding.encode(output_text.strip())))
+
+        # Calculate averages (rounded up)
+        avg_input = int(sum(input_tokens) / len(input_tokens)) if input_tokens else 100
+        avg_output = int(sum(output_tokens) / len(output_tokens)) if output_tokens else 50
+
+        logger.debug(
+            f"Token estimation from {len(samples)} samples: "
+            f"input={avg_input} (from {len(input_tokens)} samples), "
+            f"output={avg_output} (from {len(output_tokens)} samples)"
+        )
+
+        return {
+            "estimated_input_tokens": avg_input,
+            "estimated_output_tokens": avg_output
+        }
+
+    except Exception as e:
+        logger.warning(f"Failed to estimate tokens: {e}")
+        # Return default values on error
+        return {
+            "estimated_input_tokens": 100,
+            "estimated_output_tokens": 50
+        }
+
+
+def sample_dataset(dataset_name: str, sample_size: int) -> Tuple[List[Dict[str, Any]], int, Dict[str, int]]:
+    """Sample a dataset and estimate its token counts.
+
+    Downloading and parsing the dataset files and encoding the samples are the expensive parts of
+    processing a dataset, so the builder runs this function in the shared process pool.
+
+    Args:
+        dataset_name: OpenCompass dataset name, e.g. ``opencompass/mmlu``
+        sample_size: Number of samples to extract
+
+    Returns:
+        The samples, the total number of questions in the split and the token estimates
+    """
+    # Imported here so the datasets/opencompass stack is only loaded by the pool workers
+    from budconnect.eval.dataset_sampler import get_dataset_sample
+
+    samples, total_count = cast(
+        Tuple[List[Dict[str, Any]], int],
+        get_dataset_sample(
+            dataset_name=dataset_name, sample_size=sample_size, split="test", seed=42, return_total_count=True
+        ),
+    )
+    return samples, total_count, estimate_tokens(samples)
+
 
 class EvalManifestBuilder:
     """Builds eval_manifest.json from OpenCompass API data."""
@@ -50,7 +163,8 @@ class EvalManifestBuilder:
         output_path: str,
         enable_analysis: bool = False,
         sample_size: Optional[int] = None,
-        skip_cache: bool = False
+        skip_cache: bool = False,
+        max_parallel_datasets: Optional[int] = None
     ) -> None:
         """Initialize the manifest builder.
 
@@ -59,6 +173,8 @@ class EvalManifestBuilder:
             enable_analysis: Whether to analyze datasets with LLM (default: False)
             sample_size: Number of samples to extract per dataset (overrides EVAL_SAMPLE_SIZE env var)
             skip_cache: Whether to skip cache and regenerate all data (default: False)
+            max_parallel_datasets: Number of updated datasets processed concurrently
+                (overrides EVAL_MAX_PARALLEL_DATASETS env var)
         """
         self.output_path = Path(output_path)
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -67,6 +183,9 @@ class EvalManifestBuilder:
         # Use provided sample_size or fall back to config
         self.sample_size = sample_size if sample_size is not None else app_settings.eval_sample_size
         self.skip_cache = skip_cache
+        self.max_parallel_datasets = max(
+            1, max_parallel_datasets if max_parallel_datasets is not None else app_settings.eval_max_parallel_datasets
+        )
 
         if skip_cache:
             logger.info("Cache skipping enabled - will regenerate all data")
@@ -145,71 +264,7 @@ class EvalManifestBuilder:
         Returns:
             Dictionary with estimated_input_tokens and estimated_output_tokens
         """
-        # If tiktoken is not available, return defaults
-        if not TIKTOKEN_AVAILABLE:
-            return {
-                "estimated_input_tokens": 100,
-                "estimated_output_tokens": 50
-            }
-
-        try:
-            # Use cl100k_base encoding (GPT-4, GPT-3.5-turbo)
-            encoding = tiktoken.get_encoding("cl100k_base")
-
-            input_tokens = []
-            output_tokens = []
-
-            # Common field names for inputs and outputs
-            input_fields = ['input', 'question', 'prompt', 'text', 'query', 'context']
-            output_fields = ['output', 'answer', 'target', 'label', 'completion']
-
-            for sample in samples:
-                # Extract input text
-                input_text = ""
-                for field in input_fields:
-                    if field in sample and sample[field]:
-                        input_text += str(sample[field]) + " "
-
-                # For multiple choice, include options in input
-                if 'A' in sample and 'B' in sample:
-                    for opt in ['A', 'B', 'C', 'D', 'E']:
-                        if opt in sample and sample[opt]:
-                            input_text += str(sample[opt]) + " "
-
-                # Extract output text
-                output_text = ""
-                for field in output_fields:
-                    if field in sample and sample[field]:
-                        output_text += str(sample[field]) + " "
-
-                # Count tokens
-                if input_text.strip():
-                    input_tokens.append(len(encoding.encode(input_text.strip())))
-                if output_text.strip():
-                    output_tokens.append(len(encoding.encode(output_text.strip())))
-
-            # Calculate averages (rounded up)
-            avg_input = int(sum(input_tokens) / len(input_tokens)) if input_tokens else 100
-            avg_output = int(sum(output_tokens) / len(output_tokens)) if output_tokens else 50
-
-            logger.debug(
-                f"Token estimation from {len(samples)} samples: "
-                f"input={avg_input} (from {len(input_tokens)} samples), "
-                f"output={avg_output} (from {len(output_tokens)} samples)"
-            )
-
-            return {
-                "estimated_input_tokens": avg_input,
-                "estimated_output_tokens": avg_output
-            }
-
-        except Exception as e:
-            logger.warning(f"Failed to estimate tokens: {e}")
-            # Return default values on error
-            return {
-                "estimated_input_tokens": 100,
-                "estimated_output_tokens": 50
-            }
+        return estimate_tokens(samples)
 
     async def fetch_traits_data(self) -> List[Dict[str, Any]]:
         """Fetch traits data from OpenCompass API.
@@ -617,7 +672,8 @@ class EvalManifestBuilder:
     async def transform_datasets(self, api_datasets: List[Dict[str, Any]], existing_manifest: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Transform API datasets data to manifest format.
 
-        Optionally analyzes datasets using LLM if enable_analysis is True.
+        Optionally analyzes datasets using LLM if enable_analysis is True. Cache decisions are made in API
+        order first; new and updated datasets are then processed up to ``max_parallel_datasets`` at a time.
 
         Args:
             api_datasets: Raw datasets data from API
@@ -636,7 +692,9 @@ class EvalManifestBuilder:
                 if ds_id:
                     existing_datasets_map[ds_id] = ds
 
+        # Entries keep the API order; updated ones are filled in place once processed
         datasets = []
+        pending: List[Tuple[Dict[str, Any], str]] = []
 
         for dataset in api_datasets:
             dataset_id = dataset.get("id")
@@ -756,106 +814,26 @@ class EvalManifestBuilder:
                 # New dataset (no cache)
                 logger.info(f"✦ NEW DATASET: {name} - No cached data available")
 
-            # Only sample if dataset is new or has been updated
-            if dataset_updated:
-                # Optionally analyze dataset questions
-                if self.enable_analysis and self.analyzer:
-                    try:
-                        reason = "new dataset" if not existing_entry else "dataset updated"
-                        logger.info(f"🔬 RUNNING ANALYSIS: {name} ({reason}) - Sampling and analyzing questions")
-
-                        # Try to sample questions from the dataset
-                        dataset_name = f"opencompass/{name.lower().replace(' ', '_').replace('-', '_')}"
-
-                        try:
-                            # Get sample questions and total count
-                            samples, total_count = get_dataset_sample(
-                                dataset_name=dataset_name, sample_size=self.sample_size, split="test", seed=42, return_total_count=True
-                            )
-
-                            logger.info(f"Successfully sampled {len(samples)} questions for {name} (total: {total_count})")
-
-                            # Update dataset entry with actual sample count
-                            dataset_entry["sample_count"] = total_count
-
-                            # Estimate tokens from samples
-                            token_estimates = self.estimate_tokens_from_samples(samples)
-                            dataset_entry["metadata"]["estimated_input_tokens"] = token_estimates["estimated_input_tokens"]
-                            dataset_entry["metadata"]["estimated_output_tokens"] = token_estimates["estimated_output_tokens"]
-
-                            # Analyze the samples
-                            analysis_data = await self.analyzer.analyze_dataset(
-                                dataset_id=f"opencompass_{dataset_id}", samples=samples, max_questions=self.sample_size
-                            )
-
-                            # Save analysis to file
-                            analysis_file = await self.analyzer.save_analysis(
-                                dataset_id=f"opencompass_{dataset_id}", analysis_data=analysis_data
-                            )
-
-                            # Aggregate analysis data for all derived fields
-                            aggregated_data = self.aggregate_analysis(analysis_data, total_questions=total_count)
-
-                            # Update dataset entry with aggregated data
-                            dataset_entry["original_data"]["sample_questions_answers"] = aggregated_data["sample_questions_answers"]
-                            dataset_entry["original_data"]["advantages_disadvantages"] = aggregated_data["advantages_disadvantages"]
-                            dataset_entry["original_data"]["age_distribution"] = aggregated_data["age_distribution"]
-                            dataset_entry["original_data"]["why_run_this_eval"] = aggregated_data["why_run_this_eval"]
-                            dataset_entry["original_data"]["what_to_expect"] = aggregated_data["what_to_expect"]
-
-                            # Add analysis file path to dataset entry
-                            dataset_entry["analysis_file"] = str(analysis_file.relative_to(self.output_path.parent))
-                            dataset_entry["analysis_summary"] = {
-                                "total_analyzed": analysis_data.get("analyzed_count", 0),
-                                "successful": analysis_data.get("successful", 0),
-                                "failed": analysis_data.get("failed", 0),
-                            }
-
-                            logger.info(
-                                f"Analysis complete for {name}: {analysis_data.get('successful', 0)}/{analysis_data.get('analyzed_count', 0)} successful"
-                            )
-
-                        except Exception as sample_error:
-                            logger.warning(f"Could not sample dataset {name}: {sample_error}")
-                            dataset_entry["analysis_file"] = None
-                            dataset_entry["analysis_summary"] = {"error": str(sample_error)}
-
-                    except Exception as e:
-                        logger.error(f"Failed to analyze dataset {name}: {e}")
-                        dataset_entry["analysis_file"] = None
-                        dataset_entry["analysis_summary"] = {"error": str(e)}
-                else:
-                    # When analysis is disabled, still try to sample for token estimation
-                    reason = "new dataset" if not existing_entry else "dataset updated"
-                    logger.info(f"📊 SAMPLING ONLY: {name} ({reason}) - Getting tokens (analysis disabled)")
-
-                    dataset_name = f"opencompass/{name.lower().replace(' ', '_').replace('-', '_')}"
-
-                    try:
-                        # Sample just a few rows for token estimation
-                        samples, total_count = get_dataset_sample(
-                            dataset_name=dataset_name, sample_size=self.sample_size, split="test", seed=42, return_total_count=True
-                        )
-
-                        # Update dataset entry with actual sample count
-                        dataset_entry["sample_count"] = total_count
+            datasets.append(dataset_entry)
 
-                        # Estimate tokens from samples
-                        token_estimates = self.estimate_tokens_from_samples(samples)
-                        dataset_entry["metadata"]["estimated_input_tokens"] = token_estimates["estimated_input_tokens"]
-                        dataset_entry["metadata"]["estimated_output_tokens"] = token_estimates["estimated_output_tokens"]
+            # New or updated datasets are sampled (and analyzed) below, several at a time
+            if dataset_updated:
+                pending.append((dataset_entry, "new dataset" if not existing_entry else "dataset updated"))
 
-                        logger.info(
-                            f"  └─ {name}: sample_count={total_count}, "
-                            f"input_tokens={token_estimates['estimated_input_tokens']}, "
-                            f"output_tokens={token_estimates['estimated_output_tokens']}"
-                        )
+        if pending:
+            logger.info(
+                f"Processing {len(pending)} new or updated datasets, up to {self.max_parallel_datasets} in parallel"
+            )
+            semaphore = asyncio.Semaphore(self.max_parallel_datasets)
+            # One cap on the LLM requests of all datasets analysed at once, so a throttled endpoint slows
+            # the whole build down instead of each dataset backing off on its own
+            limiter = AdaptiveConcurrency(self.analyzer.concurrency) if self.analyzer else None
 
-                    except Exception as sample_error:
-                        logger.debug(f"Could not sample dataset {name} for token estimation: {sample_error}")
-                        # Keep default values
+            async def process(dataset_entry: Dict[str, Any], reason: str) -> None:
+                async with semaphore:
+                    await self._process_updated_dataset(dataset_entry, reason, limiter)
 
-            datasets.append(dataset_entry)
+            await asyncio.gather(*(process(dataset_entry, reason) for dataset_entry, reason in pending))
 
         return {
             "opencompass": {
@@ -868,6 +846,99 @@ class EvalManifestBuilder:
             }
         }
 
+    async def _process_updated_dataset(
+        self, dataset_entry: Dict[str, Any], reason: str, limiter: Optional[AdaptiveConcurrency] = None
+    ) -> None:
+        """Sample a new or updated dataset and optionally analyze it, updating its manifest entry in place.
+
+        Sampling and token estimation run in the shared process pool (``PROCESS_EXECUTOR_MAX_WORKERS``), the
+        LLM analysis runs on the event loop, so the downloads and analyses of several datasets overlap.
+
+        Args:
+            dataset_entry: The manifest entry of the dataset
+            reason: Why the dataset is processed, used for logging
+            limiter: LLM request limiter shared by the datasets of this build
+        """
+        name = dataset_entry["name"]
+        dataset_name = f"opencompass/{name.lower().replace(' ', '_').replace('-', '_')}"
+
+        if not (self.enable_analysis and self.analyzer):
+            # When analysis is disabled, still try to sample for token estimation
+            logger.info(f"📊 SAMPLING ONLY: {name} ({reason}) - Getting tokens (analysis disabled)")
+            try:
+                _, total_count, token_estimates = await run_in_process(
+                    sample_dataset, dataset_name, self.sample_size, timeout=app_settings.eval_sample_timeout_seconds
+                )
+            except Exception as sample_error:
+                logger.debug(f"Could not sample dataset {name} for token estimation: {sample_error}")
+                # Keep default values
+                return
+
+            # Update dataset entry with actual sample count and token estimates
+            dataset_entry["sample_count"] = total_count
+            dataset_entry["metadata"]["estimated_input_tokens"] = token_estimates["estimated_input_tokens"]
+            dataset_entry["metadata"]["estimated_output_tokens"] = token_estimates["estimated_output_tokens"]
+
+            logger.info(
+                f"  └─ {name}: sample_count={total_count}, "
+                f"input_tokens={token_estimates['estimated_input_tokens']}, "
+                f"output_tokens={token_estimates['estimated_output_tokens']}"
+            )
+            return
+
+        logger.info(f"🔬 RUNNING ANALYSIS: {name} ({reason}) - Sampling and analyzing questions")
+        try:
+            # Get sample questions, total count and token estimates
+            samples, total_count, token_estimates = await run_in_process(
+                sample_dataset, dataset_name, self.sample_size, timeout=app_settings.eval_sample_timeout_seconds
+            )
+
+            logger.info(f"Successfully sampled {len(samples)} questions for {name} (total: {total_count})")
+
+            # Update dataset entry with actual sample count and token estimates
+            dataset_entry["sample_count"] = total_count
+            dataset_entry["metadata"]["estimated_input_tokens"] = token_estimates["estimated_input_tokens"]
+            dataset_entry["metadata"]["estimated_output_tokens"] = token_estimates["estimated_output_tokens"]
+
+            # Analyze the samples
+            analysis_data = await self.analyzer.analyze_dataset(
+                dataset_id=dataset_entry["id"], samples=samples, max_questions=self.sample_size, limiter=limiter
+            )
+
+            # Save analysis to file
+            analysis_file = await self.analyzer.save_analysis(dataset_id=dataset_entry["id"], analysis_data=analysis_data)
+
+            # Aggregate analysis data for all derived fields
+            aggregated_data = self.aggregate_analysis(analysis_data, total_questions=total_count)
+
+            # Update dataset entry with aggregated data
+            for field in (
+                "sample_questions_answers",
+                "advantages_disadvantages",
+                "age_distribution",
+                "why_run_this_eval",
+                "what_to_expect",
+            ):
+                dataset_entry["original_data"][field] = aggregated_data[field]
+
+            # Add analysis file path to dataset entry
+            dataset_entry["analysis_file"] = str(analysis_file.relative_to(self.output_path.parent))
+            dataset_entry["analysis_summary"] = {
+                "total_analyzed": analysis_data.get("analyzed_count", 0),
+                "successful": analysis_data.get("successful", 0),
+                "failed": analysis_data.get("failed", 0),
+            }
+
+            logger.info(
+                f"Analysis complete for {name}: "
+                f"{analysis_data.get('successful', 0)}/{analysis_data.get('analyzed_count', 0)} successful"
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to analyze dataset {name}: {e}")
+            dataset_entry["analysis_file"] = None
+            dataset_entry["analysis_summary"] = {"error": str(e)}
+
     def increment_version(self, version: str) -> str:
         """Increment semantic version (MAJOR.MINOR.PATCH).
 
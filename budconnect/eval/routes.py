@@ -16,10 +16,11 @@
 
 """Eval API routes."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request, Response
 
+from ..commons.conditional import not_modified_response
 from .schemas import AvailableVersionsResponse, EvalManifestBuildRequest, EvalManifestBuildResponse
 from .services import EvalService
 
@@ -66,7 +67,8 @@ async def build_eval_manifest(request: EvalManifestBuildRequest) -> EvalManifest
     result = await service.build_manifest(
         output_filename=request.output_filename,
         enable_analysis=request.enable_analysis,
-        sample_size=request.sample_size
+        sample_size=request.sample_size,
+        max_parallel_datasets=request.max_parallel_datasets
     )
 
     return EvalManifestBuildResponse(**result)
@@ -74,28 +76,35 @@ async def build_eval_manifest(request: EvalManifestBuildRequest) -> EvalManifest
 
 @eval_router.get("/manifest", response_model=Dict[str, Any])
 async def get_manifest(
+    request: Request,
     version: Optional[str] = Query(
         default=None,
         description="Manifest version (e.g., '1.0.5'). If not provided, returns latest version.",
         example="1.0.5"
     )
-) -> Dict[str, Any]:
+) -> Union[Dict[str, Any], Response]:
     """Get eval manifest by version.
 
     Returns the eval manifest JSON file. If version is specified, returns that specific version.
     If no version is provided, returns the latest version (follows symlink).
+    Supports If-None-Match / If-Modified-Since; the file is only parsed when it changed.
 
     Args:
+        request: The incoming request, used for conditional headers
         version: Optional version number (semantic versioning format: MAJOR.MINOR.PATCH)
 
     Returns:
-        dict: Complete manifest JSON with traits and datasets
+        dict: Complete manifest JSON with traits and datasets, or 304 if unchanged
 
     Raises:
         404: Version not found or no manifest exists
         500: Failed to read or parse manifest file
     """
     service = EvalService()
+    not_modified = not_modified_response(request, *service.get_manifest_validator(version=version))
+    if not_modified is not None:
+        return not_modified
+
     manifest_data = service.get_manifest(version=version)
     return manifest_data
 
@@ -37,13 +37,22 @@ class EvalManifestBuildRequest(BaseModel):
         description="Number of samples to extract per dataset (overrides EVAL_SAMPLE_SIZE env var if provided)",
         gt=0,
     )
+    max_parallel_datasets: Optional[int] = Field(
+        default=None,
+        description=(
+            "Number of new or updated datasets processed concurrently "
+            "(overrides EVAL_MAX_PARALLEL_DATASETS env var if provided)"
+        ),
+        gt=0,
+    )
 
     model_config = {
         "json_schema_extra": {
             "example": {
                 "output_filename": "eval_manifest.json",
                 "enable_analysis": False,
-                "sample_size": 200
+                "sample_size": 200,
+                "max_parallel_datasets": 4
             }
         }
     }
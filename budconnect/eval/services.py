@@ -19,15 +19,15 @@
 import json
 import logging
 import os
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from budmicroframe.commons.exceptions import ClientException
 
+from budconnect.commons.conditional import make_etag
 from budconnect.commons.config import app_settings
 
-from .manifest_builder import EvalManifestBuilder
-
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +44,8 @@ class EvalService:
         self,
         output_filename: str = "eval_manifest.json",
         enable_analysis: bool = False,
-        sample_size: Optional[int] = None
+        sample_size: Optional[int] = None,
+        max_parallel_datasets: Optional[int] = None
     ) -> Dict[str, Any]:
         """Build the eval manifest file.
 
@@ -52,6 +53,8 @@ class EvalService:
             output_filename: Name of the output file
             enable_analysis: Whether to enable LLM-based dataset analysis
             sample_size: Number of samples to extract per dataset (overrides EVAL_SAMPLE_SIZE env var)
+            max_parallel_datasets: Number of datasets processed concurrently
+                (overrides EVAL_MAX_PARALLEL_DATASETS env var)
 
         Returns:
             dict: Result of the build process with status, file path, counts
@@ -64,25 +67,29 @@ class EvalService:
         # Construct output path
         output_path = str(self.data_dir / output_filename)
 
+        # The builder is imported on demand so manifest reads never load the build stack
+        from .manifest_builder import EvalManifestBuilder
+
         # Build the manifest
         builder = EvalManifestBuilder(
             output_path=output_path,
             enable_analysis=enable_analysis,
-            sample_size=sample_size
+            sample_size=sample_size,
+            max_parallel_datasets=max_parallel_datasets
         )
         result = await builder.run()
 
         logger.info(f"Manifest build completed: {result}")
         return result
 
-    def get_manifest(self, version: Optional[str] = None) -> Dict[str, Any]:
-        """Get manifest file by version.
+    def resolve_manifest_file(self, version: Optional[str] = None) -> Path:
+        """Resolve the manifest file for a version without reading it.
 
         Args:
-            version: Optional version number (e.g., "1.0.5"). If None, returns latest.
+            version: Optional version number (e.g., "1.0.5"). If None, resolves the latest.
 
         Returns:
-            dict: Manifest content
+            Path: The manifest file, with the latest symlink resolved
 
         Raises:
             ClientException: If version not found or file doesn't exist
@@ -108,6 +115,39 @@ class EvalService:
             if manifest_file.is_symlink():
                 manifest_file = manifest_file.resolve()
 
+        return manifest_file
+
+    def get_manifest_validator(self, version: Optional[str] = None) -> Tuple[str, datetime]:
+        """Get the ETag and Last-Modified value of a manifest from its file metadata.
+
+        Args:
+            version: Optional version number. If None, uses the latest.
+
+        Returns:
+            tuple: The strong ETag and the file modification time
+
+        Raises:
+            ClientException: If version not found or file doesn't exist
+        """
+        manifest_file = self.resolve_manifest_file(version)
+        stat = manifest_file.stat()
+        etag = make_etag("eval-manifest", manifest_file.name, stat.st_mtime_ns, stat.st_size)
+        return etag, datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+
+    def get_manifest(self, version: Optional[str] = None) -> Dict[str, Any]:
+        """Get manifest file by version.
+
+        Args:
+            version: Optional version number (e.g., "1.0.5"). If None, returns latest.
+
+        Returns:
+            dict: Manifest content
+
+        Raises:
+            ClientException: If version not found or file doesn't exist
+        """
+        manifest_file = self.resolve_manifest_file(version)
+
         logger.info(f"Reading manifest from: {manifest_file}")
 
         try:
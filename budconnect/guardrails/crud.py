@@ -16,16 +16,19 @@
 
 """CRUD operations for guardrail models."""
 
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 from uuid import UUID
 
 from budmicroframe.commons import logging
 from budmicroframe.shared.psql_service import CRUDMixin, DBCreateSchemaType, ModelType
-from sqlalchemy import func
+from sqlalchemy import func, select, true, tuple_
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session
 
+from ..commons.constants import ScannerTypeEnum
+from ..commons.pagination import decode_name_keyset_cursor, encode_name_keyset_cursor
+from ..commons.upsert import bulk_upsert_by_uri
 from ..model.models import Provider
 from .models import GuardrailProbe, GuardrailRule
 
@@ -113,11 +116,32 @@ class GuardrailProbeCRUD(CRUDMixin[GuardrailProbe, None, None]):
         finally:
             self.cleanup_session(_session if session is None else None)
 
+    def bulk_upsert(
+        self, rows: List[Dict[str, Any]], session: Session, batch_size: int = 500
+    ) -> Tuple[Dict[str, UUID], Dict[str, int]]:
+        """Upsert probes by URI with multi-row statements, skipping the ones whose content hash is unchanged.
+
+        The statements run inside the caller's transaction; committing or rolling back is left to the caller.
+
+        Args:
+            rows: Probe rows keyed by column name, all with the same keys. Rows sharing a URI are collapsed,
+                last one wins.
+            session: The session owning the transaction.
+            batch_size: Number of rows per multi-row statement.
+
+        Returns:
+            Mapping of probe URI to probe ID, and counts of inserted, updated and unchanged probes.
+        """
+        return bulk_upsert_by_uri(session, self.model.__table__, rows, batch_size)
+
     def get_compatible_providers(
         self, provider_id: UUID, offset: int, limit: int, session: Optional[Session] = None
     ) -> Tuple[int, List[GuardrailProbe]]:
         """Get the guardrail probes for a given provider.
 
+        The rule aggregates (guard, modality and scanner types, examples, rules count) are columns of the
+        probe, so the page and its total come from a single query without loading any rule rows.
+
         Args:
             provider_id: The ID of the provider to get guardrail probes for.
             offset: The offset to start the pagination from.
@@ -129,36 +153,67 @@ class GuardrailProbeCRUD(CRUDMixin[GuardrailProbe, None, None]):
         """
         _session = session or self.get_session()
         try:
-            # Get total count of probes for this provider
+            results = (
+                _session.query(GuardrailProbe, func.count().over().label("total_probes"))
+                .filter(GuardrailProbe.provider_id == provider_id)
+                .order_by(GuardrailProbe.name)
+                .offset(offset)
+                .limit(limit)
+                .all()
+            )
+            if results:
+                return results[0].total_probes, [probe for probe, _ in results]
+
+            # Past the last page the window count has no row to ride on
             total_probes = (
                 _session.query(func.count(GuardrailProbe.id))
                 .filter(GuardrailProbe.provider_id == provider_id)
                 .scalar()
             )
+            return total_probes, []
+        finally:
+            self.cleanup_session(_session if session is None else None)
 
-            # Get probes with rules count
-            query = (
-                _session.query(GuardrailProbe, func.count(GuardrailRule.id).label("rules_count"))
-                .outerjoin(GuardrailRule, GuardrailProbe.id == GuardrailRule.probe_id)
-                .filter(GuardrailProbe.provider_id == provider_id)
-                .group_by(GuardrailProbe.id)
-                .order_by(GuardrailProbe.name)
-                .offset(offset)
-                .limit(limit)
-            )
+    def get_probes_by_providers(
+        self, provider_ids: List[UUID], limit_per_provider: int, session: Optional[Session] = None
+    ) -> Dict[UUID, List[GuardrailProbe]]:
+        """Get the guardrail probes of several providers in one query.
 
-            results = query.all()
+        Args:
+            provider_ids: The IDs of the providers to get guardrail probes for.
+            limit_per_provider: The largest number of probes returned per provider, in name order.
+            session: The session to use for the query.
 
-            # Process results to include rules count and hybrid properties
-            probes_with_details = []
-            for probe, rules_count in results:
-                # Access hybrid properties to ensure they're loaded
-                probe.rules_count = rules_count
-                # The hybrid properties will be automatically included when serializing
-                # They include: guard_types, scanner_types, modality_types, examples
-                probes_with_details.append(probe)
+        Returns:
+            The probes of each provider ordered by name, keyed by provider ID. Providers without probes
+            map to an empty list.
+        """
+        probes_by_provider: Dict[UUID, List[GuardrailProbe]] = {provider_id: [] for provider_id in provider_ids}
+        if not provider_ids:
+            return probes_by_provider
 
-            return total_probes, probes_with_details
+        _session = session or self.get_session()
+        try:
+            ranked = (
+                select(
+                    GuardrailProbe.id,
+                    func.row_number()
+                    .over(partition_by=GuardrailProbe.provider_id, order_by=GuardrailProbe.name)
+                    .label("position"),
+                )
+                .where(GuardrailProbe.provider_id.in_(provider_ids))
+                .subquery()
+            )
+            probes = (
+                _session.query(GuardrailProbe)
+                .join(ranked, ranked.c.id == GuardrailProbe.id)
+                .filter(ranked.c.position <= limit_per_provider)
+                .order_by(GuardrailProbe.provider_id, ranked.c.position)
+                .all()
+            )
+            for probe in probes:
+                probes_by_provider[cast(UUID, probe.provider_id)].append(probe)
+            return probes_by_provider
         finally:
             self.cleanup_session(_session if session is None else None)
 
@@ -280,24 +335,82 @@ class GuardrailRuleCRUD(CRUDMixin[GuardrailRule, None, None]):
         finally:
             self.cleanup_session(_session if session is None else None)
 
+    def bulk_upsert(
+        self, rows: List[Dict[str, Any]], session: Session, batch_size: int = 500
+    ) -> Tuple[Dict[str, UUID], Dict[str, int]]:
+        """Upsert rules by URI with multi-row statements, skipping the ones whose content hash is unchanged.
+
+        The probe aggregates are refreshed once per statement by the ``guardrail_rules`` triggers. The
+        statements run inside the caller's transaction; committing or rolling back is left to the caller.
+
+        Args:
+            rows: Rule rows keyed by column name, all with the same keys. Rows sharing a URI are collapsed,
+                last one wins.
+            session: The session owning the transaction.
+            batch_size: Number of rows per multi-row statement.
+
+        Returns:
+            Mapping of rule URI to rule ID, and counts of inserted, updated and unchanged rules.
+        """
+        return bulk_upsert_by_uri(session, self.model.__table__, rows, batch_size)
+
     def get_by_probe_id(
-        self, probe_id: UUID, offset: int, limit: int, session: Optional[Session] = None
+        self,
+        probe_id: UUID,
+        offset: int,
+        limit: int,
+        scanner_type: Optional[ScannerTypeEnum] = None,
+        modality: Optional[str] = None,
+        cursor: Optional[str] = None,
+        session: Optional[Session] = None,
     ) -> Optional[Dict[str, Any]]:
         """Get guardrail probe details with paginated rules and provider information.
 
+        The probe header, the provider, the page of rules and the number of matching rules (a window count)
+        come from one query; the probe's rule collection is never loaded. The matching rules are counted and
+        the page is cut over their ``(id, name)`` pairs only, so full rule rows are read for the page alone.
+        Rules are ordered by ``(name, id)``, so a cursor continues right after the last rule of the previous
+        page.
+
         Args:
             probe_id: The ID of the probe to get details for.
-            offset: The offset to start the pagination from for rules.
+            offset: The offset to start the pagination from for rules, ignored when a cursor is given.
             limit: The number of rules to return.
+            scanner_type: Only return rules of this scanner type.
+            modality: Only return rules supporting this modality.
+            cursor: Cursor returned as ``next_cursor`` with the previous page.
             session: The session to use for the query.
 
         Returns:
             A dictionary containing probe details, provider info, and paginated rules if found, None otherwise.
+
+        Raises:
+            ClientException: If the cursor is malformed.
         """
+        rule_filters = [GuardrailRule.probe_id == probe_id]
+        if scanner_type is not None:
+            rule_filters.append(GuardrailRule.scanner_type == scanner_type)
+        if modality is not None:
+            rule_filters.append(GuardrailRule.modality_types.contains([modality]))
+
+        # Count every matching rule before the page is cut, so the total ignores the cursor
+        matching = (
+            select(GuardrailRule.id, GuardrailRule.name, func.count().over().label("total_rules"))
+            .where(*rule_filters)
+            .subquery("matching_rules")
+        )
+        page_query = select(matching).order_by(matching.c.name, matching.c.id).limit(limit + 1)
+        if cursor:
+            name, rule_id = decode_name_keyset_cursor(cursor)
+            page_query = page_query.where(tuple_(matching.c.name, matching.c.id) > tuple_(name, rule_id))
+        else:
+            page_query = page_query.offset(offset)
+        rule_page = page_query.subquery("rule_page")
+
         _session = session or self.get_session()
         try:
-            # First, get the probe with provider information
-            probe_result = (
+            # The page is outer joined so the probe header is returned even when no rule matches
+            rows = (
                 _session.query(
                     GuardrailProbe,
                     Provider.id.label("provider_id"),
@@ -305,33 +418,36 @@ class GuardrailRuleCRUD(CRUDMixin[GuardrailRule, None, None]):
                     Provider.provider_type.label("provider_type"),
                     Provider.icon.label("provider_icon"),
                     Provider.description.label("provider_description"),
+                    GuardrailRule,
+                    rule_page.c.total_rules,
                 )
                 .join(Provider, GuardrailProbe.provider_id == Provider.id)
+                .outerjoin(rule_page, true())
+                .outerjoin(GuardrailRule, GuardrailRule.id == rule_page.c.id)
                 .filter(GuardrailProbe.id == probe_id)
-                .options(selectinload(GuardrailProbe.rules))  # Eagerly load rules
-                .first()
+                .order_by(rule_page.c.name, rule_page.c.id)
+                .all()
             )
 
-            if not probe_result:
+            if not rows:
                 return None
 
-            probe, provider_id, provider_name, provider_type, provider_icon, provider_description = probe_result
+            probe, provider_id, provider_name, provider_type, provider_icon, provider_description, _, _ = rows[0]
+            rules = [row[6] for row in rows if row[6] is not None]
 
-            # Get total count of rules for this probe
-            total_rules = (
-                _session.query(func.count(GuardrailRule.id)).filter(GuardrailRule.probe_id == probe_id).scalar()
-            )
-
-            # Get paginated rules
-            rules_query = (
-                _session.query(GuardrailRule)
-                .filter(GuardrailRule.probe_id == probe_id)
-                .order_by(GuardrailRule.name)
-                .offset(offset)
-                .limit(limit)
-            )
+            if rules:
+                total_rules = rows[0][7]
+            elif offset == 0 and not cursor:
+                total_rules = 0
+            else:
+                # Past the last page the window count has no row to ride on
+                total_rules = _session.query(func.count(GuardrailRule.id)).filter(*rule_filters).scalar()
 
-            rules = rules_query.all()
+            next_cursor = None
+            if len(rules) > limit:
+                rules = rules[:limit]
+                if rules:
+                    next_cursor = encode_name_keyset_cursor(rules[-1].name, rules[-1].id)
 
             # Combine all data into a single dictionary
             combined_data = {
@@ -342,11 +458,11 @@ class GuardrailRuleCRUD(CRUDMixin[GuardrailRule, None, None]):
                 "description": probe.description,
                 "icon": probe.icon,
                 "tags": probe.tags,
-                "examples": probe.examples,  # This will use the hybrid property
+                "examples": probe.examples,
                 "deprecation_date": probe.deprecation_date,
-                "guard_types": probe.guard_types,  # Hybrid property
-                "scanner_types": probe.scanner_types,  # Hybrid property
-                "modality_types": probe.modality_types,  # Hybrid property
+                "guard_types": probe.guard_types,
+                "scanner_types": probe.scanner_types,
+                "modality_types": probe.modality_types,
                 "created_at": probe.created_at,
                 "modified_at": probe.modified_at,
                 # Provider fields
@@ -357,6 +473,7 @@ class GuardrailRuleCRUD(CRUDMixin[GuardrailRule, None, None]):
                 "provider_description": provider_description,
                 # Rules pagination info
                 "total_items": total_rules,
+                "next_cursor": next_cursor,
                 # Rules data
                 "items": [
                     {
@@ -3,9 +3,8 @@ from typing import List, Optional
 from uuid import UUID, uuid4
 
 from budmicroframe.shared.psql_service import PSQLBase, TimestampMixin
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, String, Uuid, func, select
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, Integer, String, Uuid
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
-from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..commons.constants import ModelProviderTypeEnum, ScannerTypeEnum
@@ -23,6 +22,16 @@ class GuardrailProbe(PSQLBase, TimestampMixin):
     icon: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
     tags: Mapped[List[str]] = mapped_column(JSONB, nullable=True)
     deprecation_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    # SHA-256 of the seeded payload, used by the seeder to skip unchanged probes
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+
+    # Aggregates of the probe's rules, maintained by the guardrail_rules triggers
+    # (refresh_guardrail_probe_aggregates) so listings never load rule rows
+    guard_types: Mapped[List[str]] = mapped_column(ARRAY(String), nullable=False, server_default="{}")
+    modality_types: Mapped[List[str]] = mapped_column(ARRAY(String), nullable=False, server_default="{}")
+    scanner_types: Mapped[List[str]] = mapped_column(ARRAY(String), nullable=False, server_default="{}")
+    examples: Mapped[List[str]] = mapped_column(ARRAY(String), nullable=False, server_default="{}")
+    rules_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
 
     # Foreign keys
     provider_id: Mapped[UUID] = mapped_column(ForeignKey("provider.id", ondelete="RESTRICT"), nullable=False)
@@ -31,106 +40,12 @@ class GuardrailProbe(PSQLBase, TimestampMixin):
     provider: Mapped["Provider"] = relationship(back_populates="probes")
     rules: Mapped[List["GuardrailRule"]] = relationship(back_populates="probe", cascade="all, delete-orphan")
 
-    @hybrid_property
-    def guard_types(self) -> List[str]:
-        """Python-side implementation: Aggregates unique guard_types from all rules."""
-        if not self.rules:
-            return []
-        # Use a set to efficiently find unique types
-        all_types = set()
-        for rule in self.rules:
-            if rule.guard_types:
-                all_types.update(rule.guard_types)
-        return sorted(all_types)  # sorted for consistent output
-
-    @guard_types.expression
-    def guard_types(cls):
-        """SQL-side implementation: Generates a subquery to aggregate types."""
-        # This subquery unnests all arrays, finds distinct values, and re-aggregates them.
-        subquery = (
-            select(func.array_agg(func.distinct(func.unnest(GuardrailRule.guard_types))))
-            .where(GuardrailRule.probe_id == cls.id)
-            .label("aggregated_guard_types")
-        )
-        return subquery.as_scalar()
-
-    @hybrid_property
-    def modality_types(self) -> List[str]:
-        if not self.rules:
-            return []
-        all_types = set()
-        for rule in self.rules:
-            if rule.modality_types:
-                all_types.update(rule.modality_types)
-        return sorted(all_types)
-
-    @modality_types.expression
-    def modality_types(cls):
-        subquery = (
-            select(func.array_agg(func.distinct(func.unnest(GuardrailRule.modality_types))))
-            .where(GuardrailRule.probe_id == cls.id)
-            .label("aggregated_modality_types")
-        )
-        return subquery.as_scalar()
-
-    @hybrid_property
-    def scanner_types(self) -> List[str]:
-        """Aggregates unique scanner_type values from all rules."""
-        if not self.rules:
-            return []
-        all_types = set()
-        for rule in self.rules:
-            if rule.scanner_type:
-                all_types.add(rule.scanner_type.value if hasattr(rule.scanner_type, "value") else str(rule.scanner_type))
-        return sorted(all_types)
-
-    @scanner_types.expression
-    def scanner_types(cls):
-        subquery = (
-            select(func.array_agg(func.distinct(GuardrailRule.scanner_type)))
-            .where(GuardrailRule.probe_id == cls.id)
-            .where(GuardrailRule.scanner_type.isnot(None))
-            .label("aggregated_scanner_types")
-        )
-        return subquery.as_scalar()
-
-    @hybrid_property
-    def examples(self) -> List[str]:
-        """Python-side implementation for examples.
-        Aggregates all unique examples from rules and returns up to 10.
-        """
-        if not self.rules:
-            return []
-        all_examples = set()
-        for rule in self.rules:
-            if rule.examples:
-                all_examples.update(rule.examples)
-        # Sort for consistent output and then slice the top 10
-        return sorted(all_examples)[:10]
-
-    @examples.expression
-    def examples(cls):
-        """SQL expression that aggregates up to 10 unique examples into a single array."""
-        # Step 1: Create a subquery to get the first 10 distinct, unnested examples for a probe.
-        # We must do the LIMIT here, before the final aggregation.
-        limited_examples_subquery = (
-            select(func.unnest(GuardrailRule.examples).label("example"))
-            .where(GuardrailRule.probe_id == cls.id)
-            .distinct()
-            .limit(10)
-            .subquery("limited_examples")
-        )
-
-        # Step 2: Aggregate the results of the subquery back into an array.
-        final_query = select(func.array_agg(limited_examples_subquery.c.example))
-
-        return final_query.label("aggregated_examples").as_scalar()
-
 
 class GuardrailRule(PSQLBase, TimestampMixin):
     """Specific rules within each probe."""
 
     __tablename__ = "guardrail_rules"
+    __table_args__ = (Index("ix_guardrail_rules_probe_id_name_id", "probe_id", "name", "id"),)
 
     id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid4)
     probe_id: Mapped[UUID] = mapped_column(
@@ -156,6 +71,8 @@ class GuardrailRule(PSQLBase, TimestampMixin):
         nullable=True,
     )
     is_gated: Mapped[Optional[bool]] = mapped_column(Boolean, nullable=True)
+    # SHA-256 of the seeded payload, used by the seeder to skip unchanged rules
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
 
     # Relationships
     probe: Mapped["GuardrailProbe"] = relationship("GuardrailProbe", back_populates="rules")
@@ -24,7 +24,10 @@ from budmicroframe.commons.schemas import ErrorResponse
 from fastapi import APIRouter, Query, status
 from fastapi.responses import JSONResponse
 from pydantic import UUID4
+from typing_extensions import Annotated
 
+from ..commons.constants import ScannerTypeEnum
+from ..commons.executor import run_sync
 from .services import GuardrailService
 
 
@@ -46,7 +49,7 @@ async def get_compatible_guardrails(
     offset = (page - 1) * limit
 
     try:
-        response = GuardrailService.get_compatible_probes(engine, offset, limit, engine_version)
+        response = await run_sync(GuardrailService.get_compatible_probes, engine, offset, limit, engine_version)
         return response.to_http_response()
     except ClientException as e:
         logger.error(f"Client exception: {e}")
@@ -62,12 +65,27 @@ async def get_compatible_guardrails(
 
 @guardrail_router.get("/probes/{probe_id}/rules")
 async def get_guardrail_details(
-    probe_id: UUID4, page: int = Query(1, ge=1), limit: int = Query(5, ge=0)
+    probe_id: UUID4,
+    page: int = Query(1, ge=1),
+    limit: int = Query(5, ge=0),
+    scanner_type: Annotated[Optional[ScannerTypeEnum], Query(description="Filter rules by scanner type")] = None,
+    modality: Annotated[Optional[str], Query(description="Filter rules by supported modality")] = None,
+    cursor: Annotated[
+        Optional[str], Query(description="Cursor of the next page returned by the previous call; overrides page")
+    ] = None,
 ) -> JSONResponse:
     """Get rules information for a specific probe by ID.
 
+    Clients walking all rules of a probe should follow ``next_cursor`` instead of incrementing ``page``;
+    a cursor neither skips nor repeats rules when rules are added or removed between calls.
+
     Args:
         probe_id: The ID of the probe to get rules for.
+        page: Page number (starts from 1), used when no cursor is given
+        limit: Number of rules per page
+        scanner_type: Optional scanner type the rules must have
+        modality: Optional modality the rules must support
+        cursor: Optional cursor returned as ``next_cursor`` by the previous page
 
     Returns:
         JSONResponse containing the probe rulesz or error message.
@@ -76,7 +94,9 @@ async def get_guardrail_details(
     offset = (page - 1) * limit
 
     try:
-        response = GuardrailService.get_probe_rules(probe_id, offset, limit)
+        response = await run_sync(
+            GuardrailService.get_probe_rules, probe_id, offset, limit, scanner_type, modality, cursor
+        )
         if response:
             return JSONResponse(status_code=status.HTTP_200_OK, content=response.model_dump(mode="json"))
         else:
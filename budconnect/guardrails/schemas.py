@@ -153,3 +153,4 @@ class GuardrailRuleResponse(PaginatedResponse):
 
     # Rules data
     items: List[RuleDetail]
+    next_cursor: Optional[str] = None
@@ -22,7 +22,7 @@ from budmicroframe.commons import logging
 from fastapi import status
 from pydantic import UUID4
 
-from ..commons.constants import ProviderCapabilityEnum
+from ..commons.constants import ProviderCapabilityEnum, ScannerTypeEnum
 from ..engine.crud import EngineCRUD, EngineVersionCRUD
 from ..model.crud import ProviderCRUD
 from .crud import GuardrailProbeCRUD, GuardrailRuleCRUD
@@ -105,49 +105,44 @@ class GuardrailService:
                 db_engine_version.id, ProviderCapabilityEnum.MODERATION, offset, limit
             )
 
+        # Get the probes of every provider on the page in one query; the rule aggregates are probe columns
         with GuardrailProbeCRUD() as probe_crud:
-            session = probe_crud.get_session()
-            try:
-                # For each provider, get their guardrail probes
-                for db_provider in providers_with_moderation:
-                    # Get all guardrail probes for this provider with correct pagination
-                    total_probes, probes_with_details = probe_crud.get_compatible_providers(
-                        db_provider.id, 0, 1000, session=session
-                    )
-
-                    # Convert probes to response format
-                    probe_responses = []
-                    for probe in probes_with_details:
-                        probe_response = GuardrailProbeResponse(
-                            id=probe.id,
-                            name=probe.name,
-                            uri=probe.uri,
-                            provider_id=probe.provider_id,
-                            description=probe.description,
-                            icon=probe.icon,
-                            tags=probe.tags,
-                            deprecation_date=probe.deprecation_date,
-                            examples=probe.examples,
-                            guard_types=probe.guard_types,
-                            scanner_types=probe.scanner_types,
-                            modality_types=probe.modality_types,
-                            rules_count=getattr(probe, "rules_count", 0),
-                        )
-                        probe_responses.append(probe_response)
-
-                    provider_response = CompatibleProviders(
-                        id=db_provider.id,
-                        name=db_provider.name,
-                        provider_type=db_provider.provider_type,
-                        icon=db_provider.icon,
-                        description=db_provider.description,
-                        credentials=db_provider.credentials,
-                        capabilities=db_provider.capabilities,
-                        probes=probe_responses,
-                    )
-                    compatible_providers.append(provider_response)
-            finally:
-                probe_crud.cleanup_session(session)
+            probes_by_provider = probe_crud.get_probes_by_providers(
+                [db_provider.id for db_provider in providers_with_moderation], limit_per_provider=1000
+            )
+
+        for db_provider in providers_with_moderation:
+            # Convert probes to response format
+            probe_responses = [
+                GuardrailProbeResponse(
+                    id=probe.id,
+                    name=probe.name,
+                    uri=probe.uri,
+                    provider_id=probe.provider_id,
+                    description=probe.description,
+                    icon=probe.icon,
+                    tags=probe.tags,
+                    deprecation_date=probe.deprecation_date,
+                    examples=probe.examples,
+                    guard_types=probe.guard_types,
+                    scanner_types=probe.scanner_types,
+                    modality_types=probe.modality_types,
+                    rules_count=probe.rules_count,
+                )
+                for probe in probes_by_provider[db_provider.id]
+            ]
+
+            provider_response = CompatibleProviders(
+                id=db_provider.id,
+                name=db_provider.name,
+                provider_type=db_provider.provider_type,
+                icon=db_provider.icon,
+                description=db_provider.description,
+                credentials=db_provider.credentials,
+                capabilities=db_provider.capabilities,
+                probes=probe_responses,
+            )
+            compatible_providers.append(provider_response)
 
         return CompatibleProbesResponse(
             object="guardrail.compatible",
@@ -161,18 +156,32 @@ class GuardrailService:
         )
 
     @staticmethod
-    def get_probe_rules(probe_id: UUID4, offset: int, limit: int) -> Optional[GuardrailRuleResponse]:
+    def get_probe_rules(
+        probe_id: UUID4,
+        offset: int,
+        limit: int,
+        scanner_type: Optional[ScannerTypeEnum] = None,
+        modality: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> Optional[GuardrailRuleResponse]:
         """Get detailed information for a specific guardrail probe including its rules.
 
         Args:
             probe_id: The ID of the probe to get details for.
+            offset: The offset of the rules, ignored when a cursor is given.
+            limit: The number of rules to return.
+            scanner_type: Only return rules of this scanner type.
+            modality: Only return rules supporting this modality.
+            cursor: Cursor returned as ``next_cursor`` with the previous page.
 
         Returns:
             GuardrailRuleResponse if found, None otherwise.
         """
         with GuardrailRuleCRUD() as probe_crud:
             # Get probe details with rules using the get_by_probe_id method
-            combined_data = probe_crud.get_by_probe_id(probe_id, offset=offset, limit=limit)
+            combined_data = probe_crud.get_by_probe_id(
+                probe_id, offset=offset, limit=limit, scanner_type=scanner_type, modality=modality, cursor=cursor
+            )
             if combined_data:
                 return GuardrailRuleResponse(
                     **combined_data, page=(offset // limit) + 1, limit=limit, object="guardrail.rule"
@@ -0,0 +1,97 @@
+#  -----------------------------------------------------------------------------
+#  Copyright (c) 2024 Bud Ecosystem Inc.
+#  #
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  #
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  #
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  -----------------------------------------------------------------------------
+
+"""Two-tier memoization of LLM license analyses.
+
+Many models ship the same Apache-2.0, MIT or Llama license text. Analyses are keyed by
+``license_analysis_key`` (prompt version, LLM model and whitespace-normalized text) and kept in an
+in-process LRU in front of the ``license_analysis`` table, so a repeated extraction skips the LLM call
+and is answered from memory or with a single primary-key lookup.
+"""
+
+import threading
+from typing import Any, Dict, Optional
+
+from budmicroframe.commons import logging
+from cachetools import LRUCache
+
+from ..commons.executor import run_sync
+from .crud import LicenseAnalysisCRUD
+from .extractor import LICENSE_ANALYSIS_PROMPT_VERSION
+
+
+logger = logging.get_logger(__name__)
+
+
+class LicenseAnalysisCache:
+    """LRU memory tier backed by the database tier of persisted analyses.
+
+    Args:
+        maxsize: Number of analyses kept in memory. Zero disables the memory tier only.
+    """
+
+    def __init__(self, maxsize: int = 512) -> None:
+        """Initialize the memory tier."""
+        self._lock = threading.Lock()
+        self._memory: Optional[LRUCache[str, Dict[str, Any]]] = LRUCache(maxsize=maxsize) if maxsize > 0 else None
+
+    async def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return the analysis stored under a key, promoting database hits to the memory tier."""
+        if self._memory is not None:
+            with self._lock:
+                cached = self._memory.get(cache_key)
+            if cached is not None:
+                return dict(cached)
+
+        try:
+            result = await run_sync(_load_result, cache_key)
+        except Exception as e:
+            # The cache is an optimization; a database problem must not fail the extraction
+            logger.warning("Failed to read cached license analysis %s: %s", cache_key[:12], e)
+            return None
+
+        if result is not None:
+            self._remember(cache_key, result)
+        return result
+
+    async def set(self, cache_key: str, llm_model: str, result: Dict[str, Any]) -> None:
+        """Store an analysis in both tiers."""
+        self._remember(cache_key, result)
+        try:
+            await run_sync(_store_result, cache_key, llm_model, result)
+        except Exception as e:
+            logger.warning("Failed to persist license analysis %s: %s", cache_key[:12], e)
+
+    def clear(self) -> None:
+        """Drop the memory tier. Persisted analyses are kept."""
+        if self._memory is not None:
+            with self._lock:
+                self._memory.clear()
+
+    def _remember(self, cache_key: str, result: Dict[str, Any]) -> None:
+        if self._memory is not None:
+            with self._lock:
+                self._memory[cache_key] = dict(result)
+
+
+def _load_result(cache_key: str) -> Optional[Dict[str, Any]]:
+    with LicenseAnalysisCRUD() as crud:
+        return crud.get_result(cache_key)
+
+
+def _store_result(cache_key: str, llm_model: str, result: Dict[str, Any]) -> None:
+    with LicenseAnalysisCRUD() as crud:
+        crud.store_result(cache_key, LICENSE_ANALYSIS_PROMPT_VERSION, llm_model, result)
@@ -0,0 +1,121 @@
+#  -----------------------------------------------------------------------------
+#  Copyright (c) 2024 Bud Ecosystem Inc.
+#  #
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  #
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  #
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  -----------------------------------------------------------------------------
+
+"""Concurrent license extraction over many sources.
+
+``run_batch`` drives a fixed number of worker coroutines over a list of items and yields every outcome as
+soon as its item finishes, so one slow page or LLM answer never holds back the results behind it.
+``extract_license_batch`` applies it to ``extract_license_from_source`` with a shared per-host download
+limit. Both are free of settings and database access so the standalone license extractor script uses the
+same engine as the ``/licenses/extract/batch`` endpoint.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, Generic, Optional, Sequence, Tuple, TypeVar
+
+from .extractor import HostRateLimiter, extract_license_from_source
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class BatchOutcome(Generic[T, R]):
+    """Result of one batch item; exactly one of ``result`` and ``error`` is set."""
+
+    index: int
+    item: T
+    result: Optional[R] = None
+    error: Optional[Exception] = None
+    elapsed: float = 0.0
+
+
+async def run_batch(
+    items: Sequence[T], worker: Callable[[T], Awaitable[R]], concurrency: int
+) -> AsyncGenerator[BatchOutcome[T, R], None]:
+    """Run ``worker`` over ``items`` with bounded concurrency and yield outcomes in completion order.
+
+    An exception raised for one item is captured in its outcome and does not affect the others. Closing
+    the iterator early (e.g. when a streaming client disconnects) cancels the items still in flight.
+
+    Args:
+        items: The items to process.
+        worker: Coroutine function processing one item.
+        concurrency: Maximum number of items processed at the same time.
+
+    Yields:
+        One ``BatchOutcome`` per item, as soon as the item has finished.
+    """
+    queue: "asyncio.Queue[BatchOutcome[T, R]]" = asyncio.Queue()
+    pending = iter(enumerate(items))
+
+    async def drain() -> None:
+        # Workers share one iterator, so each item is picked up by exactly one of them
+        for index, item in pending:
+            start = time.perf_counter()
+            try:
+                result = await worker(item)
+                outcome = BatchOutcome(index, item, result=result, elapsed=time.perf_counter() - start)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                outcome = BatchOutcome(index, item, error=e, elapsed=time.perf_counter() - start)
+            queue.put_nowait(outcome)
+
+    workers = [asyncio.ensure_future(drain()) for _ in range(min(max(1, concurrency), len(items)))]
+    try:
+        for _ in range(len(items)):
+            yield await queue.get()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def extract_license_batch(
+    sources: Sequence[Tuple[str, str]],
+    concurrency: int = 8,
+    per_host_concurrency: int = 2,
+    per_host_interval: float = 0.0,
+    **extract_kwargs: Any,
+) -> AsyncGenerator[BatchOutcome[Tuple[str, str], Dict[str, Any]], None]:
+    """Extract many licenses concurrently, yielding each analysis as soon as it is ready.
+
+    Args:
+        sources: ``(source_type, source)`` pairs as accepted by ``extract_license_from_source``.
+        concurrency: Maximum number of sources fetched, parsed and analysed at the same time.
+        per_host_concurrency: Maximum concurrent downloads from one host.
+        per_host_interval: Minimum delay in seconds between two downloads from the same host.
+        **extract_kwargs: Forwarded to ``extract_license_from_source`` (LLM settings, caches, parse runner).
+
+    Yields:
+        One ``BatchOutcome`` per source holding the extracted license details or the error.
+    """
+    host_limiter = HostRateLimiter(per_host_concurrency, per_host_interval)
+
+    async def extract(source: Tuple[str, str]) -> Dict[str, Any]:
+        source_type, content = source
+        return await extract_license_from_source(source_type, content, host_limiter=host_limiter, **extract_kwargs)
+
+    outcomes = run_batch(sources, extract, concurrency)
+    try:
+        async for outcome in outcomes:
+            yield outcome
+    finally:
+        await outcomes.aclose()
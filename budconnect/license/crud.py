@@ -0,0 +1,102 @@
+#  -----------------------------------------------------------------------------
+#  Copyright (c) 2024 Bud Ecosystem Inc.
+#  #
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  #
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  #
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  -----------------------------------------------------------------------------
+
+"""CRUD operations for persisted LLM license analyses."""
+
+from typing import Any, Dict, Optional
+
+from budmicroframe.commons import logging
+from budmicroframe.shared.psql_service import CRUDMixin
+from sqlalchemy import func, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from .models import LicenseAnalysis
+
+
+logger = logging.get_logger(__name__)
+
+
+class LicenseAnalysisCRUD(CRUDMixin[LicenseAnalysis, None, None]):
+    """Database tier of the license analysis cache."""
+
+    __model__ = LicenseAnalysis
+
+    def __init__(self) -> None:
+        """Initialize the LicenseAnalysisCRUD class."""
+        super().__init__(self.__model__)
+
+    def get_result(self, cache_key: str, session: Optional[Session] = None) -> Optional[Dict[str, Any]]:
+        """Return the stored analysis for a cache key and record the access.
+
+        Args:
+            cache_key: The analysis cache key.
+            session: Optional database session.
+
+        Returns:
+            The stored LLM result, or None if the key is unknown.
+        """
+        _session = session or self.get_session()
+        try:
+            stmt = (
+                update(LicenseAnalysis)
+                .where(LicenseAnalysis.cache_key == cache_key)
+                .values(last_used_at=func.now())
+                .returning(LicenseAnalysis.result)
+            )
+            result = _session.execute(stmt).scalar_one_or_none()
+            _session.commit()
+            return result
+        except SQLAlchemyError:
+            _session.rollback()
+            raise
+        finally:
+            self.cleanup_session(_session if session is None else None)
+
+    def store_result(
+        self,
+        cache_key: str,
+        prompt_version: str,
+        llm_model: str,
+        result: Dict[str, Any],
+        session: Optional[Session] = None,
+    ) -> None:
+        """Store (or replace) the analysis for a cache key.
+
+        Args:
+            cache_key: The analysis cache key.
+            prompt_version: Version of the prompt that produced the result.
+            llm_model: LLM model that produced the result.
+            result: The parsed LLM result.
+            session: Optional database session.
+        """
+        _session = session or self.get_session()
+        try:
+            stmt = insert(LicenseAnalysis).values(
+                cache_key=cache_key, prompt_version=prompt_version, llm_model=llm_model, result=result
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[LicenseAnalysis.cache_key],
+                set_={"result": stmt.excluded.result, "last_used_at": func.now()},
+            )
+            _session.execute(stmt)
+            _session.commit()
+        except SQLAlchemyError:
+            _session.rollback()
+            raise
+        finally:
+            self.cleanup_session(_session if session is None else None)
@@ -4,18 +4,33 @@ This module provides functionality to extract and analyze license information
 from various sources (URLs, files, text) using LLM analysis.
 """
 
+import asyncio
+import base64
+import binascii
+import contextlib
+import functools
+import hashlib
+import io
 import json
 import logging
 import re
-from typing import Any, Dict
-from urllib.request import ProxyHandler, Request, build_opener
+import threading
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
 
+import httpx
 from bs4 import BeautifulSoup
+from cachetools import TTLCache
 from json_repair import repair_json
 from openai import AsyncOpenAI
 from PyPDF2 import PdfReader
 
 
+if TYPE_CHECKING:
+    from .analysis_cache import LicenseAnalysisCache
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,6 +72,9 @@ Q21. Is there a clause that limits their liability in case of legal issues? (Yes
 Q22. Are there terms that prevent the use of the tool for specific purposes (e.g., ethical AI clauses)? (Yes or No) and reasons.
 """
 
+# Bump whenever LICENSE_ANALYSIS_PROMPT changes so analyses produced by the previous prompt are not reused
+LICENSE_ANALYSIS_PROMPT_VERSION = "1"
+
 # License Questions with Impact Assessment
 LICENSE_QUESTIONS = {
     "Q1": {"question": "Can you modify the software, model, or framework?", "impact": "POSITIVE"},
@@ -153,28 +171,214 @@ LICENSE_TYPES = [
 ]
 
 
-def get_url_content(url: str) -> str:
-    """Fetch license content from a URL."""
+class LicenseSourceCache:
+    """Content-addressed cache of license text extracted from URLs and PDFs.
+
+    Extracted text is stored under the SHA-256 of the raw downloaded or uploaded bytes, so identical
+    documents are parsed once whatever URL they came from. For URLs the cache also remembers the
+    validators (ETag / Last-Modified) of the last download, which lets the next fetch be a conditional
+    request answered with 304 and skip both the download and the parse.
+
+    Args:
+        maxsize: Maximum number of texts (and of URLs) kept before the least recently used is evicted.
+        ttl: Time to live of an entry in seconds. A value of zero or less disables the cache.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 3600) -> None:
+        """Initialize an empty cache."""
+        self.enabled = maxsize > 0 and ttl > 0
+        self._lock = threading.Lock()
+        self._texts: TTLCache[str, str] = TTLCache(maxsize=max(1, maxsize), ttl=max(ttl, 1))
+        self._urls: TTLCache[str, Tuple[str, Dict[str, str]]] = TTLCache(maxsize=max(1, maxsize), ttl=max(ttl, 1))
+
+    def get_text(self, digest: str) -> Optional[str]:
+        """Return the text extracted from the document with this SHA-256, if cached."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            return self._texts.get(digest)
+
+    def set_text(self, digest: str, text: str) -> None:
+        """Store the text extracted from the document with this SHA-256."""
+        if self.enabled:
+            with self._lock:
+                self._texts[digest] = text
+
+    def get_url(self, url: str) -> Optional[Tuple[str, Dict[str, str]]]:
+        """Return the content digest and validators of the last download of a URL, if cached."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            return self._urls.get(url)
+
+    def set_url(self, url: str, digest: str, validators: Dict[str, str]) -> None:
+        """Remember the content digest and validators of a URL download."""
+        if self.enabled:
+            with self._lock:
+                self._urls[url] = (digest, validators)
+
+
+class HostRateLimiter:
+    """Per-host limit on concurrent downloads and on how often a download may start.
+
+    Batch extractions typically contain many URLs on the same site (a forge, a docs host); without a
+    limit they would all be requested at once. Each host gets its own semaphore, and download starts
+    are spaced at least ``min_interval`` seconds apart. The limiter belongs to one event loop.
+
+    Args:
+        max_concurrent: Maximum number of in-flight downloads per host.
+        min_interval: Minimum delay in seconds between two download starts on the same host.
+    """
+
+    def __init__(self, max_concurrent: int = 2, min_interval: float = 0.0) -> None:
+        """Initialize a limiter with no hosts seen yet."""
+        self.max_concurrent = max(1, max_concurrent)
+        self.min_interval = max(0.0, min_interval)
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._next_start: Dict[str, float] = {}
+
+    @contextlib.asynccontextmanager
+    async def limit(self, url: str) -> AsyncIterator[None]:
+        """Hold a download slot for the host of ``url`` for the duration of the block."""
+        host = (urlsplit(url).hostname or "").lower()
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self.max_concurrent)
+        async with semaphore:
+            if self.min_interval:
+                loop = asyncio.get_running_loop()
+                now = loop.time()
+                start = max(now, self._next_start.get(host, now))
+                # Reserve the start time before sleeping so concurrent waiters queue up behind it
+                self._next_start[host] = start + self.min_interval
+                if start > now:
+                    await asyncio.sleep(start - now)
+            yield
+
+
+def html_to_text(html: bytes, encoding: str = "utf-8") -> str:
+    """Extract the visible text of an HTML page; CPU-bound, meant to run in a worker process."""
     try:
-        # Set up proxy handler
-        proxy_handler = ProxyHandler({})
-        opener = build_opener(proxy_handler)
+        markup = html.decode(encoding, errors="replace")
+    except LookupError:
+        markup = html.decode("utf-8", errors="replace")
+    soup = BeautifulSoup(markup, "html.parser")
+    return str(soup.text).strip()
+
+
+def pdf_to_text(pdf_bytes: bytes) -> str:
+    """Extract the text of every page of a PDF; CPU-bound, meant to run in a worker process."""
+    reader = PdfReader(io.BytesIO(pdf_bytes))
+    return "\n".join(page.extract_text() for page in reader.pages)
+
+
+# Runs a text extraction function with its arguments off the event loop, e.g. ``commons.executor.run_in_process``
+ParseRunner = Callable[..., Awaitable[str]]
+
+
+async def run_in_executor(executor: Optional[Executor], func: Callable[..., str], *args: Any) -> str:
+    """Run a text extraction function on an executor, the loop's default thread pool when it is None."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, func, *args)
 
-        # Create request with headers
-        req = Request(url, headers={"User-Agent": "Mozilla/5.0"})
 
-        # Fetch content
-        response = opener.open(req)
-        html = response.read().decode("utf-8")
+def _parse_runner(run_parse: Optional[ParseRunner]) -> ParseRunner:
+    return run_parse or functools.partial(run_in_executor, None)
 
-        # Parse HTML
-        soup = BeautifulSoup(html, "html.parser")
-        license_content = str(soup.text).strip()
+
+async def _download(url: str, headers: Dict[str, str], max_bytes: int) -> Tuple[int, bytes, httpx.Headers]:
+    """Stream a URL into memory, aborting as soon as the body exceeds ``max_bytes``."""
+    # trust_env=False keeps the former behaviour of ignoring proxy environment variables
+    client = httpx.AsyncClient(follow_redirects=True, trust_env=False)
+    async with client, client.stream("GET", url, headers=headers) as response:
+        if response.status_code == 304:
+            return 304, b"", response.headers
+        response.raise_for_status()
+
+        declared = response.headers.get("content-length")
+        if declared and declared.isdigit() and int(declared) > max_bytes:
+            raise LicenseExtractionException(f"License source at {url} exceeds {max_bytes} bytes")
+
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body.extend(chunk)
+            if len(body) > max_bytes:
+                raise LicenseExtractionException(f"License source at {url} exceeds {max_bytes} bytes")
+        return response.status_code, bytes(body), response.headers
+
+
+async def get_url_content(
+    url: str,
+    timeout: float = 30.0,
+    max_bytes: int = 5 * 1024 * 1024,
+    cache: Optional[LicenseSourceCache] = None,
+    run_parse: Optional[ParseRunner] = None,
+    host_limiter: Optional[HostRateLimiter] = None,
+) -> str:
+    """Fetch license content from a URL without blocking the event loop.
+
+    Args:
+        url: The license URL.
+        timeout: Total time allowed for the download, in seconds.
+        max_bytes: Largest accepted response body.
+        cache: Optional cache of previously fetched and extracted texts.
+        run_parse: Runner of the HTML parsing. Defaults to the loop's thread pool; pass one backed by a
+            process pool to keep the parse off the GIL.
+        host_limiter: Optional per-host download limit. The timeout starts once a slot is granted.
+
+    Returns:
+        The text content of the page.
+    """
+    headers = {"User-Agent": "Mozilla/5.0"}
+    cached_text = None
+    cached = cache.get_url(url) if cache is not None else None
+    if cache is not None and cached is not None:
+        cached_text = cache.get_text(cached[0])
+        if cached_text is not None:
+            # Revalidate instead of downloading again; a 304 reuses the cached text
+            headers.update(cached[1])
+
+    try:
+        if host_limiter is None:
+            status_code, body, response_headers = await asyncio.wait_for(
+                _download(url, headers, max_bytes), timeout=timeout
+            )
+        else:
+            async with host_limiter.limit(url):
+                status_code, body, response_headers = await asyncio.wait_for(
+                    _download(url, headers, max_bytes), timeout=timeout
+                )
+        if status_code == 304 and cached_text is not None:
+            logger.debug("License source %s not modified, reusing cached text", url)
+            return cached_text
+
+        digest = hashlib.sha256(body).hexdigest()
+        license_content = cache.get_text(digest) if cache else None
+        if license_content is None:
+            charset = "utf-8"
+            content_type = response_headers.get("content-type", "")
+            if "charset=" in content_type:
+                charset = content_type.split("charset=", 1)[1].split(";")[0].strip(' "')
+            license_content = await _parse_runner(run_parse)(html_to_text, body, charset)
+            if license_content and cache:
+                cache.set_text(digest, license_content)
 
         if not license_content:
             raise LicenseExtractionException(f"Unable to get license text from URL: {url}")
 
+        if cache:
+            validators = {}
+            if response_headers.get("etag"):
+                validators["If-None-Match"] = response_headers["etag"]
+            if response_headers.get("last-modified"):
+                validators["If-Modified-Since"] = response_headers["last-modified"]
+            cache.set_url(url, digest, validators)
         return license_content
+    except LicenseExtractionException:
+        raise
+    except asyncio.TimeoutError as e:
+        logger.error(f"Timed out after {timeout}s fetching license content from URL: {url}")
+        raise LicenseExtractionException(f"Timed out fetching content from URL: {url}") from e
     except Exception as e:
         logger.error(f"Error fetching license content from URL: {url} - {e}")
         raise LicenseExtractionException(f"Unable to fetch content from URL: {url}") from e
@@ -187,21 +391,52 @@ def get_text_content(text: str) -> str:
     return text.strip()
 
 
-def get_pdf_content(pdf_bytes: bytes) -> str:
-    """Extract text from PDF bytes."""
+async def get_pdf_content(
+    pdf_bytes: bytes,
+    max_bytes: int = 5 * 1024 * 1024,
+    cache: Optional[LicenseSourceCache] = None,
+    run_parse: Optional[ParseRunner] = None,
+) -> str:
+    """Extract text from PDF bytes without blocking the event loop.
+
+    Args:
+        pdf_bytes: The PDF document.
+        max_bytes: Largest accepted document.
+        cache: Optional cache of extracted texts, keyed by the SHA-256 of the PDF bytes.
+        run_parse: Runner of the PDF parsing, see ``get_url_content``.
+
+    Returns:
+        The text of all pages.
+    """
+    if len(pdf_bytes) > max_bytes:
+        raise LicenseExtractionException(f"PDF exceeds {max_bytes} bytes")
+
+    digest = hashlib.sha256(pdf_bytes).hexdigest()
+    cached_text = cache.get_text(digest) if cache else None
+    if cached_text is not None:
+        return cached_text
+
     try:
-        import io
-
-        pdf_text = []
-        pdf_file = io.BytesIO(pdf_bytes)
-        reader = PdfReader(pdf_file)
-        for page in reader.pages:
-            pdf_text.append(page.extract_text())
-        return "\n".join(pdf_text)
+        text = await _parse_runner(run_parse)(pdf_to_text, pdf_bytes)
     except Exception as e:
         logger.error(f"Error reading PDF content: {e}")
         raise LicenseExtractionException("Unable to read PDF content") from e
 
+    if cache:
+        cache.set_text(digest, text)
+    return text
+
+
+def normalize_license_text(text: str) -> str:
+    """Collapse all whitespace runs so re-wrapped or re-indented copies of a license compare equal."""
+    return " ".join(text.split())
+
+
+def license_analysis_key(license_text: str, model: str) -> str:
+    """Return the analysis cache key of a license text for an LLM model and the current prompt version."""
+    material = "\n".join((LICENSE_ANALYSIS_PROMPT_VERSION, model, normalize_license_text(license_text)))
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
 
 def extract_json_from_string(response_text: str) -> str:
     """Extract JSON content from the LLM response text."""
@@ -231,14 +466,42 @@ async def generate_license_details(
     base_url: str = "https://api.openai.com/v1",
     model: str = "gpt-4",
     timeout: int = 120,
+    analysis_cache: Optional["LicenseAnalysisCache"] = None,
 ) -> Dict[str, Any]:
-    """Generate license details from the license text using LLM analysis."""
+    """Generate license details from the license text using LLM analysis.
+
+    With an ``analysis_cache`` the parsed LLM answer is memoized under ``license_analysis_key``, so a
+    license text that was analysed before (by any model entry sharing it) skips the LLM call.
+    """
     if not license_text:
         raise LicenseExtractionException("License content is empty")
 
-    if not api_key:
-        raise LicenseExtractionException("LLM API key is required for license extraction")
+    cache_key = license_analysis_key(license_text, model)
+    cached = await analysis_cache.get(cache_key) if analysis_cache is not None else None
+    if cached is not None:
+        logger.info("Reusing cached license analysis %s", cache_key[:12])
+        llm_data = cached
+    else:
+        if not api_key:
+            raise LicenseExtractionException("LLM API key is required for license extraction")
+        llm_data = await _request_license_analysis(license_text, api_key, base_url, model, timeout)
 
+    try:
+        details = build_license_details(llm_data)
+    except Exception as e:
+        logger.error(f"Error generating license FAQ: {e}")
+        raise LicenseExtractionException("Extracting license details failed") from e
+
+    # Only answers that produced valid details are cached, a malformed one is asked again next time
+    if cached is None and analysis_cache is not None:
+        await analysis_cache.set(cache_key, model, llm_data)
+    return details
+
+
+async def _request_license_analysis(
+    license_text: str, api_key: str, base_url: str, model: str, timeout: int
+) -> Dict[str, Any]:
+    """Send the license text to the LLM and return its parsed JSON answer."""
     try:
         # Initialize AsyncOpenAI client with configurable timeout for LLM calls
         client = AsyncOpenAI(api_key=api_key, base_url=base_url, timeout=float(timeout))
@@ -270,54 +533,56 @@ async def generate_license_details(
             logger.warning("Initial JSON parsing failed, attempting repair...")
             repaired_json = repair_json(json_str)
             llm_data = json.loads(repaired_json)
+        if not isinstance(llm_data, dict):
+            raise LicenseExtractionException("LLM response is not a JSON object")
+        return llm_data
+    except Exception as e:
+        logger.error(f"Error generating license FAQ: {e}")
+        raise LicenseExtractionException("Extracting license details failed") from e
 
-        # Process the response
-        answers = {}
-        answers["name"] = llm_data.get("name", "Unknown")
-        answers["type"] = llm_data.get("type", "Unknown")
-        answers["type_description"] = ""
-        answers["type_suitability"] = ""
-        answers["faqs"] = []
-
-        # Find matching license type information
-        for license_type in LICENSE_TYPES:
-            if license_type["type"].lower() == answers["type"].lower():
-                answers["type_description"] = license_type["description"]
-                answers["type_suitability"] = license_type["suitability"]
-                break
-
-        # Process FAQ answers
-        for k, v in llm_data.items():
-            if k.upper() in LICENSE_QUESTIONS:
-                faq_item = {}
-
-                # Set default impact as NEUTRAL
-                impact = "NEUTRAL"
-
-                # Get the expected impact from license questions
-                expected_impact = LICENSE_QUESTIONS[k.upper()]["impact"]
-
-                # Determine actual impact based on answer
-                if v.get("answer", "").lower() == "yes":
-                    impact = expected_impact
-                elif v.get("answer", "").lower() == "no":
-                    impact = "POSITIVE" if expected_impact == "NEGATIVE" else "NEGATIVE"
-
-                # Build FAQ item
-                faq_item["question"] = v.get("question", LICENSE_QUESTIONS[k.upper()]["question"])
-                faq_item["answer"] = v.get("answer", "")
-                faq_item["reason"] = (
-                    v.get("reason", []) if isinstance(v.get("reason"), list) else [v.get("reason", "")]
-                )
-                faq_item["impact"] = impact
 
-                answers["faqs"].append(faq_item)
+def build_license_details(llm_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Map the LLM's JSON answer to license fields and FAQ items with their impact."""
+    answers: Dict[str, Any] = {}
+    answers["name"] = llm_data.get("name", "Unknown")
+    answers["type"] = llm_data.get("type", "Unknown")
+    answers["type_description"] = ""
+    answers["type_suitability"] = ""
+    answers["faqs"] = []
 
-        return answers
+    # Find matching license type information
+    for license_type in LICENSE_TYPES:
+        if license_type["type"].lower() == answers["type"].lower():
+            answers["type_description"] = license_type["description"]
+            answers["type_suitability"] = license_type["suitability"]
+            break
 
-    except Exception as e:
-        logger.error(f"Error generating license FAQ: {e}")
-        raise LicenseExtractionException("Extracting license details failed") from e
+    # Process FAQ answers
+    for k, v in llm_data.items():
+        if k.upper() in LICENSE_QUESTIONS:
+            faq_item = {}
+
+            # Set default impact as NEUTRAL
+            impact = "NEUTRAL"
+
+            # Get the expected impact from license questions
+            expected_impact = LICENSE_QUESTIONS[k.upper()]["impact"]
+
+            # Determine actual impact based on answer
+            if v.get("answer", "").lower() == "yes":
+                impact = expected_impact
+            elif v.get("answer", "").lower() == "no":
+                impact = "POSITIVE" if expected_impact == "NEGATIVE" else "NEGATIVE"
+
+            # Build FAQ item
+            faq_item["question"] = v.get("question", LICENSE_QUESTIONS[k.upper()]["question"])
+            faq_item["answer"] = v.get("answer", "")
+            faq_item["reason"] = v.get("reason", []) if isinstance(v.get("reason"), list) else [v.get("reason", "")]
+            faq_item["impact"] = impact
+
+            answers["faqs"].append(faq_item)
+
+    return answers
 
 
 async def extract_license_from_source(
@@ -327,6 +592,12 @@ async def extract_license_from_source(
     base_url: str = "https://api.openai.com/v1",
     model: str = "gpt-4",
     timeout: int = 120,
+    fetch_timeout: float = 30.0,
+    max_source_bytes: int = 5 * 1024 * 1024,
+    cache: Optional[LicenseSourceCache] = None,
+    run_parse: Optional[ParseRunner] = None,
+    analysis_cache: Optional["LicenseAnalysisCache"] = None,
+    host_limiter: Optional[HostRateLimiter] = None,
 ) -> Dict[str, Any]:
     """Extract license information from various sources.
 
@@ -336,22 +607,35 @@ async def extract_license_from_source(
         api_key: API key for the LLM service
         base_url: Base URL for the LLM API
         model: Model name to use
+        timeout: Timeout in seconds for the LLM call
+        fetch_timeout: Total timeout in seconds for downloading a URL source
+        max_source_bytes: Largest accepted page or PDF
+        cache: Optional cache of fetched and extracted source texts
+        run_parse: Runner of the HTML/PDF text extraction, see ``get_url_content``
+        analysis_cache: Optional cache of LLM analyses keyed by the normalized license text
+        host_limiter: Optional per-host limit applied to URL downloads
 
     Returns:
         Dictionary with extracted license details
     """
     # Get license content based on source type
     if source_type == "url":
-        license_content = get_url_content(source)
+        license_content = await get_url_content(
+            source, fetch_timeout, max_source_bytes, cache, run_parse, host_limiter
+        )
     elif source_type == "text":
         license_content = get_text_content(source)
     elif source_type == "pdf_base64":
-        import base64
-
-        pdf_bytes = base64.b64decode(source)
-        license_content = get_pdf_content(pdf_bytes)
+        # Four base64 characters decode to at most three bytes; reject oversized input before decoding it
+        if len(source) // 4 * 3 > max_source_bytes + 2:
+            raise LicenseExtractionException(f"PDF exceeds {max_source_bytes} bytes")
+        try:
+            pdf_bytes = base64.b64decode(source)
+        except (binascii.Error, ValueError) as e:
+            raise LicenseExtractionException("Invalid base64 PDF content") from e
+        license_content = await get_pdf_content(pdf_bytes, max_source_bytes, cache, run_parse)
     else:
         raise LicenseExtractionException(f"Invalid source type: {source_type}")
 
     # Generate license details using LLM
-    return await generate_license_details(license_content, api_key, base_url, model, timeout)
+    return await generate_license_details(license_content, api_key, base_url, model, timeout, analysis_cache)
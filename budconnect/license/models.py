@@ -0,0 +1,47 @@
+#  -----------------------------------------------------------------------------
+#  Copyright (c) 2024 Bud Ecosystem Inc.
+#  #
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  #
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  #
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  -----------------------------------------------------------------------------
+
+"""SQLAlchemy model of the persisted LLM license analyses."""
+
+from datetime import datetime
+from typing import Any, Dict
+
+from budmicroframe.shared.psql_service import PSQLBase
+from sqlalchemy import DateTime, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class LicenseAnalysis(PSQLBase):
+    """Result of one LLM analysis of a license text, reused for identical texts.
+
+    Attributes:
+        cache_key: SHA-256 of the prompt version, the LLM model and the whitespace-normalized license text.
+        prompt_version: Version of the analysis prompt that produced the result.
+        llm_model: LLM model that produced the result.
+        result: The parsed JSON answer of the LLM, before it is mapped to license fields.
+        created_at: Time the analysis was stored.
+        last_used_at: Time the analysis was last served from the cache.
+    """
+
+    __tablename__ = "license_analysis"
+
+    cache_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    prompt_version: Mapped[str] = mapped_column(String, nullable=False)
+    llm_model: Mapped[str] = mapped_column(String, nullable=False)
+    result: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    last_used_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -1,14 +1,23 @@
-from typing import Any, Dict, Optional
+from typing import AsyncIterator, Dict, Optional, Tuple, Union
 from uuid import UUID
 
 from budmicroframe.commons import logging
 from budmicroframe.commons.exceptions import ClientException
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
+from ..commons.conditional import not_modified_response
+from ..commons.executor import run_sync
+from ..sync.services import SyncService
 from .schemas import (
+    DEFAULT_LICENSE_LIST_FIELDS,
+    LICENSE_LIST_FIELDS,
+    LicenseBatchExtractRequest,
+    LicenseBatchItemResult,
     LicenseCreate,
     LicenseExtractRequest,
     LicenseExtractResponse,
+    LicenseListItem,
     LicenseListResponse,
     LicenseResponse,
     LicenseUpdate,
@@ -21,55 +30,90 @@ logger = logging.get_logger(__name__)
 license_router = APIRouter(prefix="/licenses", tags=["License"])
 
 
-@license_router.get("/")
+def _parse_list_fields(fields: Optional[str]) -> Tuple[str, ...]:
+    """Validate the comma-separated ``fields`` selection of the license list."""
+    if not fields:
+        return DEFAULT_LICENSE_LIST_FIELDS
+    selected = tuple(dict.fromkeys(field.strip() for field in fields.split(",") if field.strip()))
+    unknown = [field for field in selected if field not in LICENSE_LIST_FIELDS]
+    if unknown or not selected:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid fields {unknown}; allowed fields are {', '.join(LICENSE_LIST_FIELDS)}",
+        )
+    return selected
+
+
+@license_router.get("/", response_model=LicenseListResponse, response_model_exclude_unset=True)
 async def get_licenses(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(100, ge=1, le=500, description="Number of items per page"),
     license_type: Optional[str] = Query(None, description="Filter by license type"),
     suitability: Optional[str] = Query(None, description="Filter by suitability rating"),
     search: Optional[str] = Query(None, description="Search in license name and key"),
-) -> LicenseListResponse:
+    fields: Optional[str] = Query(
+        None,
+        description=(
+            "Comma-separated license fields to return (id, key, name, type, type_description, type_suitability). "
+            "Defaults to all but type_description; FAQs are only returned by GET /licenses/{license_id}"
+        ),
+    ),
+) -> Union[LicenseListResponse, Response]:
     """Get all licenses with optional filtering and pagination.
 
+    Only the selected columns are loaded from the database and serialized, so list views do not pay for
+    the FAQ JSON and descriptions of every license on the page.
+
+    Supports If-None-Match / If-Modified-Since against the catalog version.
+
     Args:
+        request: The incoming request, used for conditional headers
         page: Page number (starts from 1)
         page_size: Number of items per page
         license_type: Optional filter by license type
         suitability: Optional filter by suitability rating (MOST, GOOD, LOW, WORST)
         search: Optional search term to filter by name or key
+        fields: Optional comma-separated selection of the fields to return
 
     Returns:
-        List of licenses with pagination info
+        List of licenses with pagination info, or 304 if unchanged
     """
+    selected_fields = _parse_list_fields(fields)
     try:
+        validator = await run_sync(
+            SyncService.get_catalog_validator,
+            "licenses",
+            page,
+            page_size,
+            license_type,
+            suitability,
+            search,
+            selected_fields,
+        )
+        not_modified = not_modified_response(request, *validator)
+        if not_modified is not None:
+            return not_modified
+
         if search or license_type or suitability:
-            licenses = LicenseService.search_licenses(
-                license_type=license_type, suitability=suitability, search_term=search
+            paginated_licenses, total = await run_sync(
+                LicenseService.search_licenses,
+                license_type=license_type,
+                suitability=suitability,
+                search_term=search,
+                page=page,
+                page_size=page_size,
+                fields=selected_fields,
             )
-            # Apply pagination to search results
-            start_idx = (page - 1) * page_size
-            end_idx = start_idx + page_size
-            paginated_licenses = licenses[start_idx:end_idx]
-            total = len(licenses)
         else:
-            paginated_licenses, total = LicenseService.get_all_licenses(page, page_size)
-
-        logger.info(f"Got {len(paginated_licenses)} licenses, type: {type(paginated_licenses)}")
-        if paginated_licenses:
-            logger.info(f"First item type: {type(paginated_licenses[0])}")
-
-        license_responses = []
-        for license in paginated_licenses:
-            license_dict: Dict[str, Any] = {
-                "id": license.id,
-                "key": license.key,
-                "name": license.name,
-                "type": license.type,
-                "type_description": license.type_description,
-                "type_suitability": license.type_suitability,
-                "faqs": license.faqs if license.faqs else [],
-            }
-            license_responses.append(LicenseResponse(**license_dict))
+            paginated_licenses, total = await run_sync(
+                LicenseService.get_all_licenses, page, page_size, selected_fields
+            )
+
+        license_responses = [
+            LicenseListItem(**{field: getattr(license, field) for field in selected_fields})
+            for license in paginated_licenses
+        ]
 
         return LicenseListResponse(licenses=license_responses, total=total, page=page, page_size=page_size)
     except Exception as e:
@@ -88,7 +132,7 @@ async def get_license(license_id: UUID) -> LicenseResponse:
         License details
     """
     try:
-        license = LicenseService.get_license_by_id(license_id)
+        license = await run_sync(LicenseService.get_license_by_id, license_id)
         return LicenseResponse(
             id=license.id,
             key=license.key,
@@ -118,7 +162,7 @@ async def get_license_by_key(key: str) -> LicenseResponse:
         License details
     """
     try:
-        license = LicenseService.get_license_by_key(key)
+        license = await run_sync(LicenseService.get_license_by_key, key)
         return LicenseResponse(
             id=license.id,
             key=license.key,
@@ -148,7 +192,7 @@ async def create_license(license_data: LicenseCreate) -> LicenseResponse:
         Created license details
     """
     try:
-        license = LicenseService.create_license(license_data)
+        license = await run_sync(LicenseService.create_license, license_data)
         return LicenseResponse(
             id=license.id,
             key=license.key,
@@ -177,7 +221,7 @@ async def update_license(license_id: UUID, license_data: LicenseUpdate) -> Licen
         Updated license details
     """
     try:
-        license = LicenseService.update_license(license_id, license_data)
+        license = await run_sync(LicenseService.update_license, license_id, license_data)
         return LicenseResponse(
             id=license.id,
             key=license.key,
@@ -207,7 +251,7 @@ async def delete_license(license_id: UUID) -> Dict[str, str]:
         No content on success
     """
     try:
-        LicenseService.delete_license(license_id)
+        await run_sync(LicenseService.delete_license, license_id)
         return {"message": "License deleted successfully"}
     except ClientException as e:
         if "not found" in str(e).lower():
@@ -243,6 +287,43 @@ async def extract_license(request: LicenseExtractRequest) -> LicenseExtractRespo
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)) from e
 
 
+@license_router.post(
+    "/extract/batch",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}, "description": "One JSON result per line"}},
+)
+async def extract_licenses_batch(request: LicenseBatchExtractRequest) -> StreamingResponse:
+    """Extract many licenses concurrently and stream the results as newline-delimited JSON.
+
+    Items are fetched, parsed and analysed in parallel (bounded by LICENSE_BATCH_CONCURRENCY, with a
+    per-host download limit). Each line is a ``LicenseBatchItemResult`` written as soon as its item
+    finishes, so results arrive in completion order; use ``index`` to match them to the request. With
+    ``create`` every successfully extracted license is also stored.
+
+    Args:
+        request: Batch of license sources
+
+    Returns:
+        NDJSON stream of per-item results
+    """
+    try:
+        results = LicenseService.extract_licenses_batch(request)
+    except ClientException as e:
+        logger.error(f"Batch license extraction rejected: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    async def stream() -> AsyncIterator[str]:
+        item: LicenseBatchItemResult
+        try:
+            async for item in results:
+                yield item.model_dump_json() + "\n"
+        finally:
+            # Cancels the items still in flight when the client disconnects
+            await results.aclose()
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
 @license_router.post("/extract-and-create", status_code=status.HTTP_201_CREATED)
 async def extract_and_create_license(request: LicenseExtractRequest) -> LicenseResponse:
     """Extract license information from a source and create a new license record.
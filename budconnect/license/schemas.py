@@ -42,8 +42,24 @@ class LicenseResponse(LicenseBase):
         from_attributes = True
 
 
+# Columns that list views may select with ``fields``; FAQs are only served by GET /licenses/{license_id}
+LICENSE_LIST_FIELDS = ("id", "key", "name", "type", "type_description", "type_suitability")
+DEFAULT_LICENSE_LIST_FIELDS = ("id", "key", "name", "type", "type_suitability")
+
+
+class LicenseListItem(BaseModel):
+    """Slim projection of a license used by list views; only the selected fields are set."""
+
+    id: Optional[UUID] = Field(None, description="Unique identifier for the license")
+    key: Optional[str] = Field(None, description="Unique key identifier for the license")
+    name: Optional[str] = Field(None, description="Human-readable name of the license")
+    type: Optional[str] = Field(None, description="Classification of the license type")
+    type_description: Optional[str] = Field(None, description="Detailed description of the license type")
+    type_suitability: Optional[str] = Field(None, description="Suitability rating (MOST, GOOD, LOW, WORST)")
+
+
 class LicenseListResponse(BaseModel):
-    licenses: List[LicenseResponse]
+    licenses: List[LicenseListItem]
     total: int = Field(..., description="Total number of licenses")
     page: int = Field(..., description="Current page number")
     page_size: int = Field(..., description="Number of items per page")
@@ -72,3 +88,20 @@ class LicenseExtractResponse(BaseModel):
     type_suitability: str = Field(..., description="Suitability rating")
     faqs: List[LicenseFAQ] = Field(default_factory=list, description="Extracted FAQs with analysis")
     extraction_metadata: Optional[Dict[str, Any]] = Field(None, description="Metadata about the extraction process")
+
+
+class LicenseBatchExtractRequest(BaseModel):
+    items: List[LicenseExtractRequest] = Field(..., min_length=1, description="License sources to extract")
+    create: bool = Field(False, description="Create a license record for every successfully extracted item")
+
+
+class LicenseBatchItemResult(BaseModel):
+    """One NDJSON line of a batch extraction, emitted as soon as its item has finished."""
+
+    index: int = Field(..., description="Position of the item in the request")
+    source_type: str = Field(..., description="Source type of the item")
+    status: str = Field(..., description="'success' or 'error'")
+    license: Optional[LicenseExtractResponse] = Field(None, description="Extracted license information")
+    license_id: Optional[UUID] = Field(None, description="ID of the created license when create was requested")
+    error: Optional[str] = Field(None, description="Error message of a failed item")
+    elapsed_ms: float = Field(..., description="Time spent on the item in milliseconds")
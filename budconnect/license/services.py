@@ -1,16 +1,22 @@
 import logging
 import re
-from typing import List, Optional, Tuple
-from uuid import UUID
+from typing import AsyncGenerator, List, Optional, Sequence, Tuple, cast
+from uuid import UUID, uuid4
 
 from budmicroframe.commons.exceptions import ClientException
+from sqlalchemy.exc import IntegrityError
 
 from budconnect.commons.config import app_settings
+from budconnect.commons.executor import run_in_process, run_sync
 from budconnect.model.crud import LicenseCRUD
 from budconnect.model.models import License
 
-from .extractor import LicenseExtractionException, extract_license_from_source
+from .analysis_cache import LicenseAnalysisCache
+from .batch import run_batch
+from .extractor import HostRateLimiter, LicenseExtractionException, LicenseSourceCache, extract_license_from_source
 from .schemas import (
+    LicenseBatchExtractRequest,
+    LicenseBatchItemResult,
     LicenseCreate,
     LicenseExtractRequest,
     LicenseExtractResponse,
@@ -21,40 +27,33 @@ from .schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Fetched and extracted license source texts, keyed by URL validators and by content SHA-256
+license_source_cache = LicenseSourceCache(
+    maxsize=app_settings.license_source_cache_max_size,
+    ttl=app_settings.license_source_cache_ttl_seconds,
+)
+
+# LLM analyses memoized by normalized license text, prompt version and model
+license_analysis_cache = LicenseAnalysisCache(maxsize=app_settings.license_analysis_cache_max_size)
+
 
 class LicenseService:
     @staticmethod
-    def get_all_licenses(page: int = 1, page_size: int = 100) -> Tuple[List[License], int]:
+    def get_all_licenses(
+        page: int = 1, page_size: int = 100, fields: Optional[Sequence[str]] = None
+    ) -> Tuple[List[License], int]:
         """Get all licenses with pagination.
 
         Args:
             page: Page number (starts from 1)
             page_size: Number of items per page
+            fields: Optional columns to load; the others are deferred
 
         Returns:
             Tuple of (list of licenses, total count)
         """
         with LicenseCRUD() as crud:
-            offset = (page - 1) * page_size
-            # Get all licenses to count total
-            all_licenses_result = crud.fetch_many()
-            # Handle tuple return from fetch_many
-            if isinstance(all_licenses_result, tuple):
-                all_licenses = all_licenses_result[0] if all_licenses_result else []
-            else:
-                all_licenses = all_licenses_result if all_licenses_result else []
-
-            total = len(all_licenses)
-
-            # Get paginated results
-            licenses_result = crud.fetch_many(offset=offset, limit=page_size)
-            # Handle tuple return from fetch_many
-            if isinstance(licenses_result, tuple):
-                licenses = licenses_result[0] if licenses_result else []
-            else:
-                licenses = licenses_result if licenses_result else []
-
-            return licenses, total
+            return crud.search(offset=(page - 1) * page_size, limit=page_size, columns=fields)
 
     @staticmethod
     def get_license_by_id(license_id: UUID) -> License:
@@ -89,20 +88,10 @@ class LicenseService:
             ClientException: If license not found
         """
         with LicenseCRUD() as crud:
-            # Use fetch_many to search by key
-            licenses_result = crud.fetch_many()
-            # Handle tuple return
-            if isinstance(licenses_result, tuple):
-                licenses = licenses_result[0] if licenses_result else []
-            else:
-                licenses = licenses_result if licenses_result else []
-
-            # Find license by key
-            for license in licenses:
-                if license.key == key:
-                    return license  # type: ignore
-
-            raise ClientException(f"License with key '{key}' not found")
+            license = crud.get_by_key(key)
+            if not license:
+                raise ClientException(f"License with key '{key}' not found")
+            return license
 
     @staticmethod
     def create_license(license_data: LicenseCreate) -> License:
@@ -117,27 +106,22 @@ class LicenseService:
         Raises:
             ClientException: If license with same key already exists
         """
-        with LicenseCRUD() as crud:
-            # Check if license with same key exists
-            licenses_result = crud.fetch_many()
-            if isinstance(licenses_result, tuple):
-                licenses = licenses_result[0] if licenses_result else []
-            else:
-                licenses = licenses_result if licenses_result else []
-
-            for license in licenses:
-                if license.key == license_data.key:
-                    raise ClientException(f"License with key '{license_data.key}' already exists")
+        return LicenseService._insert_license(license_data)
 
-            # Create the license using upsert
-            license_dict = license_data.model_dump()
-            # Generate a new UUID for the license
-            from uuid import uuid4
+    @staticmethod
+    def _insert_license(license_data: LicenseCreate) -> License:
+        """Insert a license, relying on the unique key index to reject duplicates.
 
-            license_dict["id"] = uuid4()
-            license_id = crud.upsert(license_dict)
-            result = crud.fetch_one(conditions={"id": license_id})
-            return result  # type: ignore
+        Raises:
+            ClientException: If a license with the same key already exists
+        """
+        license_dict = license_data.model_dump()
+        license_dict["id"] = uuid4()
+        with LicenseCRUD() as crud:
+            license_id = crud.insert_if_absent(license_dict)
+            if license_id is None:
+                raise ClientException(f"License with key '{license_data.key}' already exists")
+            return crud.fetch_one(conditions={"id": license_id})  # type: ignore
 
     @staticmethod
     def update_license(license_id: UUID, license_data: LicenseUpdate) -> License:
@@ -160,33 +144,15 @@ class LicenseService:
             if not existing:
                 raise ClientException(f"License with ID {license_id} not found")
 
-            # If updating key, check for conflicts
             update_dict = license_data.model_dump(exclude_unset=True)
-            if "key" in update_dict and update_dict["key"] != existing.key:
-                # Check all licenses for conflict
-                licenses_result = crud.fetch_many()
-                if isinstance(licenses_result, tuple):
-                    licenses = licenses_result[0] if licenses_result else []
-                else:
-                    licenses = licenses_result if licenses_result else []
-
-                for license in licenses:
-                    if license.key == update_dict["key"]:
-                        raise ClientException(f"License with key '{update_dict['key']}' already exists")
-
-            # Update the license using upsert
-            # Merge existing data with updates
-            merged_data = {
-                "id": license_id,
-                "key": existing.key,
-                "name": existing.name,
-                "type": existing.type,
-                "type_description": existing.type_description,
-                "type_suitability": existing.type_suitability,
-                "faqs": existing.faqs,
-            }
-            merged_data.update(update_dict)
-            crud.upsert(merged_data, conflict_target=["id"])
+            if not update_dict:
+                return existing  # type: ignore
+
+            # A key that is already taken is rejected by the unique index on license.key
+            try:
+                crud.update_fields(license_id, update_dict)
+            except IntegrityError as e:
+                raise ClientException(f"License with key '{update_dict.get('key')}' already exists") from e
             result = crud.fetch_one(conditions={"id": license_id})
             return result  # type: ignore
 
@@ -225,38 +191,37 @@ class LicenseService:
 
     @staticmethod
     def search_licenses(
-        license_type: Optional[str] = None, suitability: Optional[str] = None, search_term: Optional[str] = None
-    ) -> List[License]:
+        license_type: Optional[str] = None,
+        suitability: Optional[str] = None,
+        search_term: Optional[str] = None,
+        page: int = 1,
+        page_size: int = 100,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Tuple[List[License], int]:
         """Search licenses by various criteria.
 
+        Filtering, the name/key substring search and pagination all run in SQL.
+
         Args:
             license_type: Filter by license type
             suitability: Filter by suitability rating
             search_term: Search in name and key
+            page: Page number (starts from 1)
+            page_size: Number of items per page
+            fields: Optional columns to load; the others are deferred
 
         Returns:
-            List of matching licenses
+            Tuple of (list of matching licenses, total count)
         """
         with LicenseCRUD() as crud:
-            conditions = {}
-            if license_type:
-                conditions["type"] = license_type
-            if suitability:
-                conditions["type_suitability"] = suitability
-
-            licenses_result = crud.fetch_many(conditions=conditions)
-            # Handle tuple return from fetch_many
-            if isinstance(licenses_result, tuple):
-                licenses = licenses_result[0] if licenses_result else []
-            else:
-                licenses = licenses_result if licenses_result else []
-
-            # Filter by search term if provided
-            if search_term:
-                search_lower = search_term.lower()
-                licenses = [l for l in licenses if search_lower in l.key.lower() or search_lower in l.name.lower()]
-
-            return licenses
+            return crud.search(
+                license_type=license_type,
+                suitability=suitability,
+                search_term=search_term,
+                offset=(page - 1) * page_size,
+                limit=page_size,
+                columns=fields,
+            )
 
     @staticmethod
     def generate_license_key(license_name: str) -> str:
@@ -280,11 +245,14 @@ class LicenseService:
         return key if key else "unknown-license"
 
     @staticmethod
-    async def extract_license(request: LicenseExtractRequest) -> LicenseExtractResponse:
+    async def extract_license(
+        request: LicenseExtractRequest, host_limiter: Optional[HostRateLimiter] = None
+    ) -> LicenseExtractResponse:
         """Extract license information from a source.
 
         Args:
             request: License extraction request
+            host_limiter: Optional per-host download limit shared by the items of a batch
 
         Returns:
             Extracted license information
@@ -308,6 +276,12 @@ class LicenseService:
                 base_url=app_settings.llm_base_url,
                 model=app_settings.llm_model,
                 timeout=app_settings.llm_timeout,
+                fetch_timeout=app_settings.license_fetch_timeout_seconds,
+                max_source_bytes=app_settings.license_source_max_bytes,
+                cache=license_source_cache,
+                run_parse=run_in_process,
+                analysis_cache=license_analysis_cache,
+                host_limiter=host_limiter,
             )
 
             # Generate or use provided key
@@ -376,32 +350,88 @@ class LicenseService:
         # Extract license information
         extracted = await LicenseService.extract_license(request)
 
-        # Check if license with same key already exists
-        with LicenseCRUD() as crud:
-            licenses_result = crud.fetch_many()
-            if isinstance(licenses_result, tuple):
-                licenses = licenses_result[0] if licenses_result else []
-            else:
-                licenses = licenses_result if licenses_result else []
-
-            for license in licenses:
-                if license.key == extracted.key:
-                    raise ClientException(f"License with key '{extracted.key}' already exists")
-
-            # Create the license
-            license_data = LicenseCreate(
-                key=extracted.key,
-                name=extracted.name,
-                type=extracted.type,
-                type_description=extracted.type_description,
-                type_suitability=extracted.type_suitability,
-                faqs=[faq.model_dump() for faq in extracted.faqs],
-            )
+        # Create the license; a duplicate key is rejected by the unique index
+        return LicenseService._insert_license(LicenseService._license_create_from_extracted(extracted))
 
-            from uuid import uuid4
+    @staticmethod
+    def _license_create_from_extracted(extracted: LicenseExtractResponse) -> LicenseCreate:
+        """Build the create payload of an extracted license."""
+        return LicenseCreate(
+            key=extracted.key,
+            name=extracted.name,
+            type=extracted.type,
+            type_description=extracted.type_description,
+            type_suitability=extracted.type_suitability,
+            faqs=[faq.model_dump() for faq in extracted.faqs],
+        )
 
-            license_dict = license_data.model_dump()
-            license_dict["id"] = uuid4()
-            license_id = crud.upsert(license_dict)
-            result = crud.fetch_one(conditions={"id": license_id})
-            return result  # type: ignore
+    @staticmethod
+    def extract_licenses_batch(request: LicenseBatchExtractRequest) -> AsyncGenerator[LicenseBatchItemResult, None]:
+        """Extract many licenses concurrently, producing each result as soon as its item finishes.
+
+        Items run under ``LICENSE_BATCH_CONCURRENCY`` and share one per-host download limit. A failing item
+        produces an error result and does not affect the others. The request is validated before the
+        generator is returned, so a rejected batch fails before any result is streamed.
+
+        Args:
+            request: Batch extraction request
+
+        Returns:
+            Async generator of one result per item, in completion order
+
+        Raises:
+            ClientException: If the batch is too large or the LLM API key is missing
+        """
+        if len(request.items) > app_settings.license_batch_max_items:
+            raise ClientException(
+                f"Batch contains {len(request.items)} items; at most {app_settings.license_batch_max_items} "
+                "are accepted per request"
+            )
+        if not app_settings.llm_api_key:
+            raise ClientException(
+                "License extraction requires LLM API key. Please configure BUD_LLM_API_KEY environment variable."
+            )
+        return LicenseService._run_license_batch(request)
+
+    @staticmethod
+    async def _run_license_batch(request: LicenseBatchExtractRequest) -> AsyncGenerator[LicenseBatchItemResult, None]:
+        """Run a validated batch extraction, see ``extract_licenses_batch``."""
+        host_limiter = HostRateLimiter(
+            app_settings.license_batch_per_host_concurrency, app_settings.license_batch_per_host_interval_seconds
+        )
+
+        async def process(item: LicenseExtractRequest) -> Tuple[LicenseExtractResponse, Optional[UUID]]:
+            extracted = await LicenseService.extract_license(item, host_limiter=host_limiter)
+            if not request.create:
+                return extracted, None
+            license_data = LicenseService._license_create_from_extracted(extracted)
+            license = await run_sync(LicenseService._insert_license, license_data)
+            return extracted, cast(UUID, license.id)
+
+        outcomes = run_batch(request.items, process, app_settings.license_batch_concurrency)
+        try:
+            async for outcome in outcomes:
+                elapsed_ms = round(outcome.elapsed * 1000, 2)
+                if outcome.error is not None:
+                    logger.error(f"Batch license extraction of item {outcome.index} failed: {outcome.error}")
+                    yield LicenseBatchItemResult(
+                        index=outcome.index,
+                        source_type=outcome.item.source_type,
+                        status="error",
+                        error=str(outcome.error),
+                        elapsed_ms=elapsed_ms,
+                    )
+                else:
+                    # Exactly one of error and result is set
+                    assert outcome.result is not None
+                    extracted, license_id = outcome.result
+                    yield LicenseBatchItemResult(
+                        index=outcome.index,
+                        source_type=outcome.item.source_type,
+                        status="success",
+                        license=extracted,
+                        license_id=license_id,
+                        elapsed_ms=elapsed_ms,
+                    )
+        finally:
+            await outcomes.aclose()
@@ -16,9 +16,10 @@
 
 """The main entry point for the application, initializing the FastAPI app and setting up the application's lifespan management, including configuration and secret syncs."""
 
+import asyncio
 import logging
-from contextlib import asynccontextmanager
-from typing import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator, Optional
 
 from budmicroframe.main import configure_app
 from budmicroframe.shared.dapr_workflow import DaprWorkflow
@@ -27,8 +28,9 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from .a2a_registry.routes import a2a_registry_router
 from .auth.routes import auth_router
+from .commons.conditional import ConditionalGetMiddleware
 from .commons.config import app_settings, secrets_settings
-from .commons.exceptions import SeederException
+from .commons.executor import shutdown_password_executor, shutdown_process_executor, shutdown_service_executor
 from .engine.routes import engine_router
 from .eval.routes import eval_router
 from .guardrails.routes import guardrail_router
@@ -36,6 +38,8 @@ from .license.routes import license_router
 from .model.routes import model_router
 from .provider.routes import provider_router
 from .seeders import seeders
+from .seeders.runner import SeederRunner, split_seeders
+from .sync.routes import sync_router
 
 
 logger = logging.getLogger(__name__)
@@ -58,34 +62,47 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """
     # task = asyncio.create_task(schedule_secrets_and_config_sync())
 
-    # Only run seeders if enabled via environment variable
+    # Only run seeders if enabled via environment variable. Seeders with local inputs run before the app is
+    # ready (unchanged ones are skipped); network-backed seeders and their dependents run in the background.
+    deferred_seeding: Optional[asyncio.Task] = None
     if app_settings.run_seeders_on_startup:
-        logger.info("Running database seeders on startup...")
-        for seeder_name, seeder in seeders.items():
-            try:
-                await seeder().seed()  # type: ignore[abstract]
-                logger.info(f"Seeded {seeder_name} seeder successfully.")
-            except SeederException as e:
-                logger.error("Failed to seed %s. Error: %s", seeder_name, e.message)
-            except Exception as e:
-                logger.error(f"Failed to seed {seeder_name}. Error: {e}")
+        startup_seeders, deferred_seeders = split_seeders(seeders, defer_network=app_settings.defer_network_seeders)
+        runner = SeederRunner(seeders)
+        logger.info("Running database seeders on startup: %s", ", ".join(startup_seeders))
+        await runner.run(startup_seeders)
+        if deferred_seeders:
+            logger.info("Running database seeders in the background: %s", ", ".join(deferred_seeders))
+            deferred_seeding = asyncio.create_task(runner.run(deferred_seeders))
     else:
         logger.info("Skipping database seeders (RUN_SEEDERS_ON_STARTUP=false)")
 
     yield
 
+    if deferred_seeding is not None and not deferred_seeding.done():
+        # Drops the deferred seeders that have not started and shuts their executor down; a seeder already
+        # running cannot be interrupted and finishes on its worker thread
+        deferred_seeding.cancel()
+        with suppress(asyncio.CancelledError):
+            await deferred_seeding
+
     # NOTE: Config and secrets sync task is currently disabled
     # try:
     #     task.cancel()
     # except asyncio.CancelledError:
     #     logger.exception("Failed to cleanup config & store sync.")
 
+    shutdown_service_executor()
+    shutdown_process_executor()
+    shutdown_password_executor()
     DaprWorkflow().shutdown_workflow_runtime()
 
 
 # mypy: ignore-errors
 app = configure_app(app_settings, secrets_settings, lifespan=lifespan)
 
+# Conditional GET (ETag / Last-Modified) for every router; added before CORS so CORS headers wrap 304s too
+app.add_middleware(ConditionalGetMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -93,6 +110,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Last-Modified"],
 )
 
 app.include_router(auth_router)
@@ -103,3 +121,4 @@ app.include_router(model_router)
 app.include_router(guardrail_router)
 app.include_router(provider_router)
 app.include_router(a2a_registry_router)
+app.include_router(sync_router)
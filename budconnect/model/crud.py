@@ -16,17 +16,20 @@
 
 """ModelInfo, Provider CRUD operations."""
 
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from uuid import UUID
 
 from budmicroframe.commons import logging
 from budmicroframe.shared.psql_service import CRUDMixin, DBCreateSchemaType, ModelType
-from sqlalchemy import and_, distinct, func, or_
+from sqlalchemy import and_, delete, distinct, exists, func, or_, select, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 
-from ..commons.constants import ModelStatusEnum, ProviderCapabilityEnum
+from ..commons.constants import ModelStatusEnum, ProviderCapabilityEnum, TotalCountModeEnum
+from ..commons.hashing import compute_content_hash
+from ..commons.pagination import apply_keyset, encode_keyset_cursor, resolve_total
+from ..commons.upsert import bulk_upsert_by_uri
 from .models import (
     License,
     ModelArchitectureClass,
@@ -36,11 +39,17 @@ from .models import (
     engine_version_model_info,
     engine_version_provider,
 )
+from .schemas import ModelInfoCreate
 
 
 logger = logging.get_logger(__name__)
 
 
+def escape_like(value: str) -> str:
+    """Escape ``LIKE`` wildcards and the escape character so a user supplied term matches literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 class ProviderCRUD(CRUDMixin[Provider, None, None]):
     __model__ = Provider
 
@@ -155,6 +164,49 @@ class ProviderCRUD(CRUDMixin[Provider, None, None]):
         finally:
             self.cleanup_session(_session if session is None else None)
 
+    def bulk_upsert_with_engine_version(
+        self, rows: List[Dict[str, Any]], engine_version_id: UUID, session: Session
+    ) -> Dict[str, UUID]:
+        """Upsert providers with one multi-row statement and link them all to an engine version.
+
+        The statements run inside the caller's transaction; committing or rolling back is left to the caller.
+
+        Args:
+            rows: Provider rows keyed by column name. Rows sharing a provider_type are collapsed, last one wins.
+            engine_version_id: The engine version every provider is linked to.
+            session: The session owning the transaction.
+
+        Returns:
+            Mapping of provider_type to provider ID.
+        """
+        unique_rows = list({row["provider_type"]: row for row in rows}.values())
+        if not unique_rows:
+            return {}
+
+        table = self.model.__table__
+        stmt = insert(table).values(unique_rows)
+        update_columns = [key for key in unique_rows[0] if key not in ("id", "provider_type")]
+        set_: Dict[str, Any] = {key: stmt.excluded[key] for key in update_columns}
+        if "modified_at" in table.c and "modified_at" not in set_:
+            set_["modified_at"] = func.now()
+        upsert_stmt = stmt.on_conflict_do_update(index_elements=["provider_type"], set_=set_).returning(
+            table.c.provider_type, table.c.id
+        )
+        provider_ids: Dict[str, UUID] = dict(session.execute(upsert_stmt).tuples().all())
+
+        session.execute(
+            insert(engine_version_provider)
+            .values(
+                [
+                    {"provider_id": provider_id, "engine_version_id": engine_version_id}
+                    for provider_id in provider_ids.values()
+                ]
+            )
+            .on_conflict_do_nothing()
+        )
+        logger.debug("Bulk upserted %d providers for engine version %s", len(provider_ids), engine_version_id)
+        return provider_ids
+
     def get_compatible_providers(
         self, version_id: UUID, offset: int, limit: int, session: Optional[Session] = None
     ) -> Tuple[int, List[Provider]]:
@@ -453,6 +505,137 @@ class LicenseCRUD(CRUDMixin[License, None, None]):
         finally:
             self.cleanup_session(_session if session is None else None)
 
+    def get_by_key(self, key: str, session: Optional[Session] = None) -> Optional[License]:
+        """Get a license by its key using the unique index on ``license.key``.
+
+        Args:
+            key: The license key.
+            session: Optional database session.
+
+        Returns:
+            The license, or None if no license has this key.
+        """
+        _session = session or self.get_session()
+        try:
+            return _session.execute(select(License).where(License.key == key)).scalar_one_or_none()
+        finally:
+            self.cleanup_session(_session if session is None else None)
+
+    def insert_if_absent(self, data: Dict[str, Any], session: Optional[Session] = None) -> Optional[UUID]:
+        """Insert a license unless one with the same key exists.
+
+        Uniqueness is decided by the unique index on ``license.key`` through ``ON CONFLICT DO NOTHING``,
+        so two concurrent creates of the same key cannot both succeed.
+
+        Args:
+            data: Column values of the new license, including ``id`` and ``key``.
+            session: Optional database session.
+
+        Returns:
+            The ID of the inserted license, or None if the key already exists.
+        """
+        _session = session or self.get_session()
+        try:
+            stmt = (
+                insert(License)
+                .values(**data)
+                .on_conflict_do_nothing(index_elements=[License.key])
+                .returning(License.id)
+            )
+            license_id = _session.execute(stmt).scalar_one_or_none()
+            _session.commit()
+            return license_id
+        except SQLAlchemyError:
+            _session.rollback()
+            raise
+        finally:
+            self.cleanup_session(_session if session is None else None)
+
+    def update_fields(
+        self, license_id: UUID, values: Dict[str, Any], session: Optional[Session] = None
+    ) -> Optional[UUID]:
+        """Update the given columns of a license.
+
+        Args:
+            license_id: ID of the license to update.
+            values: Column values to set.
+            session: Optional database session.
+
+        Returns:
+            The ID of the updated license, or None if it does not exist.
+
+        Raises:
+            IntegrityError: If the new key is already used by another license.
+        """
+        _session = session or self.get_session()
+        try:
+            stmt = (
+                update(License)
+                .where(License.id == license_id)
+                .values(**values, modified_at=func.now())
+                .returning(License.id)
+            )
+            updated_id = _session.execute(stmt).scalar_one_or_none()
+            _session.commit()
+            return updated_id
+        except SQLAlchemyError:
+            _session.rollback()
+            raise
+        finally:
+            self.cleanup_session(_session if session is None else None)
+
+    def search(
+        self,
+        license_type: Optional[str] = None,
+        suitability: Optional[str] = None,
+        search_term: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None,
+        session: Optional[Session] = None,
+    ) -> Tuple[List[License], int]:
+        """Filter and paginate licenses in SQL.
+
+        The substring search on key and name is a case-insensitive ``ILIKE`` served by the trigram
+        indexes on both columns.
+
+        Args:
+            license_type: Optional exact license type.
+            suitability: Optional exact suitability rating.
+            search_term: Optional substring of the key or name.
+            offset: Number of licenses to skip.
+            limit: Maximum number of licenses to return, or None for all.
+            columns: Optional column names to load. The other columns (typically the FAQ JSON) are
+                deferred and must not be accessed on the returned instances.
+            session: Optional database session.
+
+        Returns:
+            Tuple of (licenses ordered by key, total number of matching licenses).
+        """
+        conditions = []
+        if license_type:
+            conditions.append(License.type == license_type)
+        if suitability:
+            conditions.append(License.type_suitability == suitability)
+        if search_term:
+            pattern = f"%{escape_like(search_term)}%"
+            conditions.append(or_(License.key.ilike(pattern, escape="\\"), License.name.ilike(pattern, escape="\\")))
+
+        _session = session or self.get_session()
+        try:
+            total = _session.execute(select(func.count(License.id)).where(*conditions)).scalar() or 0
+            if offset >= total:
+                return [], total
+
+            stmt = select(License).where(*conditions).order_by(License.key).offset(offset)
+            if columns:
+                stmt = stmt.options(load_only(*(getattr(License, column) for column in columns)))
+            if limit is not None:
+                stmt = stmt.limit(limit)
+            return list(_session.execute(stmt).scalars().all()), total
+        finally:
+            self.cleanup_session(_session if session is None else None)
+
 
 class ModelInfoCRUD(CRUDMixin[ModelInfo, None, None]):
     __model__ = ModelInfo
@@ -568,6 +751,89 @@ class ModelInfoCRUD(CRUDMixin[ModelInfo, None, None]):
         finally:
             self.cleanup_session(_session if session is None else None)
 
+    @staticmethod
+    def compute_content_hash(model: ModelInfo) -> str:
+        """Compute the content hash of a stored model row.
+
+        The hash covers the same fields as ``ModelInfoCreate.compute_content_hash`` so a row written by a
+        catalog sync and the same row read back hash identically.
+        """
+        fields = [field for field in ModelInfoCreate.model_fields if field != "content_hash"]
+        return compute_content_hash({field: getattr(model, field) for field in fields})
+
+    def bulk_sync_engine_version(
+        self,
+        rows: List[Dict[str, Any]],
+        engine_version_id: UUID,
+        session: Session,
+        batch_size: int = 500,
+    ) -> Dict[str, int]:
+        """Merge a full model catalog for an engine version using set-based statements.
+
+        The rows are written with ``bulk_upsert_by_uri``, so an unchanged catalog writes no model_info rows
+        at all. Every synced model is linked to the engine version with one multi-row INSERT per batch.
+        Models of the engine version that are missing from ``rows`` lose their association, and the ones
+        left without any association are deactivated with a single UPDATE.
+
+        The statements run inside the caller's transaction; committing or rolling back is left to the caller.
+
+        Args:
+            rows: Model info rows keyed by column name, all with the same keys. Rows sharing a URI are
+                collapsed, last one wins.
+            engine_version_id: The engine version the catalog belongs to.
+            session: The session owning the transaction.
+            batch_size: Number of rows per multi-row statement.
+
+        Returns:
+            Counts of inserted, updated, unchanged, unlinked and deactivated models.
+        """
+        table = self.model.__table__
+        model_ids, upsert_counts = bulk_upsert_by_uri(session, table, rows, batch_size)
+        counts = {**upsert_counts, "unlinked": 0, "deactivated": 0}
+
+        link_rows = [
+            {"model_info_id": model_id, "engine_version_id": engine_version_id} for model_id in model_ids.values()
+        ]
+        for start in range(0, len(link_rows), batch_size):
+            session.execute(
+                insert(engine_version_model_info)
+                .values(link_rows[start : start + batch_size])
+                .on_conflict_do_nothing()
+            )
+
+        synced_uris = list(model_ids)
+        unlinked_ids = [
+            row[0]
+            for row in session.execute(
+                delete(engine_version_model_info)
+                .where(
+                    engine_version_model_info.c.engine_version_id == engine_version_id,
+                    engine_version_model_info.c.model_info_id.in_(
+                        select(table.c.id).where(table.c.uri.not_in(synced_uris))
+                    ),
+                )
+                .returning(engine_version_model_info.c.model_info_id)
+            )
+        ]
+        counts["unlinked"] = len(unlinked_ids)
+
+        if unlinked_ids:
+            # Clearing the hash makes the next sync rewrite (and so reactivate) the row if it comes back
+            deactivated = session.execute(
+                update(table)
+                .where(
+                    table.c.id.in_(unlinked_ids),
+                    table.c.status != ModelStatusEnum.INACTIVE,
+                    ~exists().where(engine_version_model_info.c.model_info_id == table.c.id),
+                )
+                .values(status=ModelStatusEnum.INACTIVE, content_hash=None)
+                .returning(table.c.id)
+            ).all()
+            counts["deactivated"] = len(deactivated)
+
+        logger.debug("Bulk synced models for engine version %s: %s", engine_version_id, counts)
+        return counts
+
     def get_by_uri_with_architecture(
         self, uri: str, session: Optional[Session] = None
     ) -> Optional[Tuple[ModelInfo, ModelArchitectureClass]]:
@@ -605,6 +871,44 @@ class ModelDetailsCRUD(CRUDMixin[ModelDetails, None, None]):
         """
         super().__init__(self.__model__)
 
+    def get_validator_by_model_uri(
+        self, model_uri: str, session: Optional[Session] = None
+    ) -> Optional[Tuple[Any, ...]]:
+        """Get the version markers of every row that makes up the details of a model.
+
+        Runs the same joins as ``get_by_model_uri`` but only reads modification timestamps and the model
+        content hash, so callers can answer conditional requests without loading the full details.
+
+        Args:
+            model_uri: The URI of the model.
+            session: The session to use for the query.
+
+        Returns:
+            (content_hash, model_info, model_details, provider, architecture class and license
+            modification times), or None if the model has no details.
+        """
+        _session = session or self.get_session()
+        try:
+            return (
+                _session.query(
+                    ModelInfo.content_hash,
+                    ModelInfo.modified_at,
+                    self.model.modified_at,
+                    Provider.modified_at,
+                    ModelArchitectureClass.modified_at,
+                    License.modified_at,
+                )
+                .select_from(self.model)
+                .join(ModelInfo, self.model.model_info_id == ModelInfo.id)
+                .join(Provider, ModelInfo.provider_id == Provider.id)
+                .outerjoin(ModelArchitectureClass, ModelInfo.model_architecture_class_id == ModelArchitectureClass.id)
+                .outerjoin(License, ModelInfo.license_id == License.id)
+                .filter(ModelInfo.uri == model_uri)
+                .first()
+            )
+        finally:
+            self.cleanup_session(_session if session is None else None)
+
     def get_by_model_uri(self, model_uri: str, session: Optional[Session] = None) -> Optional[Dict[str, Any]]:
         """Get model details with model info and provider by model URI.
 
@@ -728,17 +1032,21 @@ class ModelArchitectureClassCRUD(CRUDMixin[ModelArchitectureClass, None, None]):
         limit: int = 100,
         search: Optional[str] = None,
         session: Optional[Session] = None,
-    ) -> Tuple[List[Dict[str, Any]], int]:
-        """Get all architectures with model count.
+        cursor: Optional[str] = None,
+        total_mode: TotalCountModeEnum = TotalCountModeEnum.EXACT,
+    ) -> Tuple[List[Dict[str, Any]], int, Optional[str]]:
+        """Get all architectures with model count, newest first.
 
         Args:
-            offset: Number of items to skip
+            offset: Number of items to skip, only applied when no cursor is given
             limit: Maximum number of items to return
             search: Optional search term for class_name or architecture_family
             session: Optional database session
+            cursor: Optional keyset cursor returned with the previous page
+            total_mode: Whether the total is counted exactly or estimated
 
         Returns:
-            Tuple of (list of architectures with model count, total count)
+            Tuple of (list of architectures with model count, total count, cursor of the next page or None)
         """
         _session = session if session else self.get_session()
 
@@ -765,10 +1073,26 @@ class ModelArchitectureClassCRUD(CRUDMixin[ModelArchitectureClass, None, None]):
                     (ModelArchitectureClass.class_name.ilike(search_term))
                     | (ModelArchitectureClass.architecture_family.ilike(search_term))
                 )
-            total = total_query.scalar() or 0
+            total = resolve_total(
+                _session,
+                lambda: total_query.scalar() or 0,
+                total_mode,
+                ModelArchitectureClass.__tablename__,
+                ("model_architecture_class", search),
+                filtered=bool(search),
+            )
 
             # Apply pagination and get results
-            results = query.offset(offset).limit(limit).all()
+            query = apply_keyset(query, ModelArchitectureClass.created_at, ModelArchitectureClass.id, cursor)
+            if not cursor:
+                query = query.offset(offset)
+            results = query.limit(limit + 1).all()
+
+            next_cursor = None
+            if len(results) > limit:
+                results = results[:limit]
+                last_arch = results[-1][0]
+                next_cursor = encode_keyset_cursor(last_arch.created_at, last_arch.id)
 
             # Format results
             architectures = []
@@ -787,7 +1111,7 @@ class ModelArchitectureClassCRUD(CRUDMixin[ModelArchitectureClass, None, None]):
                 }
                 architectures.append(arch_dict)
 
-            return architectures, total
+            return architectures, total, next_cursor
 
         except SQLAlchemyError as e:
             logger.error(f"Error fetching architectures: {e}")
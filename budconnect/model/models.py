@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING, Any, Dict, List
 from uuid import uuid4
 
 from budmicroframe.shared.psql_service import PSQLBase, TimestampMixin
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, String, Text
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.schema import Table
@@ -41,6 +41,10 @@ class License(PSQLBase, TimestampMixin):
     """
 
     __tablename__ = "license"
+    __table_args__ = (
+        Index("ix_license_key_trgm", "key", postgresql_using="gin", postgresql_ops={"key": "gin_trgm_ops"}),
+        Index("ix_license_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
 
     id: Mapped[UUID] = mapped_column(UUID, primary_key=True, default=uuid4, nullable=False)
     key: Mapped[str] = mapped_column(String, nullable=False, unique=True)
@@ -77,6 +81,15 @@ class Provider(PSQLBase, TimestampMixin):
     """
 
     __tablename__ = "provider"
+    __table_args__ = (
+        Index("ix_provider_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index(
+            "ix_provider_provider_type_trgm",
+            "provider_type",
+            postgresql_using="gin",
+            postgresql_ops={"provider_type": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(UUID, primary_key=True, default=uuid4, nullable=False)
     name: Mapped[str] = mapped_column(String, nullable=False)
@@ -108,6 +121,8 @@ class ModelInfo(PSQLBase, TimestampMixin):
             such as token limits, pricing information, and capabilities.
         provider_id (UUID): Foreign key reference to the provider that offers this model.
         provider (Provider): Relationship to the provider entity that owns or serves this model.
+        content_hash (str): SHA-256 of the normalized row payload, used to skip unchanged rows during
+            catalog syncs and exposed for conditional fetches.
 
     Note:
         The config field can store various model-specific details like maximum token limits,
@@ -115,6 +130,10 @@ class ModelInfo(PSQLBase, TimestampMixin):
     """
 
     __tablename__ = "model_info"
+    __table_args__ = (
+        Index("ix_model_info_created_at_id", "created_at", "id"),
+        Index("ix_model_info_provider_id", "provider_id"),
+    )
 
     id: Mapped[UUID] = mapped_column(UUID, primary_key=True, default=uuid4, nullable=False)
     uri: Mapped[str] = mapped_column(String, nullable=False, unique=True)
@@ -140,6 +159,7 @@ class ModelInfo(PSQLBase, TimestampMixin):
     status: Mapped[ModelStatusEnum] = mapped_column(
         Enum(ModelStatusEnum), nullable=False, default=ModelStatusEnum.ACTIVE
     )
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=True)
 
     provider: Mapped[Provider] = relationship(back_populates="models")
     license: Mapped[License] = relationship(back_populates="models")
@@ -168,6 +188,7 @@ class ModelArchitectureClass(PSQLBase, TimestampMixin):
     """
 
     __tablename__ = "model_architecture_class"
+    __table_args__ = (Index("ix_model_architecture_class_created_at_id", "created_at", "id"),)
 
     id: Mapped[UUID] = mapped_column(UUID, primary_key=True, default=uuid4, nullable=False)
     class_name: Mapped[str] = mapped_column(String, nullable=False, unique=True)
@@ -24,11 +24,14 @@ from uuid import UUID
 from budmicroframe.commons import logging
 from budmicroframe.commons.exceptions import ClientException
 from budmicroframe.commons.schemas import ErrorResponse
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 from fastapi.responses import JSONResponse
 from typing_extensions import Annotated
 
+from ..commons.conditional import not_modified_response
+from ..commons.constants import TotalCountModeEnum
 from ..commons.exceptions import SeederException
+from ..commons.executor import run_sync
 from ..seeders.tensorzero import TensorZeroSeeder
 from .schemas import (
     ModelArchitectureClassCreate,
@@ -61,7 +64,7 @@ async def get_compatible_models(
     offset = (page - 1) * limit
 
     try:
-        response = ModelService.get_compatible_models(engine, offset, limit, engine_version)
+        response = await run_sync(ModelService.get_compatible_models, engine, offset, limit, engine_version)
         return response.to_http_response()
     except ClientException as e:
         logger.error(f"Client exception: {e}")
@@ -85,9 +88,18 @@ async def get_models(
     supports_pipeline_parallelism: Annotated[
         Optional[bool], Query(description="Filter by pipeline parallelism support")
     ] = None,
+    cursor: Annotated[
+        Optional[str], Query(description="Cursor of the next page returned by the previous call; overrides page")
+    ] = None,
+    total_mode: Annotated[
+        TotalCountModeEnum, Query(description="Count the total exactly or return a cheap estimate")
+    ] = TotalCountModeEnum.EXACT,
 ) -> ModelListResponse:
     """Get all models with optional search and pagination.
 
+    Clients walking the whole catalog should follow ``next_cursor`` instead of incrementing ``page``;
+    cursor pages cost the same regardless of depth.
+
     Args:
         page: Page number (starts from 1)
         page_size: Number of items per page
@@ -95,15 +107,34 @@ async def get_models(
         provider_id: Optional provider ID to filter by
         supports_lora: Optional filter for LoRA support
         supports_pipeline_parallelism: Optional filter for pipeline parallelism support
+        cursor: Optional cursor returned as ``next_cursor`` by the previous page
+        total_mode: Whether the total is counted exactly or estimated
 
     Returns:
         List of models with pagination info
     """
     try:
-        models, total = ModelService.get_all_models(
-            page, page_size, search, provider_id, supports_lora, supports_pipeline_parallelism
+        models, total, next_cursor = await run_sync(
+            ModelService.get_all_models,
+            page,
+            page_size,
+            search,
+            provider_id,
+            supports_lora,
+            supports_pipeline_parallelism,
+            cursor,
+            total_mode,
+        )
+        return ModelListResponse(
+            models=models,
+            total=total,
+            page=page,
+            page_size=page_size,
+            next_cursor=next_cursor,
+            total_estimated=total_mode == TotalCountModeEnum.ESTIMATED,
         )
-        return ModelListResponse(models=models, total=total, page=page, page_size=page_size)
+    except ClientException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message) from e
     except Exception as e:
         logger.error(f"Error fetching models: {str(e)}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)) from e
@@ -115,6 +146,12 @@ async def get_architectures(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(100, ge=1, le=500, description="Number of items per page"),
     search: Optional[str] = Query(None, description="Search in class name or family"),
+    cursor: Annotated[
+        Optional[str], Query(description="Cursor of the next page returned by the previous call; overrides page")
+    ] = None,
+    total_mode: Annotated[
+        TotalCountModeEnum, Query(description="Count the total exactly or return a cheap estimate")
+    ] = TotalCountModeEnum.EXACT,
 ) -> Dict[str, Any]:
     """Get all model architectures with pagination and search.
 
@@ -122,18 +159,26 @@ async def get_architectures(
         page: Page number (starts from 1)
         page_size: Number of items per page
         search: Optional search term
+        cursor: Optional cursor returned as ``next_cursor`` by the previous page
+        total_mode: Whether the total is counted exactly or estimated
 
     Returns:
         List of architectures with pagination info
     """
     try:
-        architectures, total = ModelService.get_all_architectures(page, page_size, search)
+        architectures, total, next_cursor = await run_sync(
+            ModelService.get_all_architectures, page, page_size, search, cursor, total_mode
+        )
         return {
             "architectures": architectures,
             "total": total,
             "page": page,
             "page_size": page_size,
+            "next_cursor": next_cursor,
+            "total_estimated": total_mode == TotalCountModeEnum.ESTIMATED,
         }
+    except ClientException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message) from e
     except Exception as e:
         logger.error(f"Error fetching architectures: {str(e)}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)) from e
@@ -150,7 +195,7 @@ async def get_architecture(architecture_id: UUID) -> ModelArchitectureClassRespo
         Architecture details
     """
     try:
-        architecture = ModelService.get_architecture_by_id(architecture_id)
+        architecture = await run_sync(ModelService.get_architecture_by_id, architecture_id)
         if not architecture:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -175,7 +220,7 @@ async def create_architecture(architecture_data: ModelArchitectureClassCreate) -
         Created architecture
     """
     try:
-        architecture = ModelService.create_architecture(architecture_data)
+        architecture = await run_sync(ModelService.create_architecture, architecture_data)
         return architecture
     except Exception as e:
         logger.error(f"Error creating architecture: {str(e)}")
@@ -196,7 +241,7 @@ async def update_architecture(
         Updated architecture
     """
     try:
-        architecture = ModelService.update_architecture(architecture_id, architecture_data)
+        architecture = await run_sync(ModelService.update_architecture, architecture_id, architecture_data)
         if not architecture:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -221,7 +266,7 @@ async def delete_architecture(architecture_id: UUID) -> Dict[str, str]:
         Success message
     """
     try:
-        success = ModelService.delete_architecture(architecture_id)
+        success = await run_sync(ModelService.delete_architecture, architecture_id)
         if not success:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -246,7 +291,7 @@ async def get_model(model_id: UUID) -> ModelInfoResponse:
         Model details
     """
     try:
-        model = ModelService.get_model_by_id(model_id)
+        model = await run_sync(ModelService.get_model_by_id, model_id)
         return model
     except ClientException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message) from e
@@ -266,7 +311,7 @@ async def create_model(model_data: ModelInfoCreate) -> ModelInfoResponse:
         Created model details
     """
     try:
-        model = ModelService.create_model(model_data)
+        model = await run_sync(ModelService.create_model, model_data)
         return model
     except ClientException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message) from e
@@ -287,7 +332,7 @@ async def update_model(model_id: UUID, model_data: ModelInfoUpdate) -> ModelInfo
         Updated model details
     """
     try:
-        model = ModelService.update_model(model_id, model_data)
+        model = await run_sync(ModelService.update_model, model_id, model_data)
         return model
     except ClientException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message) from e
@@ -307,7 +352,7 @@ async def delete_model(model_id: UUID) -> None:
         No content on success
     """
     try:
-        ModelService.delete_model(model_id)
+        await run_sync(ModelService.delete_model, model_id)
         return None
     except ClientException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message) from e
@@ -317,17 +362,26 @@ async def delete_model(model_id: UUID) -> None:
 
 
 @model_router.get("/models/{model_uri:path}/details")
-async def get_model_details(model_uri: str) -> JSONResponse:
+async def get_model_details(model_uri: str, request: Request) -> Response:
     """Get detailed information for a specific model by URI.
 
+    Supports If-None-Match / If-Modified-Since; the validator is read before the full details join.
+
     Args:
         model_uri: The URI of the model to get details for.
+        request: The incoming request, used for conditional headers.
 
     Returns:
-        JSONResponse containing the model details or error message.
+        JSONResponse containing the model details or error message, or 304 if unchanged.
     """
     try:
-        response = ModelService.get_model_details(model_uri)
+        validator = await run_sync(ModelService.get_model_details_validator, model_uri)
+        if validator is not None:
+            not_modified = not_modified_response(request, *validator)
+            if not_modified is not None:
+                return not_modified
+
+        response = await run_sync(ModelService.get_model_details, model_uri)
         if response:
             return JSONResponse(status_code=status.HTTP_200_OK, content=response.model_dump(mode="json"))
         else:
@@ -359,7 +413,7 @@ async def update_model_details(model_id: UUID, details_data: ModelDetailsUpdate)
         Updated model details
     """
     try:
-        details = ModelService.update_model_details(model_id, details_data)
+        details = await run_sync(ModelService.update_model_details, model_id, details_data)
         return details
     except ClientException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message) from e
@@ -385,10 +439,11 @@ async def handle_tensorzero_sync():
         start_time = time.monotonic()
         logger.info("Starting periodic TensorZero model catalog sync...")
         try:
-            await TensorZeroSeeder().seed()
+            seeder = TensorZeroSeeder()
+            await seeder.seed()
             elapsed = time.monotonic() - start_time
             logger.info("TensorZero periodic sync completed successfully in %.1f seconds", elapsed)
-            return {"status": "success", "duration_seconds": round(elapsed, 1)}
+            return {"status": "success", "duration_seconds": round(elapsed, 1), "versions": seeder.sync_report}
         except SeederException as e:
             elapsed = time.monotonic() - start_time
             logger.error("TensorZero periodic sync failed after %.1f seconds: %s", elapsed, e.message)
@@ -17,12 +17,13 @@
 """The model schemas, containing essential data structures for the model microservice."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from budmicroframe.commons.schemas import PaginatedResponse
 from pydantic import UUID4, BaseModel, ConfigDict, Field
 
 from ..commons.constants import ModalityEnum, ModelEndpointEnum, ModelStatusEnum, ProviderCapabilityEnum
+from ..commons.hashing import compute_content_hash
 
 
 class LicenseFAQ(BaseModel):
@@ -61,6 +62,21 @@ class LicenseResponse(BaseModel):
     modified_at: datetime
 
 
+class LicenseSummaryResponse(BaseModel):
+    """Schema for the license columns embedded in model list responses.
+
+    The full license, FAQs included, is served by ``GET /licenses/{license_id}``.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID4
+    key: str
+    name: str
+    type: str
+    type_suitability: str
+
+
 class LiteLLMModelInfo(BaseModel):
     """Schema for LiteLLM model seeder."""
 
@@ -249,6 +265,11 @@ class ModelInfoCreate(BaseModel):
     tool_calling_parser_type: Optional[str] = None
     reasoning_parser_type: Optional[str] = None
     status: Optional[ModelStatusEnum] = None
+    content_hash: Optional[str] = None
+
+    def compute_content_hash(self) -> str:
+        """Compute the stable hash of every stored field except the hash itself."""
+        return compute_content_hash(self.model_dump(exclude={"content_hash"}))
 
     def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
         """Implement custom model_dump to convert nested Pydantic models to None."""
@@ -362,12 +383,13 @@ class ModelInfoResponse(BaseModel):
     features: Optional[Dict[str, Any]] = None
     endpoints: List[ModelEndpointEnum]
     deprecation_date: Optional[datetime] = None
-    license: Optional[LicenseResponse] = None
+    license: Optional[Union[LicenseResponse, LicenseSummaryResponse]] = None
     architecture_class: Optional[ModelArchitectureClassResponse] = None
     chat_template: Optional[str] = None
     tool_calling_parser_type: Optional[str] = None
     reasoning_parser_type: Optional[str] = None
     status: Optional[ModelStatusEnum] = None
+    content_hash: Optional[str] = None
     created_at: Optional[datetime] = None
     modified_at: Optional[datetime] = None
 
@@ -379,6 +401,8 @@ class ModelListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None
+    total_estimated: bool = False
 
 
 class CompatibleProviders(ProviderCreate):
@@ -16,6 +16,7 @@
 
 """This module contains the services for the model API."""
 
+from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
@@ -24,13 +25,17 @@ from budmicroframe.commons.exceptions import ClientException
 from fastapi import status
 from sqlalchemy.exc import IntegrityError
 
-from ..commons.constants import ProviderCapabilityEnum
+from ..commons.cache import catalog_generation
+from ..commons.conditional import make_etag
+from ..commons.constants import ProviderCapabilityEnum, TotalCountModeEnum
+from ..commons.pagination import apply_keyset, encode_keyset_cursor, resolve_total
 from ..engine.crud import EngineCRUD, EngineVersionCRUD
 from .crud import ModelArchitectureClassCRUD, ModelDetailsCRUD, ModelInfoCRUD, ProviderCRUD
 from .models import ModelInfo, Provider
 from .schemas import (
     CompatibleModelsResponse,
     CompatibleProviders,
+    LicenseSummaryResponse,
     ModelArchitectureClassCreate,
     ModelArchitectureClassResponse,
     ModelArchitectureClassUpdate,
@@ -99,6 +104,7 @@ class ModelService:
                                 "tool_calling_parser_type": db_model.tool_calling_parser_type,
                                 "reasoning_parser_type": db_model.reasoning_parser_type,
                                 "status": db_model.status,
+                                "content_hash": db_model.content_hash,
                             }
 
                         compatible_providers[str(db_provider.id)] = CompatibleProviders(
@@ -132,6 +138,7 @@ class ModelService:
                                 "tool_calling_parser_type": db_model.tool_calling_parser_type,
                                 "reasoning_parser_type": db_model.reasoning_parser_type,
                                 "status": db_model.status,
+                                "content_hash": db_model.content_hash,
                             }
                             compatible_providers[str(db_provider.id)].models.append(ModelInfoResponse(**model_data))
 
@@ -269,6 +276,24 @@ class ModelService:
             limit=limit,
         )
 
+    @staticmethod
+    def get_model_details_validator(model_uri: str) -> Optional[Tuple[str, datetime]]:
+        """Get the ETag and Last-Modified value of a model's details without loading them.
+
+        Args:
+            model_uri: The URI of the model.
+
+        Returns:
+            The strong ETag and the latest modification time, or None if the model has no details.
+        """
+        with ModelDetailsCRUD() as model_details_crud:
+            markers = model_details_crud.get_validator_by_model_uri(model_uri)
+
+        if markers is None:
+            return None
+        timestamps = [marker for marker in markers[1:] if marker is not None]
+        return make_etag("model-details", model_uri, *markers), max(timestamps)
+
     @staticmethod
     def get_model_details(model_uri: str) -> Optional[ModelDetailsResponse]:
         """Get detailed information for a specific model by URI.
@@ -293,19 +318,27 @@ class ModelService:
         provider_id: Optional[UUID] = None,
         supports_lora: Optional[bool] = None,
         supports_pipeline_parallelism: Optional[bool] = None,
-    ) -> Tuple[List[ModelInfoResponse], int]:
+        cursor: Optional[str] = None,
+        total_mode: TotalCountModeEnum = TotalCountModeEnum.EXACT,
+    ) -> Tuple[List[ModelInfoResponse], int, Optional[str]]:
         """Get all models with pagination and optional filtering.
 
+        Models are ordered newest first by (created_at, id). With a cursor the page starts right after
+        the row the cursor points at and ``page`` is ignored, so walking the whole catalog costs the
+        same per page.
+
         Args:
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), used when no cursor is given
             page_size: Number of items per page
             search: Optional search term to filter by URI
             provider_id: Optional provider ID to filter by
             supports_lora: Optional filter for LoRA support
             supports_pipeline_parallelism: Optional filter for pipeline parallelism support
+            cursor: Optional cursor returned with a previous page
+            total_mode: Whether the total is counted exactly or estimated
 
         Returns:
-            Tuple of (list of models, total count)
+            Tuple of (list of models, total count, cursor of the next page or None on the last page)
         """
         with ModelInfoCRUD() as crud:
             session = crud.get_session()
@@ -315,12 +348,16 @@ class ModelService:
 
                 from .models import License, ModelArchitectureClass
 
+                # Only the license summary columns are joined; FAQs and descriptions stay in the database
                 query = (
                     session.query(
                         ModelInfo,
                         Provider.name.label("provider_name"),
                         Provider.provider_type.label("provider_type"),
-                        License,
+                        License.key.label("license_key"),
+                        License.name.label("license_name"),
+                        License.type.label("license_type"),
+                        License.type_suitability.label("license_suitability"),
                     )
                     .join(Provider, ModelInfo.provider_id == Provider.id)
                     .outerjoin(License, ModelInfo.license_id == License.id)
@@ -348,19 +385,41 @@ class ModelService:
                         == supports_pipeline_parallelism
                     )
 
-                # Get total count
-                total = query.count()
+                filters = (search, provider_id, supports_lora, supports_pipeline_parallelism)
+                total = resolve_total(
+                    session,
+                    query.count,
+                    total_mode,
+                    ModelInfo.__tablename__,
+                    ("model_info",) + filters,
+                    filtered=any(value is not None for value in filters),
+                )
 
-                # Sort by created_at date (newest first)
-                query = query.order_by(ModelInfo.created_at.desc())
+                # Sort newest first; a cursor continues after the last row of the previous page
+                query = apply_keyset(query, ModelInfo.created_at, ModelInfo.id, cursor)
+                if not cursor:
+                    query = query.offset((page - 1) * page_size)
+                results = query.limit(page_size + 1).all()
 
-                # Apply pagination
-                offset = (page - 1) * page_size
-                results = query.offset(offset).limit(page_size).all()
+                next_cursor = None
+                if len(results) > page_size:
+                    results = results[:page_size]
+                    last_model = results[-1][0]
+                    next_cursor = encode_keyset_cursor(last_model.created_at, last_model.id)
 
                 # Convert to response format
                 models = []
-                for model, provider_name, provider_type, license in results:
+                for model, provider_name, provider_type, *license_columns in results:
+                    license = None
+                    if model.license_id is not None and license_columns[0] is not None:
+                        license_key, license_name, license_type, license_suitability = license_columns
+                        license = LicenseSummaryResponse(
+                            id=model.license_id,
+                            key=license_key,
+                            name=license_name,
+                            type=license_type,
+                            type_suitability=license_suitability,
+                        )
                     model_dict = {
                         "id": model.id,
                         "uri": model.uri,
@@ -382,12 +441,13 @@ class ModelService:
                         "chat_template": model.chat_template,
                         "tool_calling_parser_type": model.tool_calling_parser_type,
                         "reasoning_parser_type": model.reasoning_parser_type,
+                        "content_hash": model.content_hash,
                         "created_at": model.created_at,
                         "modified_at": model.modified_at,
                     }
                     models.append(ModelInfoResponse(**model_dict))
 
-                return models, total
+                return models, total, next_cursor
             finally:
                 crud.cleanup_session(session)
 
@@ -448,6 +508,7 @@ class ModelService:
                     "chat_template": model.chat_template,
                     "tool_calling_parser_type": model.tool_calling_parser_type,
                     "reasoning_parser_type": model.reasoning_parser_type,
+                    "content_hash": model.content_hash,
                     "created_at": model.created_at,
                     "modified_at": model.modified_at,
                 }
@@ -484,8 +545,10 @@ class ModelService:
 
             try:
                 # Create the model
+                model_data.content_hash = model_data.compute_content_hash()
                 model_dict = model_data.model_dump()
                 created_model_id = crud.upsert(model_dict)
+                catalog_generation.bump("model created")
 
                 # Return with provider info
                 return ModelService.get_model_by_id(created_model_id)
@@ -535,8 +598,10 @@ class ModelService:
                     # Update the model attributes
                     for key, value in update_dict.items():
                         setattr(model, key, value)
+                    model.content_hash = ModelInfoCRUD.compute_content_hash(model)
                     session.add(model)
                     session.commit()
+                    catalog_generation.bump("model updated")
                 finally:
                     crud.cleanup_session(session)
 
@@ -581,6 +646,7 @@ class ModelService:
                 # Delete the model itself
                 session.delete(model)
                 session.commit()
+                catalog_generation.bump("model deleted")
                 logger.info(f"Successfully deleted model {model_id} ({model.uri})")
 
             except ClientException:
@@ -681,6 +747,8 @@ class ModelService:
                 # Update model fields
                 for key, value in update_dict.items():
                     setattr(model, key, value)
+                if update_dict:
+                    model.content_hash = ModelInfoCRUD.compute_content_hash(model)
 
                 session.commit()
 
@@ -748,27 +816,34 @@ class ModelService:
         page: int = 1,
         page_size: int = 100,
         search: Optional[str] = None,
-    ) -> Tuple[List[Dict[str, Any]], int]:
+        cursor: Optional[str] = None,
+        total_mode: TotalCountModeEnum = TotalCountModeEnum.EXACT,
+    ) -> Tuple[List[Dict[str, Any]], int, Optional[str]]:
         """Get all architectures with pagination and search.
 
         Args:
-            page: Page number (starts from 1)
+            page: Page number (starts from 1), used when no cursor is given
             page_size: Number of items per page
             search: Optional search term
+            cursor: Optional cursor returned with a previous page
+            total_mode: Whether the total is counted exactly or estimated
 
         Returns:
-            Tuple of (architectures list, total count)
+            Tuple of (architectures list, total count, cursor of the next page or None on the last page)
         """
         crud = ModelArchitectureClassCRUD()
-        offset = (page - 1) * page_size
+        offset = 0 if cursor else (page - 1) * page_size
 
         try:
-            architectures, total = crud.get_all_with_model_count(
+            return crud.get_all_with_model_count(
                 offset=offset,
                 limit=page_size,
                 search=search,
+                cursor=cursor,
+                total_mode=total_mode,
             )
-            return architectures, total
+        except ClientException:
+            raise
         except Exception as e:
             logger.error(f"Error fetching architectures: {e}")
             raise ClientException(message=f"Failed to fetch architectures: {str(e)}", status_code=500) from e
@@ -820,6 +895,7 @@ class ModelService:
 
         try:
             architecture = crud.insert(architecture_data.model_dump())
+            catalog_generation.bump("architecture created")
             return ModelArchitectureClassResponse(
                 id=architecture.id,
                 class_name=architecture.class_name,
@@ -866,6 +942,7 @@ class ModelService:
             update_count = crud.update(architecture_data.model_dump(exclude_unset=True), {"id": architecture_id})
 
             if update_count > 0:
+                catalog_generation.bump("architecture updated")
                 # Fetch the updated architecture
                 updated = crud.fetch_one({"id": architecture_id})
                 if updated:
@@ -914,6 +991,7 @@ class ModelService:
 
             # Delete architecture
             crud.delete({"id": architecture_id})
+            catalog_generation.bump("architecture deleted")
             return True
         except ClientException:
             raise
@@ -23,6 +23,7 @@ from budmicroframe.commons import logging
 from budmicroframe.commons.exceptions import ClientException
 from fastapi import APIRouter, HTTPException, Query, status
 
+from ..commons.executor import run_sync
 from .schemas import (
     ProviderCreate,
     ProviderListResponse,
@@ -54,7 +55,7 @@ async def get_providers(
         List of providers with pagination info
     """
     try:
-        providers, total = ProviderService.get_all_providers(page, page_size, search)
+        providers, total = await run_sync(ProviderService.get_all_providers, page, page_size, search)
 
         provider_responses = []
         for provider in providers:
@@ -89,7 +90,7 @@ async def get_provider(provider_id: UUID) -> ProviderResponse:
         Provider details
     """
     try:
-        provider = ProviderService.get_provider_by_id(provider_id)
+        provider = await run_sync(ProviderService.get_provider_by_id, provider_id)
         return ProviderResponse(
             id=provider.id,
             name=provider.name,
@@ -119,7 +120,7 @@ async def create_provider(provider_data: ProviderCreate) -> ProviderResponse:
         Created provider details
     """
     try:
-        provider = ProviderService.create_provider(provider_data)
+        provider = await run_sync(ProviderService.create_provider, provider_data)
         return ProviderResponse(
             id=provider.id,
             name=provider.name,
@@ -150,7 +151,7 @@ async def update_provider(provider_id: UUID, provider_data: ProviderUpdate) -> P
         Updated provider details
     """
     try:
-        provider = ProviderService.update_provider(provider_id, provider_data)
+        provider = await run_sync(ProviderService.update_provider, provider_id, provider_data)
         return ProviderResponse(
             id=provider.id,
             name=provider.name,
@@ -180,7 +181,7 @@ async def delete_provider(provider_id: UUID) -> None:
         No content on success
     """
     try:
-        ProviderService.delete_provider(provider_id)
+        await run_sync(ProviderService.delete_provider, provider_id)
         return None
     except ClientException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message) from e
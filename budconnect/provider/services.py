@@ -17,14 +17,15 @@
 """Service layer for provider operations."""
 
 import logging
-from typing import List, Optional, Tuple
+from typing import Any, List, Optional, Tuple
 from uuid import UUID
 
 from budmicroframe.commons.exceptions import ClientException
+from sqlalchemy import func, or_, select
 from sqlalchemy.exc import IntegrityError
 
 from budconnect.model.crud import ProviderCRUD
-from budconnect.model.models import Provider
+from budconnect.model.models import ModelInfo, Provider
 
 from .schemas import ProviderCreate, ProviderUpdate
 
@@ -32,6 +33,17 @@ from .schemas import ProviderCreate, ProviderUpdate
 logger = logging.getLogger(__name__)
 
 
+def _model_count_subquery() -> Any:
+    """Correlated ``COUNT`` of the models of the provider in the enclosing query."""
+    return (
+        select(func.count(ModelInfo.id))
+        .where(ModelInfo.provider_id == Provider.id)
+        .correlate(Provider)
+        .scalar_subquery()
+        .label("model_count")
+    )
+
+
 class ProviderService:
     """Service class for provider operations."""
 
@@ -39,6 +51,11 @@ class ProviderService:
     def get_all_providers(page: int = 1, page_size: int = 100, search: Optional[str] = None) -> Tuple[List[dict], int]:
         """Get all providers with pagination and optional search.
 
+        Pagination and counting run in SQL: the page is fetched with LIMIT/OFFSET ordered by (name, id),
+        the total with a separate COUNT over ``provider`` only, and each row's model count with a
+        correlated aggregate served by the ``model_info.provider_id`` index. The search is a
+        case-insensitive substring match backed by trigram indexes on name and provider_type.
+
         Args:
             page: Page number (starts from 1)
             page_size: Number of items per page
@@ -47,35 +64,29 @@ class ProviderService:
         Returns:
             Tuple of (list of provider dicts, total count)
         """
-        from sqlalchemy import func
-
-        from ..model.models import ModelInfo
-
         with ProviderCRUD() as crud:
             session = crud.get_session()
             try:
-                # Build base query with model count using LEFT JOIN
-                query = (
-                    session.query(Provider, func.count(ModelInfo.id).label("model_count"))
-                    .outerjoin(ModelInfo, Provider.id == ModelInfo.provider_id)
-                    .group_by(Provider.id)
-                )
+                query = session.query(Provider, _model_count_subquery())
+                count_query = session.query(func.count(Provider.id))
 
                 # Apply search filter if provided
                 if search:
-                    search_lower = f"%{search.lower()}%"
-                    query = query.filter(
-                        (func.lower(Provider.name).like(search_lower))
-                        | (func.lower(Provider.provider_type).like(search_lower))
+                    search_pattern = f"%{search}%"
+                    search_filter = or_(
+                        Provider.name.ilike(search_pattern), Provider.provider_type.ilike(search_pattern)
                     )
+                    query = query.filter(search_filter)
+                    count_query = count_query.filter(search_filter)
 
-                # Get all results for total count
-                all_results = query.all()
-                total = len(all_results)
+                total = count_query.scalar() or 0
 
-                # Apply pagination manually
                 offset = (page - 1) * page_size
-                paginated_results = all_results[offset : offset + page_size]
+                paginated_results = (
+                    query.order_by(Provider.name, Provider.id).offset(offset).limit(page_size).all()
+                    if offset < total
+                    else []
+                )
 
                 # Convert to dict format
                 result_providers = []
@@ -111,21 +122,11 @@ class ProviderService:
         Raises:
             ClientException: If provider not found
         """
-        from sqlalchemy import func
-
-        from ..model.models import ModelInfo
-
         with ProviderCRUD() as crud:
             session = crud.get_session()
             try:
                 # Query provider with model count
-                result = (
-                    session.query(Provider, func.count(ModelInfo.id).label("model_count"))
-                    .outerjoin(ModelInfo, Provider.id == ModelInfo.provider_id)
-                    .filter(Provider.id == provider_id)
-                    .group_by(Provider.id)
-                    .first()
-                )
+                result = session.query(Provider, _model_count_subquery()).filter(Provider.id == provider_id).first()
 
                 if not result:
                     raise ClientException(message=f"Provider with ID {provider_id} not found", status_code=404)
@@ -10,14 +10,16 @@ from .tensorzero import TensorZeroSeeder
 from .user import UserSeeder
 
 
+# Run as a DAG by runner.SeederRunner; each seeder declares its dependencies (depends_on) and the order below
+# only breaks ties between independent seeders
 seeders = {
-    "user": UserSeeder,  # This should run first to create initial admin
+    "user": UserSeeder,  # Creates the initial admin
     "engine": EngineSeeder,
-    "license": LicenseSeeder,  # This should run before litellm and tensorzero
+    "license": LicenseSeeder,
     # "litellm": LiteLLMSeeder,
-    "tensorzero": TensorZeroSeeder,
-    "model_details": ModelDetailsSeeder,  # This should run after litellm and tensorzero
-    "guardrails": GuardrailsSeeder,  # This should run after tensorzero to ensure providers exist
+    "tensorzero": TensorZeroSeeder,  # Fetches the catalog SDK, after engine and license
+    "model_details": ModelDetailsSeeder,  # After tensorzero
+    "guardrails": GuardrailsSeeder,  # After tensorzero, which creates the guardrail providers
     "model_architecture": ModelArchitectureSeeder,
     "a2a_registry": A2ARegistrySeeder,  # Fetches A2A agents from a2aregistry.org
 }
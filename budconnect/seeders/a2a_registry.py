@@ -12,6 +12,8 @@ logger = logging.getLogger(__name__)
 class A2ARegistrySeeder(BaseSeeder):
     """Seeds the database with A2A agents from a2aregistry.org."""
 
+    requires_network = True
+
     async def seed(self) -> None:
         """Seed the database with A2A registry agents."""
         logger.info("Starting A2A registry seeder...")
@@ -1,8 +1,67 @@
+import hashlib
+import inspect
+import os
 from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+
+SEEDERS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Read size used when hashing input files
+FINGERPRINT_CHUNK_SIZE = 1024 * 1024
+
+# Version of what shapes the seeded rows outside the seeder modules and data files: the shared helpers
+# (content hashing, bulk upserts) and the tables they write. Bump it with such a change so every seeder runs
+# once more; to re-run seeders without a code change use SEEDERS_FORCE or SEEDERS_SKIP_UNCHANGED=false.
+FINGERPRINT_VERSION = 1
 
 
 class BaseSeeder(ABC):
-    """Base seeder class."""
+    """Base seeder class.
+
+    Attributes:
+        depends_on: Names of the seeders that must complete before this one runs.
+        input_paths: Data files or directories the seeder reads. Together with the seeder's module source they
+            make up its fingerprint, a seeder without input paths is run on every startup.
+        requires_network: Whether the seeder fetches its data over the network. Such seeders, and the ones that
+            depend on them, have no fingerprint and run in the background once the application is ready.
+    """
+
+    depends_on: Tuple[str, ...] = ()
+    input_paths: Tuple[str, ...] = ()
+    requires_network: bool = False
+
+    @classmethod
+    def fingerprint(cls) -> Optional[str]:
+        """Return a SHA-256 of ``FINGERPRINT_VERSION``, the seeder's module source and its input files.
+
+        Returns:
+            The hex digest, or None if the seeder has no local inputs to fingerprint.
+        """
+        if cls.requires_network or not cls.input_paths:
+            return None
+
+        files = [inspect.getfile(cls)]
+        for path in cls.input_paths:
+            if os.path.isdir(path):
+                files.extend(
+                    os.path.join(root, name) for root, _, names in sorted(os.walk(path)) for name in sorted(names)
+                )
+            else:
+                files.append(path)
+
+        digest = hashlib.sha256(f"v{FINGERPRINT_VERSION}\0".encode("utf-8"))
+        for file_path in files:
+            digest.update(os.path.relpath(file_path, SEEDERS_DIR).encode("utf-8") + b"\0")
+            if not os.path.exists(file_path):
+                # A missing input is part of the state, the seeder decides how to handle it
+                digest.update(b"missing\0")
+                continue
+            with open(file_path, "rb") as f:
+                while chunk := f.read(FINGERPRINT_CHUNK_SIZE):
+                    digest.update(chunk)
+            digest.update(b"\0")
+        return digest.hexdigest()
 
     @abstractmethod
     async def seed(self) -> None:
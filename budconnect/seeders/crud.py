@@ -0,0 +1,79 @@
+#  -----------------------------------------------------------------------------
+#  Copyright (c) 2024 Bud Ecosystem Inc.
+#  #
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  #
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  #
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  -----------------------------------------------------------------------------
+
+"""CRUD operations for the recorded startup seeder runs."""
+
+from typing import Optional
+
+from budmicroframe.commons import logging
+from budmicroframe.shared.psql_service import CRUDMixin
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from .models import SeederRun
+
+
+logger = logging.get_logger(__name__)
+
+
+class SeederRunCRUD(CRUDMixin[SeederRun, None, None]):
+    """Access to the last successful run of each startup seeder."""
+
+    __model__ = SeederRun
+
+    def __init__(self) -> None:
+        """Initialize the SeederRunCRUD class."""
+        super().__init__(self.__model__)
+
+    def get_fingerprint(self, name: str, session: Optional[Session] = None) -> Optional[str]:
+        """Return the input fingerprint recorded by the last successful run of a seeder.
+
+        Args:
+            name: Name of the seeder.
+            session: Optional database session.
+
+        Returns:
+            The recorded fingerprint, or None if the seeder never completed or has no fingerprint.
+        """
+        _session = session or self.get_session()
+        try:
+            return _session.execute(select(SeederRun.fingerprint).where(SeederRun.name == name)).scalar()
+        finally:
+            self.cleanup_session(_session if session is None else None)
+
+    def record_run(self, name: str, fingerprint: Optional[str], session: Optional[Session] = None) -> None:
+        """Record a successful run of a seeder and commit it.
+
+        Args:
+            name: Name of the seeder.
+            fingerprint: Fingerprint of the inputs the run seeded, or None.
+            session: Optional database session.
+        """
+        _session = session or self.get_session()
+        try:
+            stmt = insert(SeederRun).values(name=name, fingerprint=fingerprint)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["name"], set_={"fingerprint": stmt.excluded.fingerprint, "completed_at": func.now()}
+            )
+            _session.execute(stmt)
+            _session.commit()
+            logger.debug("Recorded run of seeder %s with fingerprint %s", name, fingerprint)
+        except Exception:
+            _session.rollback()
+            raise
+        finally:
+            self.cleanup_session(_session if session is None else None)
@@ -3,12 +3,14 @@ import logging
 import os
 from typing import Any, Dict, List
 
+from ..commons.cache import catalog_generation
 from ..engine.crud import (
     EngineCompatibilityCRUD,
     EngineCRUD,
     EngineParserRuleCRUD,
     EngineVersionCRUD,
 )
+from ..engine.parser_matcher import validate_rule_pattern
 from ..engine.schemas import (
     EngineCompatibilityCreate,
     EngineCreate,
@@ -30,6 +32,8 @@ ENGINE_SEEDER_FILE_PATH = os.path.join(CURRENT_FILE_PATH, "data", "engines.json"
 class EngineSeeder(BaseSeeder):
     """Engine seeder."""
 
+    input_paths = (ENGINE_SEEDER_FILE_PATH,)
+
     async def seed(self) -> None:
         """Seed the database."""
         logger.info("Starting engine seeder...")
@@ -39,6 +43,9 @@ class EngineSeeder(BaseSeeder):
         except Exception as e:
             logger.exception(f"Failed to seed engine: {e}")
             raise
+        finally:
+            # Even a partial run may have written catalog rows
+            catalog_generation.bump("engine seeder")
 
     @staticmethod
     async def _seed_engine() -> None:
@@ -212,6 +219,11 @@ class EngineSeeder(BaseSeeder):
                             engine_compatibility_crud.insert(new_compat.model_dump(exclude_unset=True))
                             logger.info(f"Created new compatibility for version {version_id}")
 
+                        # Keep the indexed architecture/endpoint lookup rows in step with the JSONB payload
+                        engine_compatibility_crud.sync_match_index(
+                            version_id, architectures_dict, supported_endpoints_dict
+                        )
+
             # Process parser rules at engine level (not per version)
             if "parser_rules" in engine_data:
                 parser_rules = engine_data.get("parser_rules", [])  # type: ignore
@@ -303,6 +315,12 @@ class EngineSeeder(BaseSeeder):
                             )
                             continue
 
+                        try:
+                            validate_rule_pattern(rule_payload["match_type"], rule_payload["pattern"])
+                        except ValueError as e:
+                            logger.warning("Skipping parser rule for engine %s: %s", engine_id, e)
+                            continue
+
                         # Check if this rule already exists (match by pattern, match_type, and rule_type)
                         existing_rule = next(
                             (
@@ -18,12 +18,15 @@
 
 import json
 import os
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from budmicroframe.commons import logging
+from sqlalchemy.exc import SQLAlchemyError
 
 from ..commons.constants import ModelProviderTypeEnum, ScannerTypeEnum
 from ..commons.exceptions import SeederException
+from ..commons.hashing import compute_content_hash
 from ..engine.crud import EngineCRUD
 from ..guardrails.crud import GuardrailProbeCRUD, GuardrailRuleCRUD
 from ..model.crud import ProviderCRUD
@@ -36,6 +39,12 @@ logger = logging.get_logger(__name__)
 SEEDER_DIR = os.path.dirname(os.path.abspath(__file__))
 GUARDRAILS_DATA_PATH = os.path.join(SEEDER_DIR, "data", "guardrails.json")
 
+# Number of probe or rule rows per multi-row statement
+GUARDRAIL_SYNC_BATCH_SIZE = 500
+
+SCANNER_TYPES = frozenset(e.value for e in ScannerTypeEnum)
+MODEL_PROVIDER_TYPES = frozenset(e.value for e in ModelProviderTypeEnum)
+
 
 def read_json_file(file_path: str) -> List[Dict[str, Any]]:
     """Read and parse JSON data from a file.
@@ -58,6 +67,114 @@ def read_json_file(file_path: str) -> List[Dict[str, Any]]:
         return data
 
 
+def normalize_enum_value(raw: Optional[str], valid_values: FrozenSet[str], field: str) -> Optional[str]:
+    """Lowercase an enum value from the data file, returning None with a warning if it is not a known value.
+
+    Args:
+        raw: The value as written in the data file.
+        valid_values: The values of the PostgreSQL enum.
+        field: The field name, used in the warning.
+
+    Returns:
+        The lowercased value, or None if it is empty or unknown.
+    """
+    if not raw:
+        return None
+    value = raw.lower()
+    if value not in valid_values:
+        logger.warning("Unknown %s: %s", field, raw)
+        return None
+    return value
+
+
+def require(data: Dict[str, Any], key: str, context: str) -> Any:
+    """Return a mandatory field of a data file entry.
+
+    Args:
+        data: The data file entry.
+        key: The field name.
+        context: Description of the entry, used in the error message.
+
+    Returns:
+        The field value.
+
+    Raises:
+        SeederException: If the field is missing or empty.
+    """
+    value = data.get(key)
+    if not value:
+        raise SeederException(f"Missing '{key}' in {context}")
+    return value
+
+
+def normalize_provider_guardrails(
+    provider_guardrails: Dict[str, Any],
+) -> Tuple[str, List[Dict[str, Any]], List[Tuple[str, Dict[str, Any]]]]:
+    """Validate one provider's entry of the data file and convert it into probe and rule rows.
+
+    Every row carries the ``content_hash`` of its payload. Probes are hashed with their provider type
+    and rules with their probe URI instead of the database IDs, which are only known once the rows are
+    written.
+
+    Args:
+        provider_guardrails: The provider's entry of ``guardrails.json``.
+
+    Returns:
+        The provider type, probe rows without ``provider_id`` and ``(probe_uri, rule_row)`` pairs with rule
+        rows without ``probe_id``.
+
+    Raises:
+        SeederException: If a probe or rule misses a mandatory field.
+    """
+    provider_type = require(provider_guardrails, "provider_type", "guardrails provider entry")
+    probe_rows: List[Dict[str, Any]] = []
+    rule_entries: List[Tuple[str, Dict[str, Any]]] = []
+
+    for probe_data in provider_guardrails.get("probes", []):
+        probe_uri = require(probe_data, "id", f"probe of provider {provider_type}")  # For probes, URI is same as ID
+        probe_row = {
+            "name": require(probe_data, "title", f"probe {probe_uri}"),
+            "uri": probe_uri,
+            "description": probe_data.get("description"),
+            "icon": probe_data.get("icon"),
+            "tags": probe_data.get("tags", []),
+            "deprecation_date": probe_data.get("deprecation_date"),
+        }
+        probe_row["content_hash"] = compute_content_hash({**probe_row, "provider_type": provider_type})
+        probe_rows.append(probe_row)
+
+        for rule_data in probe_data.get("rules", []):
+            rule_id = require(rule_data, "id", f"rule of probe {probe_uri}")
+            # Create rule URI based on the pattern: scanner/rule_id
+            scanner_raw = rule_data.get("scanner")
+            rule_uri = f"{scanner_raw}/{rule_id}" if scanner_raw and provider_type == "bud_sentinel" else rule_id
+
+            rule_row = {
+                "name": require(rule_data, "title", f"rule {rule_uri}"),
+                "uri": rule_uri,
+                "description": rule_data.get("description"),
+                "icon": rule_data.get("icon"),
+                "examples": rule_data.get("examples", []),
+                "guard_types": rule_data.get("guard_types", []),
+                "scanner_type": normalize_enum_value(scanner_raw, SCANNER_TYPES, "scanner_type"),
+                "modality_types": rule_data.get("modalities", []),
+                "deprecation_date": rule_data.get("deprecation_date"),
+                "model_id": rule_data.get("model_id"),
+                "model_provider_type": normalize_enum_value(
+                    rule_data.get("model_provider_type"), MODEL_PROVIDER_TYPES, "model_provider_type"
+                ),
+                "is_gated": rule_data.get("is_gated"),
+            }
+            if rule_row["model_id"] and (rule_row["model_provider_type"] is None or rule_row["is_gated"] is None):
+                raise SeederException(
+                    f"Rule {rule_uri} has a model_id without a valid model_provider_type and is_gated"
+                )
+            rule_row["content_hash"] = compute_content_hash({**rule_row, "probe_uri": probe_uri})
+            rule_entries.append((probe_uri, rule_row))
+
+    return provider_type, probe_rows, rule_entries
+
+
 class GuardrailsSeeder(BaseSeeder):
     """Seeder for Guardrails probe and rule data.
 
@@ -65,23 +182,86 @@ class GuardrailsSeeder(BaseSeeder):
     and preparing it for database insertion.
     """
 
+    # Probes belong to the guardrail providers created by the TensorZero seeder
+    depends_on = ("engine", "tensorzero")
+    input_paths = (GUARDRAILS_DATA_PATH,)
+
+    def __init__(self) -> None:
+        """Initialize the seeder with an empty sync report."""
+        self.sync_report: List[Dict[str, Any]] = []
+
+    def sync_provider(
+        self,
+        provider_type: str,
+        probe_rows: List[Dict[str, Any]],
+        rule_entries: List[Tuple[str, Dict[str, Any]]],
+    ) -> Optional[Dict[str, Any]]:
+        """Merge the probes and rules of one provider into the database in a single transaction.
+
+        Probes are upserted first with multi-row statements returning their IDs, which are then filled in
+        the rule rows before the rules are upserted the same way. Rows whose content hash did not change
+        are skipped. Either all of the provider's guardrails are applied or none are.
+
+        Args:
+            provider_type: The provider the guardrails belong to.
+            probe_rows: Normalized probe rows without ``provider_id``.
+            rule_entries: ``(probe_uri, rule_row)`` pairs with rule rows without ``probe_id``.
+
+        Returns:
+            Row counts of the merge and the wall time in seconds, or None if the provider does not exist.
+        """
+        start_time = time.perf_counter()
+
+        with GuardrailProbeCRUD() as probe_crud:
+            session = probe_crud.get_session()
+            try:
+                db_provider = ProviderCRUD().fetch_one(conditions={"provider_type": provider_type}, session=session)
+                if not db_provider:
+                    logger.warning("Provider %s not found in database", provider_type)
+                    return None
+
+                probe_ids, probe_counts = probe_crud.bulk_upsert(
+                    [{**row, "provider_id": db_provider.id} for row in probe_rows],
+                    session=session,
+                    batch_size=GUARDRAIL_SYNC_BATCH_SIZE,
+                )
+                _, rule_counts = GuardrailRuleCRUD().bulk_upsert(
+                    [{**row, "probe_id": probe_ids[probe_uri]} for probe_uri, row in rule_entries],
+                    session=session,
+                    batch_size=GUARDRAIL_SYNC_BATCH_SIZE,
+                )
+                session.commit()
+            except SQLAlchemyError as e:
+                session.rollback()
+                logger.exception("Failed to sync guardrails for provider %s: %s", provider_type, e)
+                raise SeederException(f"Failed to sync guardrails for provider {provider_type}") from e
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                probe_crud.cleanup_session(session)
+
+        return {
+            "provider_type": provider_type,
+            "probes": probe_counts,
+            "rules": rule_counts,
+            "duration_seconds": round(time.perf_counter() - start_time, 3),
+        }
+
     async def seed(self) -> None:
         """Seed the database with Guardrails probe and rule data.
 
         This method:
         1. Loads the guardrails data from JSON file
-        2. Groups data by provider type
-        3. Gets provider IDs from database
-        4. Creates probes and rules in the database
+        2. Validates and normalizes the probes and rules of every provider
+        3. Merges each provider's guardrails in a single transaction, recording counts and timing in
+           ``sync_report``
 
         Raises:
             SeederException: If there is an error during the seeding process
         """
+        self.sync_report = []
         try:
-            # Initialize counters
-            probe_upserts = 0
-            rule_upserts = 0
-
             # Load guardrails data
             guardrails_data = read_json_file(GUARDRAILS_DATA_PATH)
             logger.info("Loaded %d provider guardrail sets from data file", len(guardrails_data))
@@ -89,7 +269,6 @@ class GuardrailsSeeder(BaseSeeder):
             # Get engine configuration from database
             engine_crud = EngineCRUD()
             with engine_crud as crud, crud.get_session() as session:
-                # Try both tensorzero and bud_sentinel engines
                 db_engine = engine_crud.fetch_one(conditions={"name": "tensorzero"}, session=session)
                 if db_engine:
                     logger.info("Found %s engine", "tensorzero")
@@ -101,119 +280,48 @@ class GuardrailsSeeder(BaseSeeder):
                     logger.warning("No versions defined for %s engine", db_engine.name)
                     return
 
-                # Get the latest version
-                # version_config = db_engine.versions[0]  # Assuming first version is the latest
-
-            # Process each provider's guardrails
-            for provider_guardrails in guardrails_data:
-                provider_type = provider_guardrails["provider_type"]
-                probes = provider_guardrails.get("probes", [])
-
-                # Initialize per-provider counters
-                provider_probe_upserts = 0
-                provider_rule_upserts = 0
-
-                logger.info("Processing %d probes for provider %s", len(probes), provider_type)
-
-                # Get provider from database
-                with ProviderCRUD() as provider_crud:
-                    db_provider = provider_crud.fetch_one(conditions={"provider_type": provider_type})
-                    if not db_provider:
-                        logger.warning("Provider %s not found in database", provider_type)
-                        continue
-
-                    provider_id = db_provider.id
-
-                # Process each probe
-                for probe_data in probes:
-                    probe_uri = probe_data["id"]  # For probes, URI is same as ID
-
-                    # Create probe data
-                    probe_create_data = {
-                        "name": probe_data["title"],
-                        "uri": probe_uri,
-                        "description": probe_data.get("description"),
-                        "icon": probe_data.get("icon"),
-                        "tags": probe_data.get("tags", []),
-                        "provider_id": provider_id,
-                        "deprecation_date": probe_data.get("deprecation_date"),
-                    }
-
-                    # Upsert probe
-                    with GuardrailProbeCRUD() as probe_crud:
-                        db_probe_id = probe_crud.upsert(data=probe_create_data, conflict_target=["uri"])
-                        probe_upserts += 1
-                        provider_probe_upserts += 1
-
-                    # Process rules for this probe
-                    rules = probe_data.get("rules", [])
-                    for rule_data in rules:
-                        rule_id = rule_data["id"]
-                        # Create rule URI based on the pattern: scanner/rule_id
-                        scanner_raw = rule_data.get("scanner")
-                        rule_uri = (
-                            f"{scanner_raw}/{rule_id}" if scanner_raw and provider_type == "bud_sentinel" else rule_id
-                        )
-
-                        # Convert scanner_type string to lowercase for PostgreSQL enum
-                        scanner_type_value = None
-                        if scanner_raw:
-                            scanner_type_lower = scanner_raw.lower()
-                            # Validate it's a known scanner type
-                            valid_scanner_types = {e.value for e in ScannerTypeEnum}
-                            if scanner_type_lower in valid_scanner_types:
-                                scanner_type_value = scanner_type_lower
-                            else:
-                                logger.warning("Unknown scanner_type: %s", scanner_raw)
-
-                        # Convert model_provider_type string to lowercase for PostgreSQL enum
-                        model_provider_type_raw = rule_data.get("model_provider_type")
-                        model_provider_type_value = None
-                        if model_provider_type_raw:
-                            model_provider_type_lower = model_provider_type_raw.lower()
-                            # Validate it's a known model provider type
-                            valid_provider_types = {e.value for e in ModelProviderTypeEnum}
-                            if model_provider_type_lower in valid_provider_types:
-                                model_provider_type_value = model_provider_type_lower
-                            else:
-                                logger.warning("Unknown model_provider_type: %s", model_provider_type_raw)
-
-                        # Create rule data
-                        rule_create_data = {
-                            "probe_id": db_probe_id,
-                            "name": rule_data["title"],
-                            "uri": rule_uri,
-                            "description": rule_data.get("description"),
-                            "icon": rule_data.get("icon"),  # Optional, will be None if not present
-                            "examples": rule_data.get("examples", []),
-                            "guard_types": rule_data.get("guard_types", []),
-                            "scanner_type": scanner_type_value,
-                            "modality_types": rule_data.get("modalities", []),
-                            "deprecation_date": rule_data.get("deprecation_date"),
-                            "model_id": rule_data.get("model_id"),
-                            "model_provider_type": model_provider_type_value,
-                            "is_gated": rule_data.get("is_gated"),
-                        }
-
-                        # Upsert rule
-                        with GuardrailRuleCRUD() as rule_crud:
-                            rule_crud.upsert(data=rule_create_data, conflict_target=["uri"])
-                            rule_upserts += 1
-                            provider_rule_upserts += 1
-
-                # Log summary for this provider
+            # Validate the whole file before writing anything
+            normalized = [normalize_provider_guardrails(entry) for entry in guardrails_data]
+
+            # A rule URI is unique across providers; the last provider declaring it owns the rule, so the
+            # earlier declarations are dropped instead of being rewritten and moved back on every seed
+            rule_owners = {
+                row["uri"]: index for index, (_, _, rule_entries) in enumerate(normalized) for _, row in rule_entries
+            }
+            for index, (provider_type, probe_rows, rule_entries) in enumerate(normalized):
+                owned_entries = [entry for entry in rule_entries if rule_owners[entry[1]["uri"]] == index]
+                if len(owned_entries) < len(rule_entries):
+                    logger.warning(
+                        "Skipping %d rules of provider %s redefined by a later provider",
+                        len(rule_entries) - len(owned_entries),
+                        provider_type,
+                    )
+                normalized[index] = (provider_type, probe_rows, owned_entries)
+
+            for provider_type, probe_rows, rule_entries in normalized:
+                logger.info("Processing %d probes for provider %s", len(probe_rows), provider_type)
+                report = self.sync_provider(provider_type, probe_rows, rule_entries)
+                if report is None:
+                    continue
+
+                self.sync_report.append(report)
                 logger.info(
-                    "Completed seeding guardrails for provider %s - Probes upserted: %d, Rules upserted: %d",
+                    "Guardrails sync for provider %s in %.2fs - probes: %d inserted, %d updated, %d unchanged; "
+                    "rules: %d inserted, %d updated, %d unchanged",
                     provider_type,
-                    provider_probe_upserts,
-                    provider_rule_upserts,
+                    report["duration_seconds"],
+                    report["probes"]["inserted"],
+                    report["probes"]["updated"],
+                    report["probes"]["unchanged"],
+                    report["rules"]["inserted"],
+                    report["rules"]["updated"],
+                    report["rules"]["unchanged"],
                 )
 
-            # Log overall summary
             logger.info(
-                "Guardrails seeding completed - Total probes upserted: %d, Total rules upserted: %d",
-                probe_upserts,
-                rule_upserts,
+                "Guardrails seeding completed for %d providers in %.2fs",
+                len(self.sync_report),
+                sum(report["duration_seconds"] for report in self.sync_report),
             )
 
         except FileNotFoundError as e:
@@ -67,6 +67,8 @@ class LicenseSeeder(BaseSeeder):
     - Model-specific license overrides
     """
 
+    input_paths = (LICENSES_PATH,)
+
     def convert_license_format(self, license_data: Dict[str, Any]) -> Dict[str, Any]:
         """Convert license data to our schema format.
 
@@ -23,6 +23,8 @@ logger = get_logger(__name__)
 class ModelArchitectureSeeder(BaseSeeder):
     """Handles seeding of model architecture data."""
 
+    input_paths = (str(Path(__file__).parent / "data" / "model_architectures.json"),)
+
     def __init__(self) -> None:
         """Initialize the seeder."""
         super().__init__()
@@ -21,6 +21,10 @@ logger = logging.get_logger(__name__)
 class ModelDetailsSeeder(BaseSeeder):
     """Seeder for model details data."""
 
+    # Details are attached to the models synced by the TensorZero seeder
+    depends_on = ("tensorzero",)
+    input_paths = (str(Path(__file__).parent / "data" / "model_details.json"),)
+
     def __init__(self) -> None:
         """Initialize the ModelDetailsSeeder."""
         super().__init__()
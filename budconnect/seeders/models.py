@@ -0,0 +1,41 @@
+#  -----------------------------------------------------------------------------
+#  Copyright (c) 2024 Bud Ecosystem Inc.
+#  #
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  #
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  #
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  -----------------------------------------------------------------------------
+
+"""SQLAlchemy model of the recorded startup seeder runs."""
+
+from datetime import datetime
+from typing import Optional
+
+from budmicroframe.shared.psql_service import PSQLBase
+from sqlalchemy import DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class SeederRun(PSQLBase):
+    """Last successful run of a startup seeder.
+
+    Attributes:
+        name: Name of the seeder (its key in budconnect.seeders.seeders).
+        fingerprint: SHA-256 of the seeder's input files, its module source and the fingerprints of its
+            dependencies, or NULL for seeders that fetch their data over the network.
+        completed_at: Time the run finished.
+    """
+
+    __tablename__ = "seeder_run"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    fingerprint: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    completed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -0,0 +1,256 @@
+#  -----------------------------------------------------------------------------
+#  Copyright (c) 2024 Bud Ecosystem Inc.
+#  #
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  #
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  #
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  -----------------------------------------------------------------------------
+
+"""Dependency-aware execution of the startup seeders.
+
+Seeders declare the seeders they depend on (``BaseSeeder.depends_on``) and run as a DAG: each one starts as
+soon as its dependencies completed, so independent seeders run concurrently. Every seeder runs with its own
+event loop on a worker thread, since most of them issue blocking database calls from ``async def seed``.
+
+A seeder is skipped when its fingerprint matches the one recorded by its last successful run in
+``seeder_run``. The fingerprint covers the seeder's module source, its data files and the fingerprints of its
+dependencies, so a change upstream re-runs the dependents too. ``SEEDERS_FORCE`` names seeders that run
+regardless of their fingerprint, ``SEEDERS_SKIP_UNCHANGED=false`` runs all of them. Seeders fetching data over
+the network have no fingerprint and always run; ``split_seeders`` moves them and their dependents to a second
+phase that the application runs in the background once it is ready.
+"""
+
+import asyncio
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Type
+
+from budmicroframe.commons import logging
+from graphlib import CycleError, TopologicalSorter
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..commons.config import app_settings
+from ..commons.constants import SeederRunStatusEnum
+from ..commons.hashing import compute_content_hash
+from .base import BaseSeeder
+from .crud import SeederRunCRUD
+
+
+logger = logging.get_logger(__name__)
+
+SeederRegistry = Mapping[str, Type[BaseSeeder]]
+
+# Outcomes that prevent the dependents of a seeder from running
+UNSATISFIED_STATUSES = (SeederRunStatusEnum.FAILED, SeederRunStatusEnum.BLOCKED)
+
+
+def resolve_seeder_order(seeders: SeederRegistry) -> List[str]:
+    """Return the seeder names in dependency order.
+
+    Args:
+        seeders: Seeder classes keyed by name.
+
+    Returns:
+        The names, every seeder after all of its dependencies.
+
+    Raises:
+        ValueError: If a seeder depends on an unknown seeder or the dependencies form a cycle.
+    """
+    for name, seeder in seeders.items():
+        unknown = set(seeder.depends_on) - set(seeders)
+        if unknown:
+            raise ValueError(f"Seeder {name} depends on unknown seeders: {', '.join(sorted(unknown))}")
+
+    try:
+        return list(TopologicalSorter({name: seeder.depends_on for name, seeder in seeders.items()}).static_order())
+    except CycleError as e:
+        raise ValueError(f"Seeder dependencies form a cycle: {' -> '.join(e.args[1])}") from e
+
+
+def split_seeders(seeders: SeederRegistry, defer_network: bool = True) -> Tuple[List[str], List[str]]:
+    """Split the seeders into the ones run before the application is ready and the deferred ones.
+
+    Args:
+        seeders: Seeder classes keyed by name.
+        defer_network: Whether network-backed seeders and their dependents are deferred. If False, every
+            seeder runs before the application is ready.
+
+    Returns:
+        The startup and the deferred seeder names, each in dependency order.
+    """
+    order = resolve_seeder_order(seeders)
+    if not defer_network:
+        return order, []
+
+    deferred: Set[str] = set()
+    for name in order:
+        seeder = seeders[name]
+        if seeder.requires_network or deferred.intersection(seeder.depends_on):
+            deferred.add(name)
+    return [name for name in order if name not in deferred], [name for name in order if name in deferred]
+
+
+def compute_fingerprints(seeders: SeederRegistry, order: List[str]) -> Dict[str, Optional[str]]:
+    """Compute the fingerprint of every seeder, including the fingerprints of its dependencies.
+
+    Args:
+        seeders: Seeder classes keyed by name.
+        order: The seeder names in dependency order.
+
+    Returns:
+        Fingerprint of each seeder, None for seeders that have no fingerprint or depend on one that has none.
+    """
+    fingerprints: Dict[str, Optional[str]] = {}
+    for name in order:
+        seeder = seeders[name]
+        own = seeder.fingerprint()
+        dependencies = {dependency: fingerprints[dependency] for dependency in seeder.depends_on}
+        if own is None or None in dependencies.values():
+            fingerprints[name] = None
+        else:
+            fingerprints[name] = compute_content_hash({"seeder": own, "depends_on": dependencies})
+    return fingerprints
+
+
+class SeederRunner:
+    """Run seeders in dependency order, concurrently where possible, skipping the unchanged ones.
+
+    One runner is used for both startup phases so the deferred seeders see the outcome of their startup
+    dependencies.
+
+    Attributes:
+        report: Status and wall time in seconds of every seeder run so far, keyed by name.
+    """
+
+    def __init__(
+        self, seeders: SeederRegistry, max_parallel: Optional[int] = None, skip_unchanged: Optional[bool] = None
+    ) -> None:
+        """Initialize the runner.
+
+        Args:
+            seeders: Seeder classes keyed by name.
+            max_parallel: Maximum number of seeders running at once, defaults to ``SEEDERS_MAX_PARALLEL``.
+            skip_unchanged: Whether to skip seeders with an unchanged fingerprint, defaults to
+                ``SEEDERS_SKIP_UNCHANGED``.
+
+        Raises:
+            ValueError: If the seeder dependencies are invalid.
+        """
+        self.seeders = seeders
+        self.order = resolve_seeder_order(seeders)
+        self.max_parallel = max(1, max_parallel or app_settings.seeders_max_parallel)
+        self.skip_unchanged = app_settings.seeders_skip_unchanged if skip_unchanged is None else skip_unchanged
+        self.force = {name.strip() for name in app_settings.seeders_force.split(",") if name.strip()}
+        unknown = self.force - set(seeders)
+        if unknown:
+            logger.warning("Ignoring unknown seeders in SEEDERS_FORCE: %s", ", ".join(sorted(unknown)))
+        self.report: Dict[str, Dict[str, Any]] = {}
+        self._fingerprints: Optional[Dict[str, Optional[str]]] = None
+
+    async def run(self, names: Iterable[str]) -> Dict[str, SeederRunStatusEnum]:
+        """Run the given seeders, each as soon as its dependencies completed.
+
+        Dependencies outside ``names`` are taken from earlier runs of this runner, a seeder is blocked if one
+        of its dependencies failed or was blocked.
+
+        Args:
+            names: Names of the seeders to run.
+
+        Returns:
+            The outcome of each seeder.
+        """
+        requested = set(names)
+        selected = [name for name in self.order if name in requested]
+        if not selected:
+            return {}
+
+        start_time = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=self.max_parallel, thread_name_prefix="budconnect-seeder")
+        try:
+            if self._fingerprints is None:
+                self._fingerprints = await loop.run_in_executor(
+                    executor, compute_fingerprints, self.seeders, self.order
+                )
+
+            tasks: Dict[str, "asyncio.Task[SeederRunStatusEnum]"] = {}
+            for name in selected:
+                tasks[name] = asyncio.create_task(self._run_seeder(name, tasks, executor))
+            statuses = dict(zip(tasks, await asyncio.gather(*tasks.values())))
+        finally:
+            # A cancelled run drops the seeders that have not started; running threads cannot be interrupted
+            # and finish their current seeder on their own
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        logger.info(
+            "Ran %d seeders in %.2fs: %s",
+            len(statuses),
+            time.perf_counter() - start_time,
+            ", ".join(f"{name}={status.value}" for name, status in statuses.items()),
+        )
+        return statuses
+
+    async def _run_seeder(
+        self, name: str, tasks: Dict[str, "asyncio.Task[SeederRunStatusEnum]"], executor: Executor
+    ) -> SeederRunStatusEnum:
+        """Wait for the dependencies of a seeder, then run it on the executor."""
+        for dependency in self.seeders[name].depends_on:
+            dependency_status: Optional[SeederRunStatusEnum]
+            if dependency in tasks:
+                dependency_status = await tasks[dependency]
+            else:
+                dependency_status = self.report.get(dependency, {}).get("status")
+            if dependency_status is not None and dependency_status in UNSATISFIED_STATUSES:
+                logger.warning(
+                    "Not running seeder %s, its dependency %s %s", name, dependency, dependency_status.value
+                )
+                return self._record(name, SeederRunStatusEnum.BLOCKED, 0.0)
+
+        start_time = time.perf_counter()
+        try:
+            status = await asyncio.get_running_loop().run_in_executor(executor, self._execute, name)
+        except Exception as e:
+            logger.error("Failed to seed %s. Error: %s", name, e)
+            status = SeederRunStatusEnum.FAILED
+        return self._record(name, status, time.perf_counter() - start_time)
+
+    def _execute(self, name: str) -> SeederRunStatusEnum:
+        """Run a seeder on the current worker thread unless its fingerprint is unchanged."""
+        fingerprint = self._fingerprints[name] if self._fingerprints else None
+        skip = fingerprint is not None and self.skip_unchanged and name not in self.force
+        if skip and self._stored_fingerprint(name) == fingerprint:
+            return SeederRunStatusEnum.SKIPPED
+
+        seeder = self.seeders[name]()
+        asyncio.run(seeder.seed())
+
+        try:
+            with SeederRunCRUD() as crud:
+                crud.record_run(name, fingerprint)
+        except SQLAlchemyError as e:
+            logger.warning("Failed to record the run of seeder %s: %s", name, e)
+        return SeederRunStatusEnum.COMPLETED
+
+    @staticmethod
+    def _stored_fingerprint(name: str) -> Optional[str]:
+        """Return the fingerprint of the last successful run of a seeder, None if it cannot be read."""
+        try:
+            with SeederRunCRUD() as crud:
+                return crud.get_fingerprint(name)
+        except SQLAlchemyError as e:
+            logger.warning("Failed to read the last run of seeder %s, running it: %s", name, e)
+            return None
+
+    def _record(self, name: str, status: SeederRunStatusEnum, duration: float) -> SeederRunStatusEnum:
+        """Store the outcome of a seeder in the report."""
+        self.report[name] = {"status": status, "duration_seconds": round(duration, 3)}
+        logger.info("Seeder %s %s in %.2fs", name, status.value, duration)
+        return status
@@ -18,17 +18,18 @@
 
 import json
 import os
-from typing import Any, Dict, List, Optional, Set
+import time
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from budmicroframe.commons import logging
-from sqlalchemy import delete
+from sqlalchemy.exc import SQLAlchemyError
 
+from ..commons.cache import catalog_generation
 from ..commons.constants import ModalityEnum, ModelEndpointEnum, ModelStatusEnum
 from ..commons.exceptions import SeederException
 from ..engine.crud import EngineCRUD
 from ..model.crud import LicenseCRUD, ModelInfoCRUD, ProviderCRUD
-from ..model.models import ModelInfo, engine_version_model_info
 from ..model.schemas import (
     CacheCost,
     Features,
@@ -53,6 +54,9 @@ TENSORZERO_DATA_DIR = os.path.join(SEEDER_DIR, "data", "tensorzero")
 TENSORZERO_PROVIDERS_PATH = os.path.join(TENSORZERO_DATA_DIR, "tensorzero_providers.json")
 LICENSES_PATH = os.path.join(SEEDER_DIR, "data", "licenses.json")
 
+# Number of catalog rows per multi-row statement during a sync
+MODEL_SYNC_BATCH_SIZE = 500
+
 
 def read_json_file(file_path: str) -> Dict[str, Any]:
     """Read and parse JSON data from a file.
@@ -284,11 +288,12 @@ class TensorZeroParser:
         else:
             search_context_cost_per_query = None
 
-        # Create a model info schema
-        return ModelInfoCreate(
+        # Create a model info schema. Modalities and endpoints are derived through sets, so they are sorted to
+        # keep the stored arrays, and therefore the content hash, stable across runs.
+        model_info = ModelInfoCreate(
             uri=model_data.uri,
-            modality=model_specs["modalities"],
-            endpoints=model_specs["endpoints"],
+            modality=sorted(model_specs["modalities"], key=lambda modality: modality.value),
+            endpoints=sorted(model_specs["endpoints"], key=lambda endpoint: endpoint.value),
             provider_id=provider_id,
             input_cost=InputCost(**categorized_data["input_cost"]) if categorized_data["input_cost"] else None,
             output_cost=OutputCost(**categorized_data["output_cost"]) if categorized_data["output_cost"] else None,
@@ -302,6 +307,8 @@ class TensorZeroParser:
             license_id=license_id,
             status=ModelStatusEnum.ACTIVE,
         )
+        model_info.content_hash = model_info.compute_content_hash()
+        return model_info
 
     @staticmethod
     async def derive_predefined_model_specs(model_data: LiteLLMModelInfo) -> Dict[str, Any]:
@@ -478,6 +485,10 @@ class TensorZeroSeeder(BaseSeeder):
     and preparing it for database insertion.
     """
 
+    # Models are fetched from the catalog SDK and reference the engine versions and licenses
+    depends_on = ("engine", "license")
+    requires_network = True
+
     # TODO: Remove after confirming SDK-based fetching is stable
     @staticmethod
     async def get_version_file_path(version: str) -> str:
@@ -549,105 +560,106 @@ class TensorZeroSeeder(BaseSeeder):
 
         return license_id_map
 
-    def get_existing_model_uris(self, engine_version_id: UUID) -> Dict[str, UUID]:
-        """Get all existing model URIs associated with an engine version.
-
-        Args:
-            engine_version_id: The ID of the engine version
-
-        Returns:
-            Dict mapping model URIs to their database IDs
-        """
-        uri_to_id_map: Dict[str, UUID] = {}
-
-        with ModelInfoCRUD() as model_info_crud:
-            session = model_info_crud.get_session()
-            try:
-                # Query models associated with this engine version
-                results = (
-                    session.query(ModelInfo.uri, ModelInfo.id)
-                    .join(
-                        engine_version_model_info,
-                        ModelInfo.id == engine_version_model_info.c.model_info_id,
-                    )
-                    .filter(engine_version_model_info.c.engine_version_id == engine_version_id)
-                    .all()
-                )
-                for uri, model_id in results:
-                    uri_to_id_map[uri] = model_id
-                logger.debug("Found %d existing models for engine version %s", len(uri_to_id_map), engine_version_id)
-            except Exception as e:
-                logger.warning("Failed to get existing model URIs: %s", e)
-
-        return uri_to_id_map
+    def __init__(self) -> None:
+        """Initialize the seeder with an empty sync report."""
+        self.sync_report: List[Dict[str, Any]] = []
 
-    def deactivate_stale_models(self, engine_version_id: UUID, stale_model_ids: List[UUID]) -> int:
-        """Deactivate models that are no longer in the new model list.
+    async def sync_version(
+        self,
+        engine_version_id: UUID,
+        tensorzero_parser: TensorZeroParser,
+        model_data: Dict[str, List[LiteLLMModelInfo]],
+        predefined_providers: Dict[str, Any],
+        license_id_map: Dict[str, UUID],
+    ) -> Dict[str, Any]:
+        """Merge the parsed catalog of one engine version into the database in a single transaction.
 
-        This method removes the association between models and the engine version,
-        and marks the model as inactive if it has no other engine version associations.
+        Providers are upserted with one multi-row statement, models are merged in batches of
+        ``MODEL_SYNC_BATCH_SIZE`` and models that disappeared from the catalog are unlinked and deactivated
+        set-wise. Either the whole catalog is applied or nothing is.
 
         Args:
-            engine_version_id: The ID of the engine version
-            stale_model_ids: List of model IDs to deactivate
+            engine_version_id: The TensorZero engine version being synced.
+            tensorzero_parser: Parser used to build model info rows.
+            model_data: Parsed catalog models grouped by provider.
+            predefined_providers: Provider definitions keyed by provider type.
+            license_id_map: Mapping of license keys to license IDs.
 
         Returns:
-            Number of models deactivated
+            Row counts of the merge and the wall time in seconds.
         """
-        if not stale_model_ids:
-            return 0
-
-        deactivated_count = 0
+        start_time = time.perf_counter()
+
+        # NOTE: Adding default huggingface and guardrail providers
+        provider_types = ["huggingface", "bud_sentinel", "openai", "azure_content_safety", *model_data.keys()]
+        provider_rows = [
+            ProviderCreate(
+                name=predefined_providers[provider_type]["name"],
+                provider_type=provider_type,
+                icon=predefined_providers[provider_type]["icon"],
+                description=predefined_providers[provider_type]["description"],
+                credentials=predefined_providers[provider_type]["credentials"],
+                capabilities=predefined_providers[provider_type]["capabilities"],
+            ).model_dump()
+            for provider_type in provider_types
+        ]
 
         with ModelInfoCRUD() as model_info_crud:
             session = model_info_crud.get_session()
             try:
-                # First, remove the association from engine_version_model_info
-                delete_assoc_stmt = delete(engine_version_model_info).where(
-                    engine_version_model_info.c.engine_version_id == engine_version_id,
-                    engine_version_model_info.c.model_info_id.in_(stale_model_ids),
+                provider_ids = ProviderCRUD().bulk_upsert_with_engine_version(
+                    provider_rows, engine_version_id, session=session
                 )
-                session.execute(delete_assoc_stmt)
-
-                # Then, mark models with no remaining associations as inactive
-                for model_id in stale_model_ids:
-                    other_assoc = (
-                        session.query(engine_version_model_info)
-                        .filter(engine_version_model_info.c.model_info_id == model_id)
-                        .first()
-                    )
-                    if not other_assoc:
-                        session.query(ModelInfo).filter(ModelInfo.id == model_id).update(
-                            {"status": ModelStatusEnum.INACTIVE}
+
+                model_rows = []
+                for provider, supported_models in model_data.items():
+                    for model in supported_models:
+                        # Get license ID from model data directly, or fall back to mapping
+                        license_key = model.config.get("license_id")
+                        if not license_key:
+                            license_key = get_license_key_for_model(model.uri, provider)
+                        license_id = license_id_map.get(license_key) if license_key else None
+
+                        model_info_data = await tensorzero_parser.create_model_info(
+                            model, provider_ids[provider], provider, license_id
                         )
-                        deactivated_count += 1
+                        model_rows.append(model_info_data.model_dump())
 
-                session.commit()
-                logger.info(
-                    "Deactivated %d stale models, removed %d associations",
-                    deactivated_count,
-                    len(stale_model_ids),
+                counts = model_info_crud.bulk_sync_engine_version(
+                    model_rows, engine_version_id, session=session, batch_size=MODEL_SYNC_BATCH_SIZE
                 )
-            except Exception as e:
+                session.commit()
+            except SQLAlchemyError as e:
+                session.rollback()
+                logger.exception("Failed to sync TensorZero catalog for engine version %s: %s", engine_version_id, e)
+                raise SeederException("Failed to sync TensorZero catalog") from e
+            except Exception:
                 session.rollback()
-                logger.error("Failed to deactivate stale models: %s", e)
                 raise
+            finally:
+                model_info_crud.cleanup_session(session)
 
-        return deactivated_count
+        return {
+            "providers": len(provider_ids),
+            "models": len(model_rows),
+            **counts,
+            "duration_seconds": round(time.perf_counter() - start_time, 3),
+        }
 
     async def seed(self) -> None:
         """Seed the database with TensorZero model data.
 
         This method:
-        1. Seeds license records
+        1. Loads the license mapping
         2. Loads the engine configuration
         3. Identifies TensorZero engine versions
-        4. Processes each version's model data
-        5. Prepares data for database insertion
+        4. Parses each version's model data
+        5. Merges each version's catalog in a single transaction, recording counts in ``sync_report``
 
         Raises:
             SeederException: If there is an error during the seeding process
         """
+        self.sync_report = []
         try:
             # Get license ID mapping from database (assumes LicenseSeeder has already run)
             license_id_map = await self.get_license_id_map()
@@ -675,13 +687,6 @@ class TensorZeroSeeder(BaseSeeder):
 
                 logger.debug("Processing TensorZero version: %s", version)
 
-                # Get existing model URIs for this engine version (for cleanup later)
-                existing_models = self.get_existing_model_uris(version_config.id)
-                logger.debug("Found %d existing models for version %s", len(existing_models), version)
-
-                # Track all new URIs being processed
-                processed_uris: Set[str] = set()
-
                 # TODO: (Remove it after testing) Old file-based path validation (replaced by catalog SDK):
                 data_file_path = await self.get_version_file_path(version)
                 if not os.path.exists(data_file_path):
@@ -695,81 +700,22 @@ class TensorZeroSeeder(BaseSeeder):
                 predefined_providers = read_json_file(TENSORZERO_PROVIDERS_PATH)
                 logger.debug("Predefined providers: %s", len(predefined_providers))
 
-                # NOTE: Adding default huggingface and guardrail providers
-                for provider_type in [
-                    "huggingface",
-                    "bud_sentinel",
-                    "openai",
-                    "azure_content_safety",
-                ]:
-                    provider_data = ProviderCreate(
-                        name=predefined_providers[provider_type]["name"],
-                        provider_type=provider_type,
-                        icon=predefined_providers[provider_type]["icon"],
-                        description=predefined_providers[provider_type]["description"],
-                        credentials=predefined_providers[provider_type]["credentials"],
-                        capabilities=predefined_providers[provider_type]["capabilities"],
-                    )
-
-                    # Upsert provider
-                    with ProviderCRUD() as provider_crud:
-                        db_provider_id = provider_crud.upsert(
-                            data=provider_data.model_dump(), conflict_target=["provider_type"]
-                        )
-                        logger.debug("Upserted provider: %s", db_provider_id)
-                        provider_crud.add_engine_version(db_provider_id, version_config.id)
-
-                # Prepare data for database insertion
-                for provider, supported_models in model_data.items():
-                    provider_data = ProviderCreate(
-                        name=predefined_providers[provider]["name"],
-                        provider_type=provider,
-                        icon=predefined_providers[provider]["icon"],
-                        description=predefined_providers[provider]["description"],
-                        credentials=predefined_providers[provider]["credentials"],
-                        capabilities=predefined_providers[provider]["capabilities"],
-                    )
-
-                    # Upsert provider
-                    with ProviderCRUD() as provider_crud:
-                        db_provider_id = provider_crud.upsert(
-                            data=provider_data.model_dump(), conflict_target=["provider_type"]
-                        )
-                        logger.debug("Upserted provider: %s", db_provider_id)
-                        provider_crud.add_engine_version(db_provider_id, version_config.id)
-
-                    # Parse model info
-                    for model in supported_models:
-                        # Get license ID from model data directly, or fall back to mapping
-                        license_key = model.config.get("license_id")
-                        if not license_key:
-                            license_key = get_license_key_for_model(model.uri, provider)
-                        license_id = license_id_map.get(license_key) if license_key else None
-
-                        model_info_data = await tensorzero_parser.create_model_info(
-                            model, db_provider_id, provider, license_id
-                        )
-
-                        # Track the URI being processed
-                        processed_uris.add(model_info_data.uri)
-
-                        # Upsert model info
-                        with ModelInfoCRUD() as model_info_crud:
-                            db_model_info_id = model_info_crud.upsert(
-                                data=model_info_data.model_dump(),
-                                conflict_target=["uri"],
-                            )
-                            logger.debug("Upserted model info: %s", db_model_info_id)
-                            model_info_crud.add_engine_version(db_model_info_id, version_config.id)
-
-                # After processing all models, deactivate stale models
-                stale_uris = set(existing_models.keys()) - processed_uris
-                if stale_uris:
-                    stale_model_ids = [existing_models[uri] for uri in stale_uris]
-                    logger.info("Found %d stale models to deactivate for version %s", len(stale_model_ids), version)
-                    self.deactivate_stale_models(version_config.id, stale_model_ids)
-                else:
-                    logger.debug("No stale models to deactivate for version %s", version)
+                report = await self.sync_version(
+                    version_config.id, tensorzero_parser, model_data, predefined_providers, license_id_map
+                )
+                report["version"] = version
+                self.sync_report.append(report)
+                logger.info(
+                    "TensorZero sync for version %s: %d inserted, %d updated, %d unchanged, %d deactivated "
+                    "(%d unlinked) in %.2fs",
+                    version,
+                    report["inserted"],
+                    report["updated"],
+                    report["unchanged"],
+                    report["deactivated"],
+                    report["unlinked"],
+                    report["duration_seconds"],
+                )
 
         except FileNotFoundError as e:
             logger.exception("File not found during TensorZero seeding: %s", e)
@@ -783,6 +729,9 @@ class TensorZeroSeeder(BaseSeeder):
         except Exception as e:
             logger.exception("Unexpected error during TensorZero seeding: %s", e)
             raise SeederException("Unexpected error during TensorZero seeding") from e
+        finally:
+            # Even a partial run may have written catalog rows
+            catalog_generation.bump("tensorzero seeder")
 
 
 if __name__ == "__main__":
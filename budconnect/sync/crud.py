@@ -0,0 +1,117 @@
+#  -----------------------------------------------------------------------------
+#  Copyright (c) 2024 Bud Ecosystem Inc.
+#  #
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  #
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  #
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  -----------------------------------------------------------------------------
+
+"""CRUD operations for the catalog change log."""
+
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from budmicroframe.commons import logging
+from budmicroframe.shared.psql_service import CRUDMixin
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.orm import Session
+
+from .models import CatalogChange
+
+
+logger = logging.get_logger(__name__)
+
+
+# xmin of the reader's snapshot: every transaction with a lower ID has either committed or aborted, so
+# changes below it are settled and can never be preceded by a later commit.
+_SETTLED_TXID_BOUND = func.txid_snapshot_xmin(func.txid_current_snapshot())
+
+
+class CatalogChangeCRUD(CRUDMixin[CatalogChange, None, None]):
+    """Read access to the catalog change log. Rows are written by database triggers."""
+
+    __model__ = CatalogChange
+
+    def __init__(self) -> None:
+        """Initialize the CatalogChangeCRUD class."""
+        super().__init__(self.__model__)
+
+    def get_changes(
+        self,
+        after: Optional[Tuple[int, int]],
+        limit: int,
+        entity_types: Optional[List[str]] = None,
+        session: Optional[Session] = None,
+    ) -> List[CatalogChange]:
+        """Fetch the next page of settled changes in (txid, id) order.
+
+        Args:
+            after: The (txid, id) position to continue after, or None to start at the beginning of the log.
+            limit: Maximum number of changes to return.
+            entity_types: Optional entity types to restrict the page to.
+            session: Optional database session.
+
+        Returns:
+            The changes, oldest first.
+        """
+        _session = session or self.get_session()
+        try:
+            stmt = select(CatalogChange).where(CatalogChange.txid < _SETTLED_TXID_BOUND)
+            if after is not None:
+                stmt = stmt.where(tuple_(CatalogChange.txid, CatalogChange.id) > tuple_(*after))
+            if entity_types:
+                stmt = stmt.where(CatalogChange.entity_type.in_(entity_types))
+            stmt = stmt.order_by(CatalogChange.txid, CatalogChange.id).limit(limit)
+            return list(_session.scalars(stmt).all())
+        finally:
+            self.cleanup_session(_session if session is None else None)
+
+    def get_head(self, session: Optional[Session] = None) -> Optional[Tuple[int, int]]:
+        """Return the (txid, id) position of the newest settled change, or None if the log is empty."""
+        _session = session or self.get_session()
+        try:
+            row = _session.execute(
+                select(CatalogChange.txid, CatalogChange.id)
+                .where(CatalogChange.txid < _SETTLED_TXID_BOUND)
+                .order_by(CatalogChange.txid.desc(), CatalogChange.id.desc())
+                .limit(1)
+            ).first()
+            return (row.txid, row.id) if row else None
+        finally:
+            self.cleanup_session(_session if session is None else None)
+
+    def get_version(self, session: Optional[Session] = None) -> Optional[Tuple[int, int, datetime]]:
+        """Return a cheap validator of the whole catalog.
+
+        The validator is the newest change ID, the newest settled change ID and the time of the newest
+        change. It changes whenever a catalog row visible to the reader changes, including changes of
+        older transactions that commit after a newer one. Both IDs are read from indexes.
+
+        Returns:
+            (latest change ID, latest settled change ID, latest change time), or None if the log is empty.
+        """
+        _session = session or self.get_session()
+        try:
+            settled_id = (
+                select(CatalogChange.id)
+                .where(CatalogChange.txid < _SETTLED_TXID_BOUND)
+                .order_by(CatalogChange.txid.desc(), CatalogChange.id.desc())
+                .limit(1)
+                .scalar_subquery()
+            )
+            row = _session.execute(
+                select(CatalogChange.id, settled_id, CatalogChange.changed_at)
+                .order_by(CatalogChange.id.desc())
+                .limit(1)
+            ).first()
+            return (row[0], row[1] or 0, row[2]) if row else None
+        finally:
+            self.cleanup_session(_session if session is None else None)
@@ -0,0 +1,58 @@
+#  -----------------------------------------------------------------------------
+#  Copyright (c) 2024 Bud Ecosystem Inc.
+#  #
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  #
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  #
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  -----------------------------------------------------------------------------
+
+"""SQLAlchemy model of the catalog change log."""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from budmicroframe.shared.psql_service import PSQLBase
+from sqlalchemy import BigInteger, DateTime, Index, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class CatalogChange(PSQLBase):
+    """One recorded insert, update or delete of a catalog row.
+
+    Rows are written by the ``record_catalog_change`` trigger installed on every catalog table, so
+    every write path (CRUD, services, seeders and bulk statements) is captured in the same transaction
+    as the change itself. Changes are read in (txid, id) order and only once their transaction ID is
+    below the xmin of the reader's snapshot, which guarantees a cursor never skips a change committed
+    later by an older transaction.
+
+    Attributes:
+        id: Sequence number of the change.
+        txid: ID of the transaction that made the change.
+        entity_type: Name of the changed table (see ``CatalogEntityTypeEnum``).
+        entity_id: Primary key of the changed row.
+        operation: insert, update or delete (see ``CatalogChangeOperationEnum``).
+        payload: The row after the change, or NULL for a delete.
+        changed_at: Time the change was recorded.
+    """
+
+    __tablename__ = "catalog_change"
+    __table_args__ = (Index("ix_catalog_change_txid_id", "txid", "id"),)
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    txid: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    entity_type: Mapped[str] = mapped_column(String, nullable=False)
+    entity_id: Mapped[UUID] = mapped_column(PG_UUID, nullable=False)
+    operation: Mapped[str] = mapped_column(String, nullable=False)
+    payload: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, nullable=True)
+    changed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
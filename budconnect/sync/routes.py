@@ -0,0 +1,71 @@
+#  -----------------------------------------------------------------------------
+#  Copyright (c) 2024 Bud Ecosystem Inc.
+#  #
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  #
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  #
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  -----------------------------------------------------------------------------
+
+"""API routes for incremental catalog sync."""
+
+from typing import List, Optional, Union
+
+from budmicroframe.commons import logging
+from budmicroframe.commons.exceptions import ClientException
+from budmicroframe.commons.schemas import ErrorResponse
+from fastapi import APIRouter, Query, status
+from typing_extensions import Annotated
+
+from ..commons.constants import CatalogEntityTypeEnum
+from ..commons.executor import run_sync
+from .schemas import CatalogChangesResponse, CatalogCursorResponse
+from .services import SyncService
+
+
+logger = logging.get_logger(__name__)
+
+sync_router = APIRouter(prefix="/sync", tags=["Sync"])
+
+
+@sync_router.get("/changes", response_model=CatalogChangesResponse)
+async def get_catalog_changes(
+    since: Annotated[
+        Optional[str], Query(description="Cursor from the previous call; omit to read from the start")
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=5000, description="Maximum number of log entries per page")] = 500,
+    entity_type: Annotated[
+        Optional[List[CatalogEntityTypeEnum]], Query(description="Restrict to these entity types")
+    ] = None,
+) -> Union[CatalogChangesResponse, ErrorResponse]:
+    """Get the catalog inserts, updates and tombstones recorded after a cursor.
+
+    Runtimes call this repeatedly, passing back ``next_cursor``, until ``has_more`` is false.
+    """
+    try:
+        entity_types = [item.value for item in entity_type] if entity_type else None
+        response = await run_sync(SyncService.get_changes, since, limit, entity_types)
+    except ClientException as e:
+        response = ErrorResponse(message=e.message, code=e.status_code)
+    except Exception as e:
+        logger.exception(f"Error fetching catalog changes: {e}")
+        response = ErrorResponse(message="Error fetching catalog changes", code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return response.to_http_response()
+
+
+@sync_router.get("/cursor", response_model=CatalogCursorResponse)
+async def get_catalog_cursor() -> Union[CatalogCursorResponse, ErrorResponse]:
+    """Get the cursor of the newest catalog change, to anchor a full bootstrap before delta syncs."""
+    try:
+        response = await run_sync(SyncService.get_head_cursor)
+    except Exception as e:
+        logger.exception(f"Error fetching catalog cursor: {e}")
+        response = ErrorResponse(message="Error fetching catalog cursor", code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return response.to_http_response()
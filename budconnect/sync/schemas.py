@@ -0,0 +1,55 @@
+#  -----------------------------------------------------------------------------
+#  Copyright (c) 2024 Bud Ecosystem Inc.
+#  #
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  #
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  #
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  -----------------------------------------------------------------------------
+
+"""Pydantic schemas for the catalog delta sync API."""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from budmicroframe.commons.schemas import SuccessResponse
+from pydantic import UUID4, BaseModel
+
+from ..commons.constants import CatalogChangeOperationEnum, CatalogEntityTypeEnum
+
+
+class CatalogChangeEntry(BaseModel):
+    """A single change of a catalog row."""
+
+    cursor: str
+    entity_type: CatalogEntityTypeEnum
+    entity_id: UUID4
+    operation: CatalogChangeOperationEnum
+    data: Optional[Dict[str, Any]] = None
+    changed_at: datetime
+
+
+class CatalogChangesResponse(SuccessResponse):
+    """A page of catalog changes.
+
+    Clients apply the changes in order, treating insert and update as an upsert and delete as a
+    tombstone, then pass ``next_cursor`` as ``since`` on the next call. ``has_more`` tells
+    whether another page is immediately available.
+    """
+
+    changes: List[CatalogChangeEntry]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+
+class CatalogCursorResponse(SuccessResponse):
+    """The current head of the catalog change log."""
+
+    cursor: Optional[str] = None
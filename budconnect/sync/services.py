@@ -0,0 +1,141 @@
+#  -----------------------------------------------------------------------------
+#  Copyright (c) 2024 Bud Ecosystem Inc.
+#  #
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  #
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  #
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  -----------------------------------------------------------------------------
+
+"""Service layer for the catalog delta sync API."""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+from budmicroframe.commons import logging
+from budmicroframe.commons.exceptions import ClientException
+
+from ..commons.conditional import make_etag
+from .crud import CatalogChangeCRUD
+from .models import CatalogChange
+from .schemas import CatalogChangeEntry, CatalogChangesResponse, CatalogCursorResponse
+
+
+logger = logging.get_logger(__name__)
+
+
+def encode_cursor(txid: int, change_id: int) -> str:
+    """Encode a change log position as an opaque cursor string."""
+    return f"{txid}-{change_id}"
+
+
+def decode_cursor(cursor: str) -> Tuple[int, int]:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        ClientException: If the cursor is malformed.
+    """
+    try:
+        txid, change_id = (int(part) for part in cursor.split("-"))
+    except ValueError as e:
+        raise ClientException(message=f"Invalid sync cursor '{cursor}'", status_code=400) from e
+    return txid, change_id
+
+
+class SyncService:
+    """Serves the catalog change log to runtimes syncing the catalog incrementally."""
+
+    @staticmethod
+    def get_changes(
+        since: Optional[str], limit: int, entity_types: Optional[List[str]] = None
+    ) -> CatalogChangesResponse:
+        """Return the changes recorded after a cursor.
+
+        Within a page only the last change of each entity is returned, so an entity updated many times
+        between two syncs is sent once. Applying the page in order yields the same state as applying
+        every individual change.
+
+        Args:
+            since: Cursor returned by a previous call, or None to read the log from the beginning.
+            limit: Maximum number of log entries to scan for this page.
+            entity_types: Optional entity types to restrict the changes to.
+
+        Returns:
+            The page of changes and the cursor to continue from.
+        """
+        after = decode_cursor(since) if since else None
+        with CatalogChangeCRUD() as crud:
+            rows = crud.get_changes(after, limit + 1, entity_types)
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        latest: Dict[Tuple[str, str], CatalogChange] = {}
+        for row in rows:
+            key = (row.entity_type, str(row.entity_id))
+            latest.pop(key, None)
+            latest[key] = row
+
+        changes = [
+            CatalogChangeEntry(
+                cursor=encode_cursor(cast(int, row.txid), cast(int, row.id)),
+                entity_type=row.entity_type,
+                entity_id=row.entity_id,
+                operation=row.operation,
+                data=row.payload,
+                changed_at=row.changed_at,
+            )
+            for row in latest.values()
+        ]
+        next_cursor = encode_cursor(rows[-1].txid, rows[-1].id) if rows else since
+
+        return CatalogChangesResponse(
+            code=200,
+            object="catalog.changes",
+            message=f"Found {len(changes)} changes",
+            changes=changes,
+            next_cursor=next_cursor,
+            has_more=has_more,
+        )
+
+    @staticmethod
+    def get_head_cursor() -> CatalogCursorResponse:
+        """Return the cursor of the newest settled change.
+
+        A runtime bootstrapping from the full listing endpoints should read this cursor first and then
+        page through ``get_changes`` from it, so nothing written during the bootstrap is missed.
+        """
+        with CatalogChangeCRUD() as crud:
+            head = crud.get_head()
+
+        return CatalogCursorResponse(
+            code=200,
+            object="catalog.cursor",
+            message="Current catalog cursor",
+            cursor=encode_cursor(*head) if head else None,
+        )
+
+    @staticmethod
+    def get_catalog_validator(*scope: Any) -> Tuple[str, Optional[datetime]]:
+        """Build an ETag and Last-Modified value that change with any catalog write.
+
+        Args:
+            scope: Values identifying the representation (endpoint name, query parameters), mixed into the ETag.
+
+        Returns:
+            The strong ETag and the time of the latest catalog change, if any.
+        """
+        with CatalogChangeCRUD() as crud:
+            version = crud.get_version()
+
+        if version is None:
+            return make_etag("catalog", None, *scope), None
+        latest_id, settled_id, changed_at = version
+        return make_etag("catalog", latest_id, settled_id, *scope), changed_at
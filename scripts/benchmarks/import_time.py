@@ -0,0 +1,106 @@
+"""Measure the import time and resident memory of BudConnect modules in fresh interpreters.
+
+Each module in ``--modules`` is imported ``--runs`` times in a new ``python -X importtime`` process. The
+script reports the median cumulative import time of the module, the peak RSS of the interpreter after the
+import, the slowest imports of the last run and which of the heavy eval dependencies (``datasets``,
+``opencompass``, ``torch``, ``tiktoken`` ...) were loaded.
+
+``budconnect.eval.routes`` should stay free of the heavy modules: manifest reads only need stdlib/json, and
+sampling, tokenization and analysis are imported by ``/eval/build`` or its worker processes on demand.
+``tests/test_startup_imports.py`` enforces the same budget in CI.
+
+Usage:
+    python scripts/benchmarks/import_time.py --modules budconnect.main budconnect.eval.routes --runs 5 --top 15
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+HEAVY_MODULES = ("datasets", "opencompass", "torch", "mmengine", "tiktoken", "pandas")
+
+# Imports the module in the child interpreter and reports what it loaded and its peak RSS. A plain import
+# statement is used because -X importtime does not report the module itself for importlib.import_module.
+PROBE = """
+import json, resource, sys
+import {module}
+heavy = sorted({{name.split('.')[0] for name in sys.modules}} & set({heavy!r}))
+print(json.dumps({{"heavy": heavy, "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}}))
+"""
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """Parse ``-X importtime`` output into ``(module, self_us, cumulative_us)`` tuples."""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        entries.append((name.strip(), int(self_us), int(cumulative_us)))
+    return entries
+
+
+def measure(module: str) -> Dict[str, Any]:
+    """Import a module in a fresh interpreter and return its import timings, heavy modules and peak RSS."""
+    python_path = os.pathsep.join(filter(None, [str(PROJECT_ROOT), os.environ.get("PYTHONPATH")]))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "PYTHONPATH": python_path},
+        check=True,
+    )
+    entries = parse_importtime(completed.stderr)
+    cumulative_us = next((cumulative for name, _, cumulative in entries if name == module), 0)
+    return {"cumulative_ms": cumulative_us / 1000, "entries": entries, **json.loads(completed.stdout.splitlines()[-1])}
+
+
+def main() -> None:
+    """Parse arguments and report every module."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modules", nargs="+", default=["budconnect.main", "budconnect.eval.routes"])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to list per module")
+    parser.add_argument("--output", help="Optional path to write the JSON results to")
+    args = parser.parse_args()
+
+    results = []
+    for module in args.modules:
+        runs = [measure(module) for _ in range(args.runs)]
+        last = runs[-1]
+        others = [entry for entry in last["entries"] if entry[0] != module]
+        slowest = sorted(others, key=lambda entry: entry[2], reverse=True)[: args.top]
+        result = {
+            "module": module,
+            "median_ms": round(statistics.median(run["cumulative_ms"] for run in runs), 1),
+            "max_rss_mb": round(max(run["max_rss_kb"] for run in runs) / 1024, 1),
+            "heavy_modules": last["heavy"],
+            "slowest": [
+                {"module": name, "cumulative_ms": round(cumulative / 1000, 1)} for name, _, cumulative in slowest
+            ],
+        }
+        results.append(result)
+
+        print(
+            f"{module}: median={result['median_ms']}ms rss={result['max_rss_mb']}MB "
+            f"heavy={','.join(result['heavy_modules']) or '-'}"
+        )
+        for entry in result["slowest"]:
+            print(f"    {entry['cumulative_ms']:>9.1f}ms  {entry['module']}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Measure request latency percentiles of a running BudConnect instance under concurrent load.
+
+Each concurrency level spawns N clients that issue requests back to back against the given
+endpoints, and reports p50/p95/p99 latency and throughput per level. Run it once with
+``OFFLOAD_SYNC_SERVICES=false`` and once with ``OFFLOAD_SYNC_SERVICES=true`` on the server to
+compare the inline and thread-pool modes.
+
+Usage:
+    python scripts/benchmarks/load_latency.py --base-url http://localhost:9088 \
+        --endpoint "/model/get-compatible-models?engine=tensorzero" \
+        --endpoint "/engine/get-latest-engine-version?device_architecture=cuda&engine=vllm" \
+        --levels 50 200 1000 --requests-per-client 20 --label offload
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any, Dict, List
+
+import httpx
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Return the nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+async def run_client(
+    client: httpx.AsyncClient,
+    endpoints: List[str],
+    requests_per_client: int,
+    latencies: List[float],
+    errors: List[int],
+) -> None:
+    """Issue requests sequentially, cycling over the endpoints."""
+    for i in range(requests_per_client):
+        endpoint = endpoints[i % len(endpoints)]
+        start = time.perf_counter()
+        try:
+            response = await client.get(endpoint)
+            if response.status_code >= 500:
+                errors.append(response.status_code)
+        except httpx.HTTPError:
+            errors.append(0)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+
+async def run_level(base_url: str, endpoints: List[str], clients: int, requests_per_client: int) -> Dict[str, Any]:
+    """Run one concurrency level and summarise the results."""
+    latencies: List[float] = []
+    errors: List[int] = []
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(run_client(client, endpoints, requests_per_client, latencies, errors) for _ in range(clients))
+        )
+        elapsed = time.perf_counter() - start
+
+    return {
+        "clients": clients,
+        "requests": len(latencies),
+        "errors": len(errors),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(statistics.fmean(latencies), 2) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+    }
+
+
+async def main() -> None:
+    """Parse arguments and run every requested concurrency level."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:9088")
+    parser.add_argument("--endpoint", action="append", dest="endpoints", help="Endpoint path, may be repeated")
+    parser.add_argument("--levels", nargs="+", type=int, default=[50, 200, 1000])
+    parser.add_argument("--requests-per-client", type=int, default=20)
+    parser.add_argument("--label", default="run", help="Label included in the output, e.g. inline/offload")
+    parser.add_argument("--output", help="Optional path to write the JSON results to")
+    args = parser.parse_args()
+
+    endpoints = args.endpoints or ["/model/get-compatible-models?engine=tensorzero"]
+    results = []
+    for clients in args.levels:
+        result = await run_level(args.base_url, endpoints, clients, args.requests_per_client)
+        result["label"] = args.label
+        results.append(result)
+        print(
+            f"[{args.label}] clients={result['clients']:>5} requests={result['requests']:>6} "
+            f"errors={result['errors']:>4} rps={result['throughput_rps']:>8} "
+            f"p50={result['p50_ms']:>8}ms p95={result['p95_ms']:>8}ms p99={result['p99_ms']:>8}ms"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
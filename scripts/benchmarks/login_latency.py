@@ -0,0 +1,180 @@
+"""Measure login latency and catalog read latency of a running BudConnect instance while both run together.
+
+Every phase keeps ``--read-clients`` clients issuing catalog reads back to back for ``--duration`` seconds.
+The first phase runs the reads alone as a baseline; each following phase adds the given number of login
+clients posting to ``/auth/login`` in a loop. For each phase the script reports p50/p95/p99 latency of the
+reads and of the logins, and how many logins were rejected with 429.
+
+With bcrypt verified on the event loop, catalog reads stall behind every login burst. With the
+password hashing pool they should stay close to the baseline, and logins beyond
+``PASSWORD_HASH_MAX_PENDING`` are shed with 429 instead of queueing. Compare runs with different
+``PASSWORD_HASH_ROUNDS`` / ``PASSWORD_HASH_MAX_WORKERS`` settings on the server.
+
+Usage:
+    python scripts/benchmarks/login_latency.py --base-url http://localhost:9088 \
+        --username admin --password secret \
+        --read-endpoint "/model/get-compatible-models?engine=tensorzero" \
+        --read-clients 50 --login-levels 5 20 100 --duration 20 --label rounds12
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Return the nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def summarise(latencies: List[float]) -> Dict[str, Any]:
+    """Summarise a list of latencies in milliseconds."""
+    return {
+        "requests": len(latencies),
+        "mean_ms": round(statistics.fmean(latencies), 2) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+    }
+
+
+async def read_client(
+    client: httpx.AsyncClient, endpoints: List[str], deadline: float, latencies: List[float], errors: List[int]
+) -> None:
+    """Issue catalog reads back to back until the deadline, cycling over the endpoints."""
+    i = 0
+    while time.perf_counter() < deadline:
+        endpoint = endpoints[i % len(endpoints)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            response = await client.get(endpoint)
+            if response.status_code >= 500:
+                errors.append(response.status_code)
+        except httpx.HTTPError:
+            errors.append(0)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+
+async def login_client(
+    client: httpx.AsyncClient,
+    credentials: Dict[str, str],
+    deadline: float,
+    latencies: List[float],
+    rejected: List[int],
+    errors: List[int],
+) -> None:
+    """Log in repeatedly until the deadline; 429 responses are counted separately and retried after a pause."""
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            response = await client.post("/auth/login", json=credentials)
+        except httpx.HTTPError:
+            errors.append(0)
+            continue
+        if response.status_code == 429:
+            rejected.append(429)
+            await asyncio.sleep(float(response.headers.get("retry-after", "1")))
+            continue
+        if response.status_code != 200:
+            errors.append(response.status_code)
+            continue
+        latencies.append((time.perf_counter() - start) * 1000)
+
+
+async def run_phase(
+    base_url: str,
+    read_endpoints: List[str],
+    read_clients: int,
+    login_clients: int,
+    credentials: Dict[str, str],
+    duration: float,
+) -> Dict[str, Any]:
+    """Run the read load together with ``login_clients`` login loops and summarise both."""
+    read_latencies: List[float] = []
+    login_latencies: List[float] = []
+    rejected: List[int] = []
+    read_errors: List[int] = []
+    login_errors: List[int] = []
+
+    clients = read_clients + login_clients
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(
+            *(read_client(client, read_endpoints, deadline, read_latencies, read_errors) for _ in range(read_clients)),
+            *(
+                login_client(client, credentials, deadline, login_latencies, rejected, login_errors)
+                for _ in range(login_clients)
+            ),
+        )
+
+    return {
+        "login_clients": login_clients,
+        "reads": summarise(read_latencies),
+        "read_errors": len(read_errors),
+        "logins": summarise(login_latencies),
+        "logins_per_second": round(len(login_latencies) / duration, 2),
+        "login_rejected_429": len(rejected),
+        "login_errors": len(login_errors),
+    }
+
+
+def print_phase(label: str, result: Dict[str, Any]) -> None:
+    """Print one phase on a single line."""
+    reads, logins = result["reads"], result["logins"]
+    print(
+        f"[{label}] logins={result['login_clients']:>4} | reads n={reads['requests']:>6} "
+        f"p50={reads['p50_ms']:>8}ms p99={reads['p99_ms']:>8}ms err={result['read_errors']:>3} | "
+        f"logins n={logins['requests']:>5} rps={result['logins_per_second']:>7} p50={logins['p50_ms']:>8}ms "
+        f"p99={logins['p99_ms']:>8}ms 429={result['login_rejected_429']:>5} err={result['login_errors']:>3}"
+    )
+
+
+async def main() -> None:
+    """Parse arguments, run the baseline and every login level."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:9088")
+    parser.add_argument("--username", required=True, help="Username of an existing active user")
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--read-endpoint", action="append", dest="read_endpoints", help="May be repeated")
+    parser.add_argument("--read-clients", type=int, default=50)
+    parser.add_argument("--login-levels", nargs="+", type=int, default=[5, 20, 100])
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds per phase")
+    parser.add_argument("--label", default="run", help="Label included in the output, e.g. the server settings")
+    parser.add_argument("--output", help="Optional path to write the JSON results to")
+    args = parser.parse_args()
+
+    read_endpoints = args.read_endpoints or ["/model/get-compatible-models?engine=tensorzero"]
+    credentials = {"username": args.username, "password": args.password}
+
+    results: List[Dict[str, Any]] = []
+    baseline: Optional[Dict[str, Any]] = None
+    for login_clients in [0, *args.login_levels]:
+        result = await run_phase(
+            args.base_url, read_endpoints, args.read_clients, login_clients, credentials, args.duration
+        )
+        result["label"] = args.label
+        if baseline is None:
+            baseline = result
+        elif baseline["reads"]["p99_ms"]:
+            result["read_p99_vs_baseline"] = round(result["reads"]["p99_ms"] / baseline["reads"]["p99_ms"], 2)
+        results.append(result)
+        print_phase(args.label, result)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,107 @@
+"""Compiled parser rule matching and the per-engine matcher registry."""
+
+from uuid import UUID, uuid4
+
+import pytest
+
+from budconnect.commons.cache import catalog_generation
+from budconnect.engine import parser_matcher
+from budconnect.engine.parser_matcher import CompiledParserRule, ParserRuleMatcher, ParserRuleMatcherRegistry
+from budconnect.engine.schemas import ParserMatchType, ParserRuleType
+
+
+ENGINE_ID = uuid4()
+
+
+def make_rule(pattern: str, priority: int, parser_type: str, match_type: ParserMatchType = ParserMatchType.REGEX):
+    """Build a tool parser rule of the test engine."""
+    return CompiledParserRule(
+        id=UUID(int=priority),
+        engine_id=ENGINE_ID,
+        rule_type=ParserRuleType.TOOL,
+        match_type=match_type,
+        pattern=pattern,
+        priority=priority,
+        parser_type=parser_type,
+        chat_template=None,
+        notes=None,
+    )
+
+
+def matched_parser(matcher: ParserRuleMatcher, model_identifier: str):
+    rule = matcher.match(model_identifier)[ParserRuleType.TOOL]
+    return rule.parser_type if rule else None
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [r"(\w+)-\1", r"(?P<family>\w+)-(?P=family)"],
+    ids=["numbered", "named"],
+)
+def test_backreference_rules_match_alongside_combined_rules(pattern: str) -> None:
+    matcher = ParserRuleMatcher(
+        [
+            make_rule(r"(mistral)-large", 10, "mistral"),
+            make_rule(pattern, 20, "repeated"),
+            make_rule(r"(\w+)-.*", 30, "catch_all"),
+        ]
+    )
+
+    assert matched_parser(matcher, "mistral-large") == "mistral"
+    assert matched_parser(matcher, "qwen-qwen") == "repeated"
+    assert matched_parser(matcher, "qwen-coder") == "catch_all"
+    assert matched_parser(matcher, "llama") is None
+
+
+def test_backreference_rule_loses_to_higher_priority_combined_rule() -> None:
+    matcher = ParserRuleMatcher(
+        [
+            make_rule(r"(\w+)-\1", 20, "repeated"),
+            make_rule(r"qwen-.*", 10, "qwen"),
+        ]
+    )
+
+    assert matched_parser(matcher, "qwen-qwen") == "qwen"
+    assert matched_parser(matcher, "llama-llama") == "repeated"
+
+
+def test_escaped_backslash_is_not_a_backreference() -> None:
+    matcher = ParserRuleMatcher([make_rule(r"a\\1", 10, "literal")])
+
+    assert matched_parser(matcher, "a\\1") == "literal"
+
+
+def test_registry_drops_matchers_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [1000.0]
+    monkeypatch.setattr(parser_matcher.time, "monotonic", lambda: now[0])
+    registry = ParserRuleMatcherRegistry(ttl=60)
+
+    _, generation = registry.get_many([ENGINE_ID])
+    matcher = registry.build(ENGINE_ID, [make_rule(r"qwen.*", 10, "qwen")], generation)
+    assert registry.get_many([ENGINE_ID])[0] == {ENGINE_ID: matcher}
+
+    now[0] += 59
+    assert registry.get_many([ENGINE_ID])[0] == {ENGINE_ID: matcher}
+
+    now[0] += 1
+    assert registry.get_many([ENGINE_ID])[0] == {}
+
+
+def test_registry_drops_matchers_on_catalog_write() -> None:
+    registry = ParserRuleMatcherRegistry(ttl=60)
+    _, generation = registry.get_many([ENGINE_ID])
+    registry.build(ENGINE_ID, [make_rule(r"qwen.*", 10, "qwen")], generation)
+
+    catalog_generation.bump()
+
+    matchers, new_generation = registry.get_many([ENGINE_ID])
+    assert matchers == {}
+    assert new_generation != generation
+
+
+def test_registry_without_ttl_does_not_cache() -> None:
+    registry = ParserRuleMatcherRegistry(ttl=0)
+    _, generation = registry.get_many([ENGINE_ID])
+    registry.build(ENGINE_ID, [make_rule(r"qwen.*", 10, "qwen")], generation)
+
+    assert registry.get_many([ENGINE_ID])[0] == {}
@@ -0,0 +1,67 @@
+"""Startup import budget of the eval API.
+
+Serving ``/eval/manifest`` and ``/eval/versions`` must not load the dataset sampling stack (``datasets``,
+``opencompass`` and through them ``torch``) or ``tiktoken``; those are imported by ``/eval/build`` and its
+worker processes on demand. ``scripts/benchmarks/import_time.py`` reports the same measurements in detail.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+HEAVY_MODULES = ("datasets", "opencompass", "torch", "mmengine", "tiktoken", "pandas")
+
+EAGER_EVAL_MODULES = (
+    "budconnect.eval.manifest_builder",
+    "budconnect.eval.dataset_sampler",
+    "budconnect.eval.dataset_analyzer",
+)
+
+# Cumulative import time allowed for budconnect.eval.routes, overridable for slow CI runners
+EVAL_IMPORT_BUDGET_MS = float(os.getenv("EVAL_IMPORT_BUDGET_MS", "2000"))
+
+PROBE = """
+import json, sys
+import budconnect.eval.routes
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+@pytest.fixture(scope="module")
+def eval_routes_import() -> subprocess.CompletedProcess:
+    """Import the eval routes in a fresh interpreter with ``-X importtime``."""
+    python_path = os.pathsep.join(filter(None, [str(PROJECT_ROOT), os.environ.get("PYTHONPATH")]))
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "PYTHONPATH": python_path},
+        check=True,
+    )
+
+
+def test_eval_routes_do_not_load_heavy_modules(eval_routes_import: subprocess.CompletedProcess) -> None:
+    """The eval routes import neither the build stack nor its third-party dependencies."""
+    loaded = set(json.loads(eval_routes_import.stdout.splitlines()[-1]))
+
+    assert {name.split(".")[0] for name in loaded} & set(HEAVY_MODULES) == set()
+    assert loaded & set(EAGER_EVAL_MODULES) == set()
+
+
+def test_eval_routes_import_within_budget(eval_routes_import: subprocess.CompletedProcess) -> None:
+    """Importing the eval routes stays within the startup budget."""
+    cumulative_us = None
+    for line in eval_routes_import.stderr.splitlines():
+        if line.startswith("import time:") and line.rsplit("|", 1)[-1].strip() == "budconnect.eval.routes":
+            cumulative_us = int(line.split("|")[1])
+
+    assert cumulative_us is not None
+    assert cumulative_us / 1000 <= EVAL_IMPORT_BUDGET_MS